@@ -1,13 +1,19 @@
 import os
 import json
 from datetime import datetime, timedelta
-from dateutil.relativedelta import relativedelta
+from concurrent.futures import ThreadPoolExecutor
 from flask import (
     Blueprint, render_template, request, redirect, url_for, 
-    flash, session, jsonify, current_app
+    flash, session, jsonify, current_app, g
 )
-from models import db, Application, User, Document, Admin, EMI
+from sqlalchemy import select, func, case, delete, tuple_
+from sqlalchemy.orm import joinedload, selectinload, load_only
+from models import db, Application, Document, Admin, EMI
+from extensions import cache
+from json_fields import load_json_field
+from request_cache import get_application_or_404
 from services import decision_service, notification_service
+from services.fast_emi import emi_scalar, monthly_due_dates
 from functools import wraps
 
 # Create admin blueprint
@@ -31,87 +37,290 @@ def calculate_emi(principal, annual_rate, tenure_months):
         if monthly_rate == 0:  # Handle zero interest rate
             return principal / tenure_months
         
-        emi = principal * monthly_rate * (1 + monthly_rate) ** tenure_months / ((1 + monthly_rate) ** tenure_months - 1)
+        emi = emi_scalar(float(principal), float(monthly_rate), int(tenure_months))
         return round(emi, 2)
     except Exception as e:
         current_app.logger.error(f"Error calculating EMI: {e}")
         return 0
 
-# Safe JSON loading function
-def safe_json_loads(json_string, default=None):
-    if default is None:
-        default = {}
-    try:
-        if json_string and json_string.strip():
-            return json.loads(json_string)
-        else:
-            return default
-    except (json.JSONDecodeError, TypeError, AttributeError):
-        return default
+def replace_emi_records(application_id, emi_amount, tenure_months):
+    """Replace the EMI schedule of an application with a single bulk INSERT"""
+    db.session.execute(delete(EMI).where(EMI.application_id == application_id))
+    
+    due_dates = monthly_due_dates(datetime.utcnow().date(), tenure_months)
+    rows = [
+        {
+            'application_id': application_id,
+            'emi_number': i,
+            'due_date': due_date,
+            'amount_due': emi_amount,
+            'status': 'DUE'
+        }
+        for i, due_date in enumerate(due_dates, start=1)
+    ]
+    db.session.bulk_insert_mappings(EMI, rows)
+
+# Upper bound on the size of application.admin_review_notes
+ADMIN_NOTES_MAX_CHARS = 32 * 1024
+
+def append_note(application, note):
+    """Add a note to admin_review_notes newest-first, dropping the oldest notes past ADMIN_NOTES_MAX_CHARS"""
+    current_notes = application.admin_review_notes
+    notes = f"{note}\n{current_notes}" if current_notes else note
+    if len(notes) > ADMIN_NOTES_MAX_CHARS:
+        # Cut at a line boundary so no note is left half-written
+        notes = notes[:ADMIN_NOTES_MAX_CHARS].rsplit('\n', 1)[0]
+    application.admin_review_notes = notes
+
+# EMI generation and decision notifications run off the request thread.
+# A single worker keeps tasks for the same application in submission order.
+background_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='admin-bg')
+
+def generate_emis_and_notify(flask_app, application_id, message, generate_emis=False):
+    """Background task: (re)build the EMI schedule if still approved, then notify the user"""
+    with flask_app.app_context():
+        try:
+            application = db.session.get(Application, application_id)
+            if not application:
+                return
+            
+            # Build EMIs from the committed loan terms, unless the decision changed since
+            if (generate_emis and application.status == 'APPROVED'
+                    and application.emi_amount and application.loan_term_years):
+                replace_emi_records(application.id, application.emi_amount, application.loan_term_years * 12)
+                db.session.commit()
+            
+            notification_service.send_decision_notification(application, message)
+        except Exception as e:
+            db.session.rollback()
+            flask_app.logger.error(f"Background EMI/notification task failed for {application_id}: {str(e)}")
+
+def submit_emis_and_notify(application_id, message, generate_emis=False):
+    """Queue generate_emis_and_notify for an already committed application"""
+    return background_executor.submit(
+        generate_emis_and_notify, current_app._get_current_object(),
+        application_id, message, generate_emis
+    )
+
+# Template variable name -> Application JSON column for the admin report views
+REPORT_FIELDS = {
+    'banking_report': 'banking_analysis_report',
+    'fraud_report': 'fraud_detection_report',
+    'credit_report': 'ai_analysis_report',
+    'employment_report': 'employment_verification_report',
+    'document_report': 'document_verification_report',
+    'na_report': 'na_document_verification',
+    'verification_summary': 'verification_summary',
+}
+
+def load_reports(application):
+    """Parse every report column of an application into template keyword arguments"""
+    return {name: load_json_field(application, field) for name, field in REPORT_FIELDS.items()}
+
+# Columns shown in admin application listings; skips the large JSON report columns
+APPLICATION_LIST_COLUMNS = (
+    Application.id, Application.user_id, Application.first_name, Application.last_name,
+    Application.email, Application.company_name, Application.loan_amount, Application.status,
+    Application.overall_risk_score, Application.created_at
+)
+
+def month_bucket(column):
+    """SQL expression grouping a datetime column by calendar month ('YYYY-MM')"""
+    if db.engine.dialect.name == 'postgresql':
+        return func.to_char(func.date_trunc('month', column), 'YYYY-MM')
+    return func.strftime('%Y-%m', column)
+
+def get_monthly_trends(months=6):
+    """Get total/approved application counts for the last N calendar months in one query"""
+    current_month = datetime.now().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    start_year, start_month = divmod(current_month.year * 12 + current_month.month - months, 12)
+    window_start = current_month.replace(year=start_year, month=start_month + 1)
+    
+    bucket = month_bucket(Application.created_at).label('month')
+    rows = db.session.execute(
+        select(
+            bucket,
+            func.count(Application.id).label('total'),
+            func.sum(case((Application.status == 'APPROVED', 1), else_=0)).label('approved')
+        ).where(
+            Application.created_at >= window_start
+        ).group_by(bucket)
+    ).all()
+    by_month = {row.month: row for row in rows}
+    
+    trends = []
+    for month_start in [window_start] + monthly_due_dates(window_start, months - 1):
+        row = by_month.get(month_start.strftime('%Y-%m'))
+        trends.append({
+            'month': month_start.strftime('%b %Y'),
+            'total': row.total if row else 0,
+            'approved': (row.approved or 0) if row else 0
+        })
+    return trends
+
+def get_stats_version():
+    """Cheap change marker for application data: (latest update, row count)"""
+    latest_update, total = db.session.execute(
+        select(func.max(Application.updated_at), func.count(Application.id))
+    ).one()
+    return (latest_update.isoformat() if latest_update else None, total)
+
+@cache.memoize(timeout=300)
+def compute_dashboard_stats(version_key):
+    """Build the admin dashboard aggregates for a given data version"""
+    # Get application statistics in a single aggregate scan
+    counts = db.session.execute(select(
+        func.count(Application.id).label('total'),
+        func.sum(case((Application.status == 'APPROVED', 1), else_=0)).label('approved'),
+        func.sum(case((Application.status == 'REJECTED', 1), else_=0)).label('rejected'),
+        func.sum(case((Application.status == 'PENDING', 1), else_=0)).label('pending'),
+        func.sum(case(((Application.status == 'APPROVED') & (Application.overall_risk_score <= 25), 1), else_=0)).label('auto_approved'),
+        func.sum(case((Application.overall_risk_score <= 25, 1), else_=0)).label('low_risk'),
+        func.sum(case(((Application.overall_risk_score > 25) & (Application.overall_risk_score <= 50), 1), else_=0)).label('medium_risk'),
+        func.sum(case(((Application.overall_risk_score > 50) & (Application.overall_risk_score <= 75), 1), else_=0)).label('high_risk'),
+        func.sum(case((Application.overall_risk_score > 75, 1), else_=0)).label('very_high_risk')
+    )).one()
+    
+    total_applications = counts.total or 0
+    approved_count = counts.approved or 0
+    rejected_count = counts.rejected or 0
+    pending_count = counts.pending or 0
+    
+    # AI-specific statistics
+    high_risk_count = counts.very_high_risk or 0
+    auto_approved = counts.auto_approved or 0
+    
+    # Get risk distribution for visualization
+    risk_distribution = {
+        'low_risk': counts.low_risk or 0,
+        'medium_risk': counts.medium_risk or 0,
+        'high_risk': counts.high_risk or 0,
+        'very_high_risk': counts.very_high_risk or 0
+    }
+    
+    # Get monthly application trends
+    monthly_trends = [
+        {'month': trend['month'], 'count': trend['total']}
+        for trend in get_monthly_trends()
+    ]
+    
+    stats = {
+        'total_applications': total_applications,
+        'approved_count': approved_count,
+        'rejected_count': rejected_count,
+        'pending_count': pending_count,
+        'approval_rate': (approved_count / total_applications * 100) if total_applications > 0 else 0,
+        'high_risk_count': high_risk_count,
+        'auto_approved': auto_approved,
+        'risk_distribution': risk_distribution,
+        'monthly_trends': monthly_trends
+    }
+    
+    return stats
+
+@cache.memoize(timeout=300)
+def compute_report_stats(version_key):
+    """Build the admin report aggregates for a given data version"""
+    # Overall statistics and risk analysis in a single aggregate scan
+    counts = db.session.execute(select(
+        func.count(Application.id).label('total'),
+        func.sum(case((Application.status == 'APPROVED', 1), else_=0)).label('approved'),
+        func.sum(case((Application.status == 'REJECTED', 1), else_=0)).label('rejected'),
+        func.sum(case((Application.status == 'PENDING', 1), else_=0)).label('pending'),
+        func.sum(case((Application.overall_risk_score <= 25, 1), else_=0)).label('low_risk'),
+        func.sum(case(((Application.overall_risk_score > 25) & (Application.overall_risk_score <= 50), 1), else_=0)).label('medium_risk'),
+        func.sum(case(((Application.overall_risk_score > 50) & (Application.overall_risk_score <= 75), 1), else_=0)).label('high_risk'),
+        func.sum(case((Application.overall_risk_score > 75, 1), else_=0)).label('very_high_risk'),
+        func.sum(case((Application.document_verification_status == 'VERIFIED', 1), else_=0)).label('documents_verified'),
+        func.sum(case((Application.document_verification_status == 'PENDING', 1), else_=0)).label('documents_pending'),
+        func.sum(case((Application.document_verification_status == 'REVIEW_NEEDED', 1), else_=0)).label('documents_review'),
+        func.sum(Application.loan_amount).label('total_loan_amount'),
+        func.avg(Application.loan_amount).label('avg_loan_amount')
+    )).one()
+    
+    total_applications = counts.total or 0
+    approved_applications = counts.approved or 0
+    rejected_applications = counts.rejected or 0
+    pending_applications = counts.pending or 0
+    
+    # Risk analysis
+    low_risk_count = counts.low_risk or 0
+    medium_risk_count = counts.medium_risk or 0
+    high_risk_count = counts.high_risk or 0
+    very_high_risk_count = counts.very_high_risk or 0
+    
+    # Monthly trends
+    monthly_data = [
+        {
+            'month': trend['month'],
+            'total': trend['total'],
+            'approved': trend['approved'],
+            'approval_rate': (trend['approved'] / trend['total'] * 100) if trend['total'] > 0 else 0
+        }
+        for trend in get_monthly_trends()
+    ]
+    
+    # Loan amount statistics
+    total_loan_amount = counts.total_loan_amount or 0
+    avg_loan_amount = counts.avg_loan_amount or 0
+    
+    # Document verification status
+    documents_verified = counts.documents_verified or 0
+    documents_pending = counts.documents_pending or 0
+    documents_review = counts.documents_review or 0
+    
+    reports_data = {
+        'total_applications': total_applications,
+        'approved_applications': approved_applications,
+        'rejected_applications': rejected_applications,
+        'pending_applications': pending_applications,
+        'approval_rate': (approved_applications / total_applications * 100) if total_applications > 0 else 0,
+        'risk_distribution': {
+            'low_risk': low_risk_count,
+            'medium_risk': medium_risk_count,
+            'high_risk': high_risk_count,
+            'very_high_risk': very_high_risk_count
+        },
+        'monthly_trends': monthly_data,
+        'loan_statistics': {
+            'total_loan_amount': total_loan_amount,
+            'avg_loan_amount': avg_loan_amount
+        },
+        'document_verification': {
+            'verified': documents_verified,
+            'pending': documents_pending,
+            'review_needed': documents_review
+        }
+    }
+    
+    return reports_data
 
 # ===== ALL ADMIN TEMPLATE ROUTES =====
 
+def dashboard_cache_key(*args, **kwargs):
+    """Rendered dashboard cache key: request path plus the current data version"""
+    # Kept on g so a cache miss reuses it instead of running the aggregate again
+    g.stats_version = get_stats_version()
+    return f"admin_dashboard:{request.full_path}:{g.stats_version}"
+
+def dashboard_render_ok(response):
+    """Only cache dashboards that rendered without an error"""
+    return not g.get('dashboard_failed', False)
+
 @admin_bp.route('/dashboard')
 @admin_required
+@cache.cached(timeout=30, make_cache_key=dashboard_cache_key,
+              unless=lambda: request.method != 'GET', response_filter=dashboard_render_ok)
 def dashboard():
     """Admin dashboard showing application statistics with AI insights"""
     try:
-        # Get application statistics
-        total_applications = Application.query.count()
-        approved_count = Application.query.filter_by(status='APPROVED').count()
-        rejected_count = Application.query.filter_by(status='REJECTED').count()
-        pending_count = Application.query.filter_by(status='PENDING').count()
-        
-        # AI-specific statistics
-        high_risk_count = Application.query.filter(Application.overall_risk_score > 75).count()
-        auto_approved = Application.query.filter(
-            Application.status == 'APPROVED', 
-            Application.overall_risk_score <= 25
-        ).count()
-        
-        # Get risk distribution for visualization
-        risk_distribution = {
-            'low_risk': Application.query.filter(Application.overall_risk_score <= 25).count(),
-            'medium_risk': Application.query.filter(
-                (Application.overall_risk_score > 25) & 
-                (Application.overall_risk_score <= 50)
-            ).count(),
-            'high_risk': Application.query.filter(
-                (Application.overall_risk_score > 50) & 
-                (Application.overall_risk_score <= 75)
-            ).count(),
-            'very_high_risk': Application.query.filter(Application.overall_risk_score > 75).count()
-        }
-        
-        # Get monthly application trends
-        monthly_trends = []
-        for i in range(6):
-            month_start = datetime.now().replace(day=1) - timedelta(days=30*i)
-            month_end = month_start + timedelta(days=30)
-            month_count = Application.query.filter(
-                Application.created_at >= month_start,
-                Application.created_at < month_end
-            ).count()
-            monthly_trends.append({
-                'month': month_start.strftime('%b %Y'),
-                'count': month_count
-            })
-        monthly_trends.reverse()
-        
-        stats = {
-            'total_applications': total_applications,
-            'approved_count': approved_count,
-            'rejected_count': rejected_count,
-            'pending_count': pending_count,
-            'approval_rate': (approved_count / total_applications * 100) if total_applications > 0 else 0,
-            'high_risk_count': high_risk_count,
-            'auto_approved': auto_approved,
-            'risk_distribution': risk_distribution,
-            'monthly_trends': monthly_trends
-        }
+        # Aggregates are memoized until the application data changes
+        stats = compute_dashboard_stats(g.get('stats_version') or get_stats_version())
         
         # Get recent applications (last 20)
-        recent_apps = Application.query.order_by(Application.created_at.desc()).limit(20).all()
+        recent_apps = Application.query.options(
+            load_only(*APPLICATION_LIST_COLUMNS)
+        ).order_by(Application.created_at.desc()).limit(20).all()
         
         return render_template('admin/dashboard.html', 
                              stats=stats, 
@@ -119,6 +328,7 @@ def dashboard():
     
     except Exception as e:
         current_app.logger.error(f"Error loading admin dashboard: {str(e)}")
+        g.dashboard_failed = True
         flash('Error loading dashboard.', 'error')
         return render_template('admin/dashboard.html', stats={}, applications=[])
 
@@ -128,30 +338,53 @@ def applications():
     """View all applications with filtering options"""
     try:
         status_filter = request.args.get('status', 'all')
-        page = request.args.get('page', 1, type=int)
         per_page = 20
         
         # Build query based on filters
-        if status_filter == 'all':
-            applications_query = Application.query
-        else:
-            applications_query = Application.query.filter_by(status=status_filter.upper())
-        
-        # Paginate results
-        applications_paginated = applications_query.order_by(
-            Application.created_at.desc()
-        ).paginate(page=page, per_page=per_page, error_out=False)
+        applications_query = Application.query.options(load_only(*APPLICATION_LIST_COLUMNS))
+        if status_filter != 'all':
+            applications_query = applications_query.filter_by(status=status_filter.upper())
+        
+        # Keyset pagination: continue after the last (created_at, id) of the previous page
+        after_created = request.args.get('after_created')
+        after_id = request.args.get('after_id')
+        if after_created and after_id:
+            try:
+                after_created_at = datetime.fromisoformat(after_created)
+                applications_query = applications_query.filter(
+                    tuple_(Application.created_at, Application.id) < (after_created_at, after_id)
+                )
+            except ValueError:
+                pass
+        
+        # Fetch one extra row to know whether another page exists
+        page_items = applications_query.order_by(
+            Application.created_at.desc(), Application.id.desc()
+        ).limit(per_page + 1).all()
+        
+        next_cursor = None
+        if len(page_items) > per_page:
+            page_items = page_items[:per_page]
+            last_item = page_items[-1]
+            next_cursor = {
+                'after_created': last_item.created_at.isoformat(),
+                'after_id': last_item.id
+            }
         
-        # Get counts for each status
+        # Get counts for each status; the "all" tab is their sum
+        per_status = dict(db.session.execute(
+            select(Application.status, func.count(Application.id)).group_by(Application.status)
+        ).all())
         status_counts = {
-            'all': Application.query.count(),
-            'pending': Application.query.filter_by(status='PENDING').count(),
-            'approved': Application.query.filter_by(status='APPROVED').count(),
-            'rejected': Application.query.filter_by(status='REJECTED').count()
+            'all': sum(per_status.values()),
+            'pending': per_status.get('PENDING', 0),
+            'approved': per_status.get('APPROVED', 0),
+            'rejected': per_status.get('REJECTED', 0)
         }
         
         return render_template('admin/applications.html',
-                             applications=applications_paginated,
+                             applications=page_items,
+                             next_cursor=next_cursor,
                              status_counts=status_counts,
                              current_status=status_filter)
     
@@ -160,6 +393,7 @@ def applications():
         flash('Error loading applications.', 'error')
         return render_template('admin/applications.html', 
                              applications=[], 
+                             next_cursor=None,
                              status_counts={}, 
                              current_status='all')
 
@@ -168,68 +402,23 @@ def applications():
 def application_detail(app_id):
     """View detailed application information"""
     try:
-        application = Application.query.filter_by(id=app_id).first_or_404()
-        user = User.query.get(application.user_id)
+        application = Application.query.options(
+            joinedload(Application.documents),
+            joinedload(Application.user)
+        ).filter_by(id=app_id).first_or_404()
+        user = application.user
         
         # Load all reports
-        banking_report = safe_json_loads(application.banking_analysis_report)
-        fraud_report = safe_json_loads(application.fraud_detection_report)
-        credit_report = safe_json_loads(application.ai_analysis_report)
-        employment_report = safe_json_loads(application.employment_verification_report)
-        document_report = safe_json_loads(application.document_verification_report)
-        na_report = safe_json_loads(application.na_document_verification)
-        verification_summary = safe_json_loads(application.verification_summary)
+        reports = load_reports(application)
         
         # Get documents
         documents = application.documents
         
-        # Calculate amortization schedule if approved
-        amortization_schedule = []
-        if application.status == 'APPROVED' and application.interest_rate:
-            try:
-                tenure_months = application.loan_term_years * 12
-                emi = application.emi_amount or calculate_emi(application.loan_amount, application.interest_rate, tenure_months)
-                amortization_schedule = []
-                balance = application.loan_amount
-                monthly_rate = application.interest_rate / 12 / 100
-                start_date = datetime.now()
-                
-                for month in range(1, tenure_months + 1):
-                    interest = balance * monthly_rate
-                    principal_component = emi - interest
-                    
-                    if month == tenure_months:
-                        principal_component = balance
-                        emi_adjusted = principal_component + interest
-                        balance = 0
-                    else:
-                        emi_adjusted = emi
-                        balance -= principal_component
-                    
-                    amortization_schedule.append({
-                        'month': month,
-                        'date': (start_date + relativedelta(months=month)).strftime('%d-%b-%Y'),
-                        'emi': round(emi_adjusted, 2),
-                        'principal': round(principal_component, 2),
-                        'interest': round(interest, 2),
-                        'balance': max(round(balance, 2), 0)
-                    })
-            except Exception as e:
-                current_app.logger.error(f"Error generating amortization schedule: {e}")
-                amortization_schedule = []
-        
         return render_template('admin/application_detail.html',
                              application=application,
                              user=user,
-                             banking_report=banking_report,
-                             fraud_report=fraud_report,
-                             credit_report=credit_report,
-                             employment_report=employment_report,
-                             document_report=document_report,
-                             na_report=na_report,
-                             verification_summary=verification_summary,
-                             documents=documents,
-                             amortization_schedule=amortization_schedule)
+                             **reports,
+                             documents=documents)
     
     except Exception as e:
         current_app.logger.error(f"Error loading application detail {app_id}: {str(e)}")
@@ -241,7 +430,7 @@ def application_detail(app_id):
 def review_application(app_id):
     """Admin review and decision making for applications"""
     try:
-        application = Application.query.filter_by(id=app_id).first_or_404()
+        application = get_application_or_404(app_id)
         
         if request.method == 'POST':
             new_status = request.form.get('status')
@@ -253,6 +442,7 @@ def review_application(app_id):
             application.status = new_status
             application.admin_review_notes = admin_notes
             
+            generate_emis = False
             if new_status == 'APPROVED' and interest_rate and loan_term_years:
                 application.interest_rate = float(interest_rate)
                 application.loan_term_years = int(loan_term_years)
@@ -261,52 +451,29 @@ def review_application(app_id):
                     application.interest_rate, 
                     application.loan_term_years * 12
                 )
-                
-                # Create EMI records
-                EMI.query.filter_by(application_id=application.id).delete()
-                for i in range(1, application.loan_term_years * 12 + 1):
-                    due_date = datetime.utcnow().date() + relativedelta(months=i)
-                    new_emi_record = EMI(
-                        application_id=application.id,
-                        emi_number=i,
-                        due_date=due_date,
-                        amount_due=application.emi_amount,
-                        status='DUE'
-                    )
-                    db.session.add(new_emi_record)
+                generate_emis = True
             
             application.reviewed_by_admin_id = session['admin_id']
             application.reviewed_at = datetime.utcnow()
             
             db.session.commit()
             
-            # Send notification to user
-            notification_service.send_decision_notification(
-                application, 
-                f"Application reviewed by admin. Status: {new_status}. Notes: {admin_notes}"
+            # Create EMI records and notify the user in the background
+            submit_emis_and_notify(
+                application.id,
+                f"Application reviewed by admin. Status: {new_status}. Notes: {admin_notes}",
+                generate_emis
             )
             
             flash(f'Application #{application.id} status updated to {new_status}', 'success')
             return redirect(url_for('admin.dashboard'))
         
         # GET request - load all reports for the review
-        banking_report = safe_json_loads(application.banking_analysis_report)
-        fraud_report = safe_json_loads(application.fraud_detection_report)
-        credit_report = safe_json_loads(application.ai_analysis_report)
-        employment_report = safe_json_loads(application.employment_verification_report)
-        document_report = safe_json_loads(application.document_verification_report)
-        na_report = safe_json_loads(application.na_document_verification)
-        verification_summary = safe_json_loads(application.verification_summary)
+        reports = load_reports(application)
         
         return render_template('admin/application_review.html',
                              application=application,
-                             banking_report=banking_report,
-                             fraud_report=fraud_report,
-                             credit_report=credit_report,
-                             employment_report=employment_report,
-                             document_report=document_report,
-                             na_report=na_report,
-                             verification_summary=verification_summary)
+                             **reports)
     
     except Exception as e:
         db.session.rollback()
@@ -319,7 +486,7 @@ def review_application(app_id):
 def approve_application(app_id):
     """Manually approve an application"""
     try:
-        application = Application.query.filter_by(id=app_id).first_or_404()
+        application = get_application_or_404(app_id)
         
         # Get approval parameters from form
         interest_rate = float(request.form.get('interest_rate', 8.5))
@@ -338,25 +505,13 @@ def approve_application(app_id):
         application.reviewed_by_admin_id = session['admin_id']
         application.reviewed_at = datetime.utcnow()
         
-        # Create EMI records
-        EMI.query.filter_by(application_id=application.id).delete()
-        for i in range(1, loan_term_years * 12 + 1):
-            due_date = datetime.utcnow().date() + relativedelta(months=i)
-            new_emi_record = EMI(
-                application_id=application.id,
-                emi_number=i,
-                due_date=due_date,
-                amount_due=emi_amount,
-                status='DUE'
-            )
-            db.session.add(new_emi_record)
-        
         db.session.commit()
         
-        # Send notification
-        notification_service.send_decision_notification(
-            application, 
-            f"Application approved by admin. Interest Rate: {interest_rate}%, EMI: ₹{emi_amount:,.2f}"
+        # Create EMI records and notify the user in the background
+        submit_emis_and_notify(
+            application.id,
+            f"Application approved by admin. Interest Rate: {interest_rate}%, EMI: ₹{emi_amount:,.2f}",
+            generate_emis=True
         )
         
         flash(f'Application #{application.id} approved successfully!', 'success')
@@ -373,7 +528,7 @@ def approve_application(app_id):
 def reject_application(app_id):
     """Manually reject an application"""
     try:
-        application = Application.query.filter_by(id=app_id).first_or_404()
+        application = get_application_or_404(app_id)
         rejection_reason = request.form.get('rejection_reason', 'Rejected by admin')
         
         # Update application
@@ -384,9 +539,9 @@ def reject_application(app_id):
         
         db.session.commit()
         
-        # Send notification
-        notification_service.send_decision_notification(
-            application, 
+        # Notify the user in the background
+        submit_emis_and_notify(
+            application.id,
             f"Application rejected by admin. Reason: {rejection_reason}"
         )
         
@@ -399,12 +554,12 @@ def reject_application(app_id):
         flash(f'Error rejecting application: {str(e)}', 'error')
         return redirect(url_for('admin.dashboard'))
 
-@admin_bp.route('/application/<app_id>/verify-documents', methods=['POST'])
+@admin_bp.route('/application/<app_id>/verify-documents-manual', methods=['POST'])
 @admin_required
 def verify_documents(app_id):
     """Manually verify documents"""
     try:
-        application = Application.query.filter_by(id=app_id).first_or_404()
+        application = get_application_or_404(app_id)
         
         # Get verification results from form
         document_status = request.form.get('document_status')
@@ -413,8 +568,7 @@ def verify_documents(app_id):
         # Update document verification status
         application.document_verification_status = document_status
         if verification_notes:
-            current_notes = application.admin_review_notes or ''
-            application.admin_review_notes = f"{current_notes}\nDocument Verification: {verification_notes}".strip()
+            append_note(application, f"Document Verification: {verification_notes}")
         
         db.session.commit()
         
@@ -432,87 +586,17 @@ def verify_documents(app_id):
 def application_reports():
     """Generate comprehensive application reports and analytics"""
     try:
-        # Overall statistics
-        total_applications = Application.query.count()
-        approved_applications = Application.query.filter_by(status='APPROVED').count()
-        rejected_applications = Application.query.filter_by(status='REJECTED').count()
-        pending_applications = Application.query.filter_by(status='PENDING').count()
-        
-        # Risk analysis
-        low_risk_count = Application.query.filter(Application.overall_risk_score <= 25).count()
-        medium_risk_count = Application.query.filter(
-            (Application.overall_risk_score > 25) & 
-            (Application.overall_risk_score <= 50)
-        ).count()
-        high_risk_count = Application.query.filter(
-            (Application.overall_risk_score > 50) & 
-            (Application.overall_risk_score <= 75)
-        ).count()
-        very_high_risk_count = Application.query.filter(Application.overall_risk_score > 75).count()
-        
-        # Monthly trends
-        monthly_data = []
-        for i in range(6):
-            month_start = datetime.now().replace(day=1) - timedelta(days=30*i)
-            month_end = month_start + timedelta(days=30)
-            
-            month_total = Application.query.filter(
-                Application.created_at >= month_start,
-                Application.created_at < month_end
-            ).count()
-            
-            month_approved = Application.query.filter(
-                Application.created_at >= month_start,
-                Application.created_at < month_end,
-                Application.status == 'APPROVED'
-            ).count()
-            
-            monthly_data.append({
-                'month': month_start.strftime('%b %Y'),
-                'total': month_total,
-                'approved': month_approved,
-                'approval_rate': (month_approved / month_total * 100) if month_total > 0 else 0
-            })
-        monthly_data.reverse()
-        
-        # Loan amount statistics
-        total_loan_amount = db.session.query(db.func.sum(Application.loan_amount)).scalar() or 0
-        avg_loan_amount = db.session.query(db.func.avg(Application.loan_amount)).scalar() or 0
+        # Aggregates are memoized until the application data changes
+        reports_data = dict(compute_report_stats(get_stats_version()))
         
         # Recent high-risk applications
-        high_risk_apps = Application.query.filter(
+        high_risk_apps = Application.query.options(
+            load_only(*APPLICATION_LIST_COLUMNS)
+        ).filter(
             Application.overall_risk_score > 75
         ).order_by(Application.created_at.desc()).limit(10).all()
         
-        # Document verification status
-        documents_verified = Application.query.filter_by(document_verification_status='VERIFIED').count()
-        documents_pending = Application.query.filter_by(document_verification_status='PENDING').count()
-        documents_review = Application.query.filter_by(document_verification_status='REVIEW_NEEDED').count()
-        
-        reports_data = {
-            'total_applications': total_applications,
-            'approved_applications': approved_applications,
-            'rejected_applications': rejected_applications,
-            'pending_applications': pending_applications,
-            'approval_rate': (approved_applications / total_applications * 100) if total_applications > 0 else 0,
-            'risk_distribution': {
-                'low_risk': low_risk_count,
-                'medium_risk': medium_risk_count,
-                'high_risk': high_risk_count,
-                'very_high_risk': very_high_risk_count
-            },
-            'monthly_trends': monthly_data,
-            'loan_statistics': {
-                'total_loan_amount': total_loan_amount,
-                'avg_loan_amount': avg_loan_amount
-            },
-            'high_risk_applications': high_risk_apps,
-            'document_verification': {
-                'verified': documents_verified,
-                'pending': documents_pending,
-                'review_needed': documents_review
-            }
-        }
+        reports_data['high_risk_applications'] = high_risk_apps
         
         return render_template('admin/application_reports.html', reports=reports_data)
     
@@ -538,12 +622,20 @@ def api_application_stats():
         # Weekly application counts
         one_week_ago = datetime.utcnow() - timedelta(days=7)
         
+        counts = db.session.execute(select(
+            func.count(Application.id).label('total'),
+            func.sum(case((Application.created_at >= one_week_ago, 1), else_=0)).label('last_week'),
+            func.sum(case((Application.status == 'APPROVED', 1), else_=0)).label('approved'),
+            func.sum(case((Application.status == 'PENDING', 1), else_=0)).label('pending'),
+            func.sum(case((Application.status == 'REJECTED', 1), else_=0)).label('rejected')
+        )).one()
+        
         weekly_stats = {
-            'total': Application.query.count(),
-            'last_week': Application.query.filter(Application.created_at >= one_week_ago).count(),
-            'approved': Application.query.filter_by(status='APPROVED').count(),
-            'pending': Application.query.filter_by(status='PENDING').count(),
-            'rejected': Application.query.filter_by(status='REJECTED').count()
+            'total': counts.total or 0,
+            'last_week': counts.last_week or 0,
+            'approved': counts.approved or 0,
+            'pending': counts.pending or 0,
+            'rejected': counts.rejected or 0
         }
         
         return jsonify(weekly_stats)
@@ -551,37 +643,58 @@ def api_application_stats():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-from services.document_verifier import DocumentVerificationService
+# Upper bound on documents verified in parallel per request
+VERIFY_MAX_WORKERS = 8
+
+# Built on first use so the blueprint import doesn't pull in pdfplumber/requests
+_document_verifier = None
+
+def get_document_verifier():
+    """Shared DocumentVerificationService (it keeps no per-document state)"""
+    global _document_verifier
+    if _document_verifier is None:
+        from services.document_verifier import DocumentVerificationService
+        _document_verifier = DocumentVerificationService()
+    return _document_verifier
 
 @admin_bp.route('/application/<app_id>/verify-documents', methods=['POST'])
+@admin_required
 def verify_application_documents(app_id):
     """Verify all documents for an application"""
     try:
-        application = Application.query.filter_by(id=app_id).first()
+        application = Application.query.options(
+            selectinload(Application.documents)
+        ).filter_by(id=app_id).first()
         if not application:
             return jsonify({"error": "Application not found"}), 404
         
-        verifier = DocumentVerificationService()
+        verifier = get_document_verifier()
+        documents = list(application.documents)
         results = []
         
-        for document in application.documents:
-            # Verify each document
-            verification_result = verifier.verify_document(
-                document_data={
-                    'content': document.content,  # Adjust based on your document model
-                    'file_type': document.file_type,
-                    'file_size': document.file_size,
-                    'metadata': document.metadata if hasattr(document, 'metadata') else {}
-                },
-                document_type=document.document_type
-            )
-            
-            # Update document status
-            document.document_verification_status = verification_result['status']
-            document.verification_reason = verification_result['reason']
-            document.risk_level = verification_result['risk_level']
-            document.verified_at = verification_result['verified_at']
-            document.ai_analysis = verification_result['ai_analysis']
+        # Verification is PDF/AI-call bound, so run documents concurrently
+        # and apply the results serially in this request's session
+        flask_app = current_app._get_current_object()
+        
+        def verify(document):
+            with flask_app.app_context():
+                return verifier.verify_document(document, application)
+        
+        verification_results = []
+        if documents:
+            with ThreadPoolExecutor(max_workers=min(VERIFY_MAX_WORKERS, len(documents))) as executor:
+                verification_results = list(executor.map(verify, documents))
+        
+        document_updates = []
+        for document, verification_result in zip(documents, verification_results):
+            # Collect document status updates for a single bulk UPDATE
+            document_updates.append({
+                'id': document.id,
+                'verification_status': verification_result['status'],
+                'verification_notes': verification_result.get('verification_reason'),
+                'verified_at': verification_result.get('verified_at'),
+                'ai_verification_report': json.dumps(verification_result.get('ai_analysis', {}), default=str)
+            })
             
             results.append({
                 'document_type': document.document_type,
@@ -589,6 +702,8 @@ def verify_application_documents(app_id):
                 'risk_level': verification_result['risk_level']
             })
         
+        if document_updates:
+            db.session.bulk_update_mappings(Document, document_updates)
         db.session.commit()
         
         return jsonify({
@@ -602,6 +717,7 @@ def verify_application_documents(app_id):
         return jsonify({"error": str(e)}), 500
 
 @admin_bp.route('/document/<doc_id>/verify', methods=['POST'])
+@admin_required
 def verify_single_document(doc_id):
     """Verify a single document"""
     try:
@@ -609,7 +725,7 @@ def verify_single_document(doc_id):
         if not document:
             return jsonify({"error": "Document not found"}), 404
         
-        verifier = DocumentVerificationService()
+        verifier = get_document_verifier()
         verification_result = verifier.verify_document(
             document_data={
                 'content': document.content,
@@ -2,20 +2,38 @@ import os
 import json
 import random
 import io
+import re
+import hashlib
+import tempfile
+import threading
 from datetime import datetime
-from dateutil.relativedelta import relativedelta
 from flask import (
     Flask, render_template, request, redirect, url_for, flash, 
-    session, send_from_directory, abort, jsonify, make_response, send_file, current_app
+    session, send_from_directory, abort, jsonify, send_file, current_app, Response
 )
-from config import SQLALCHEMY_DATABASE_URI, SECRET_KEY, UPLOAD_FOLDER
-from models import db, User, Application, Document, Admin, EMI
+from config import (
+    SQLALCHEMY_DATABASE_URI, SQLALCHEMY_ENGINE_OPTIONS, SECRET_KEY, UPLOAD_FOLDER, CACHE_TYPE, CACHE_DEFAULT_TIMEOUT,
+    JINJA_CACHE_SIZE, JINJA_BYTECODE_CACHE_DIR
+)
+from jinja2 import FileSystemBytecodeCache, TemplateError
+from models import db, User, Application, Document, Admin
+from extensions import cache
+from json_fields import (
+    ORJSON_AVAILABLE, OrjsonJSONProvider, json_loads,
+    report_json_dumps, load_json_field, load_json_fields, store_json_field
+)
+from request_cache import get_application, get_application_or_404, get_user_application, get_user_application_or_404, get_verification_timestamp
 from services import (
     auth_service, storage_service, advance_verification_service, 
-    decision_service, notification_service, autofill_service
+    decision_service, autofill_service, ai_verification_service
 )
-from functools import wraps
+from functools import wraps, lru_cache
 from decimal import Decimal
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+from sqlalchemy import func
+from sqlalchemy.orm import selectinload
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 
 # PDF Generation imports
 from reportlab.lib.pagesizes import letter, A4
@@ -23,10 +41,18 @@ from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph,
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib import colors
 from reportlab.lib.units import inch
+try:
+    from weasyprint import HTML
+    try:
+        from weasyprint.text.fonts import FontConfiguration
+    except ImportError:  # WeasyPrint < 53
+        from weasyprint.fonts import FontConfiguration
+    WEASYPRINT_AVAILABLE = True
+except ImportError:
+    WEASYPRINT_AVAILABLE = False
 
 # Import advanced verification service
 from services.advance_verification_service import  AdvanceVerificationService
-from services.ai_analysis_engine import AIVerificationService
 from services.pdf_report_generator import ComprehensivePDFReportGenerator
 # Add at the top of app.py
 from services.pdf_generator import (
@@ -37,13 +63,30 @@ from services.pdf_generator import (
     generate_loan_agreement
 )
 from services.ai_summary_generator import AISummaryGenerator
+from services.fast_emi import emi_scalar, emi_scalar_py, build_amortization_schedule
+from services.fast_risk import fraud_risk, financial_risk, instant_risk
+from services.pdf_backends import PLAYWRIGHT_AVAILABLE, render_pdf_chromium
 
 app = Flask(__name__)
+if ORJSON_AVAILABLE:
+    app.json = OrjsonJSONProvider(app)
 app.config['SQLALCHEMY_DATABASE_URI'] = SQLALCHEMY_DATABASE_URI
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = SQLALCHEMY_ENGINE_OPTIONS
 app.config['SECRET_KEY'] = SECRET_KEY
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
+app.config['CACHE_TYPE'] = CACHE_TYPE
+app.config['CACHE_DEFAULT_TIMEOUT'] = CACHE_DEFAULT_TIMEOUT
+
+# Keep compiled templates in memory and their bytecode on disk across restarts
+os.makedirs(JINJA_BYTECODE_CACHE_DIR, exist_ok=True)
+app.jinja_options = {
+    **app.jinja_options,
+    'cache_size': JINJA_CACHE_SIZE,
+    'bytecode_cache': FileSystemBytecodeCache(JINJA_BYTECODE_CACHE_DIR)
+}
 
 db.init_app(app)
+cache.init_app(app)
 
 # ===== MOVE AUTHENTICATION DECORATOR HERE - FIRST =====
 def login_required(f):
@@ -56,19 +99,52 @@ def login_required(f):
         return f(*args, **kwargs)
     return decorated_function
 
+def get_session_mobile_number():
+    """Mobile number of the logged-in user, kept in the session after the first lookup"""
+    mobile_number = session.get('mobile_number')
+    if mobile_number is None:
+        mobile_number = db.session.query(User.mobile_number).filter_by(id=session['user_id']).scalar()
+        if mobile_number is not None:
+            session['mobile_number'] = mobile_number
+    return mobile_number
+
 # ===== SIMPLY IMPORT AND REGISTER THE BLUEPRINT =====
-from admin.routes import admin_bp
+from admin.routes import admin_bp, replace_emi_records, submit_emis_and_notify
 app.register_blueprint(admin_bp)
 
+def warn_duplicate_routes():
+    """Log URL rules registered more than once, since only one of them can ever match"""
+    seen_rules = {}
+    for rule in app.url_map.iter_rules():
+        key = (rule.rule, frozenset(rule.methods or ()))
+        if key in seen_rules:
+            app.logger.warning(f"Duplicate route {rule.rule}: {seen_rules[key]} and {rule.endpoint}")
+        else:
+            seen_rules[key] = rule.endpoint
+
+warn_duplicate_routes()
+
+# Bump when update_database_schema gains new ALTER statements
+SCHEMA_VERSION = 2
+
 def update_database_schema():
     """Add missing columns to existing database tables"""
     from sqlalchemy import text
     
     try:
-        # Check if new columns exist, if not add them
         with app.app_context():
+            # Skip the column scan entirely once this schema version has been applied
+            db.session.execute(text('CREATE TABLE IF NOT EXISTS schema_migrations (version INTEGER NOT NULL)'))
+            applied_version = db.session.execute(text('SELECT MAX(version) FROM schema_migrations')).scalar() or 0
+            if applied_version >= SCHEMA_VERSION:
+                db.session.commit()
+                return
+            
+            # Check if new columns exist, if not add them
             inspector = db.inspect(db.engine)
-            existing_columns = [col['name'] for col in inspector.get_columns('application')]
+            existing_columns = []
+            if inspector.has_table('application'):
+                existing_columns = [col['name'] for col in inspector.get_columns('application')]
             
             new_columns = {
                 'employment_verification_status': 'ALTER TABLE application ADD COLUMN employment_verification_status VARCHAR(50) DEFAULT "PENDING"',
@@ -88,11 +164,21 @@ def update_database_schema():
                 'reviewed_at': 'ALTER TABLE application ADD COLUMN reviewed_at DATETIME',
             }
             
-            for column_name, alter_sql in new_columns.items():
-                if column_name not in existing_columns:
-                    print(f"Adding missing column: {column_name}")
-                    db.session.execute(text(alter_sql))
+            if existing_columns:
+                for column_name, alter_sql in new_columns.items():
+                    if column_name not in existing_columns:
+                        print(f"Adding missing column: {column_name}")
+                        db.session.execute(text(alter_sql))
+            
+            # Upload deduplication hash on documents
+            if inspector.has_table('documents'):
+                document_columns = [col['name'] for col in inspector.get_columns('documents')]
+                if 'content_hash' not in document_columns:
+                    print("Adding missing column: content_hash")
+                    db.session.execute(text('ALTER TABLE documents ADD COLUMN content_hash VARCHAR(64)'))
+                db.session.execute(text('CREATE INDEX IF NOT EXISTS ix_documents_content_hash ON documents (content_hash)'))
             
+            db.session.execute(text('INSERT INTO schema_migrations (version) VALUES (:version)'), {'version': SCHEMA_VERSION})
             db.session.commit()
             print("Database schema updated successfully!")
             
@@ -104,23 +190,41 @@ def update_database_schema():
 with app.app_context():
     update_database_schema()
 
+# CIBIL tiers as (quality, risk level, label, recommendation); index with get_cibil_tier
+CIBIL_TIER_BOUNDS = (550, 650, 750)
+CIBIL_TIERS = (
+    ("poor", "high", "Poor", "Requires significant improvement in credit management"),
+    ("fair", "medium", "Fair", "Focus on timely payments to improve credit score"),
+    ("good", "low", "Good", "Consider reducing credit card utilization below 30%"),
+    ("excellent", "low", "Excellent", "Maintain current credit behavior for sustained good score"),
+)
+
+def get_cibil_tier(cibil_score):
+    """Look up the CIBIL tier for a score (bounds are inclusive lower limits)"""
+    return CIBIL_TIERS[bisect_right(CIBIL_TIER_BOUNDS, cibil_score)]
+
+# Instant decision bands: overall risk score <= bound -> (interest rate, term in years, reason)
+DECISION_RISK_BOUNDS = (30, 50, 70)
+DECISION_TERMS = (
+    (8.0, 20, 'Excellent application! Low risk profile with {score:.1f}% risk score'),
+    (10.5, 15, 'Good application approved. Risk score: {score:.1f}%'),
+    (12.5, 10, 'Application approved with adjusted terms. Risk score: {score:.1f}%'),
+)
+
 # LLM Summary Generation Service
 class LLMSummaryService:
     """Service to generate AI summaries for reports with proper response cleaning"""
     
+    # Markdown/HTML markup characters, or a whitespace run (markup inside the run included)
+    CLEAN_RE = re.compile(r'(\s[\s*`<>]*)|[*`<>]+')
+    
     def clean_ai_response(self, text):
         """Clean and format AI response text"""
         if not text:
             return "No analysis available"
         
-        # Remove any markdown formatting
-        text = text.replace('**', '').replace('*', '').replace('`', '')
-        
-        # Remove any XML tags or HTML
-        text = text.replace('<', '').replace('>', '')
-        
-        # Clean up excessive whitespace
-        text = ' '.join(text.split())
+        # Drop markup and collapse whitespace in a single pass
+        text = self.CLEAN_RE.sub(lambda match: ' ' if match.group(1) else '', text).strip()
         
         # Ensure proper sentence structure
         if text and not text.endswith(('.', '!', '?')):
@@ -130,20 +234,9 @@ class LLMSummaryService:
     
     def generate_credit_summary(self, application, credit_data):
         """Generate credit risk LLM summary"""
-        debt_to_income = (application.existing_emi / application.monthly_salary * 100) if application.monthly_salary > 0 else 100
+        debt_to_income = derive_ratios(application).debt_to_income
         
-        if application.cibil_score >= 750:
-            credit_quality = "excellent"
-            risk_level = "low"
-        elif application.cibil_score >= 650:
-            credit_quality = "good" 
-            risk_level = "low"
-        elif application.cibil_score >= 550:
-            credit_quality = "fair"
-            risk_level = "medium"
-        else:
-            credit_quality = "poor"
-            risk_level = "high"
+        credit_quality, risk_level, credit_label, credit_recommendation = get_cibil_tier(application.cibil_score)
         
         # Generate summary text
         overall_assessment = f"Applicant demonstrates {credit_quality} credit quality with a CIBIL score of {application.cibil_score}."
@@ -153,16 +246,13 @@ class LLMSummaryService:
             "overall_assessment": self.clean_ai_response(overall_assessment),
             "detailed_analysis": self.clean_ai_response(detailed_analysis),
             "key_factors": [
-                f"CIBIL Score: {application.cibil_score} ({'Excellent' if application.cibil_score >= 750 else 'Good' if application.cibil_score >= 650 else 'Fair' if application.cibil_score >= 550 else 'Poor'})",
+                f"CIBIL Score: {application.cibil_score} ({credit_label})",
                 f"Debt-to-Income Ratio: {debt_to_income:.1f}%",
                 f"Credit Utilization: {'Optimal' if application.cibil_score >= 700 else 'Moderate' if application.cibil_score >= 600 else 'High'}",
                 f"Payment History: {'Clean' if application.cibil_score >= 700 else 'Satisfactory' if application.cibil_score >= 600 else 'Needs Improvement'}"
             ],
             "recommendations": [
-                "Maintain current credit behavior for sustained good score" if application.cibil_score >= 750 else
-                "Consider reducing credit card utilization below 30%" if application.cibil_score >= 650 else
-                "Focus on timely payments to improve credit score" if application.cibil_score >= 550 else
-                "Requires significant improvement in credit management",
+                credit_recommendation,
                 "Monitor debt-to-income ratio regularly",
                 "Avoid new credit applications in near term"
             ],
@@ -205,6 +295,12 @@ class LLMSummaryService:
         overall_assessment = f"Property valuation of ₹{application.property_valuation:,.2f} provides {'strong' if ltv_ratio <= 70 else 'adequate' if ltv_ratio <= 85 else 'marginal'} security coverage for the requested loan."
         detailed_analysis = f"The loan-to-value ratio of {ltv_ratio:.1f}% is {'within conservative limits' if ltv_ratio <= 60 else 'within acceptable range' if ltv_ratio <= 75 else 'approaching maximum thresholds'}. The property classification as {'non-agricultural' if application.is_non_agricultural else 'agricultural'} {'meets' if application.is_non_agricultural else 'does not meet'} lending criteria."
         
+        risk_factors = []
+        if not application.is_non_agricultural:
+            risk_factors.append("Non-agricultural declaration required for loan eligibility")
+        risk_factors.append("Property title verification pending")
+        risk_factors.append("Legal encumbrance check incomplete")
+        
         return {
             "overall_assessment": self.clean_ai_response(overall_assessment),
             "detailed_analysis": self.clean_ai_response(detailed_analysis),
@@ -213,13 +309,7 @@ class LLMSummaryService:
                 "Property valuation appears reasonable based on market standards",
                 "Adequate security coverage for loan amount" if ltv_ratio <= 80 else "Limited security margin"
             ],
-            "risk_factors": [
-                risk for risk in [
-                    "Non-agricultural declaration required for loan eligibility" if not application.is_non_agricultural else None,
-                    "Property title verification pending",
-                    "Legal encumbrance check incomplete"
-                ] if risk is not None
-            ],
+            "risk_factors": risk_factors,
             "critical_requirements": [
                 "Non-agricultural declaration certificate",
                 "Property title deed verification",
@@ -241,30 +331,36 @@ class LLMSummaryService:
         
         executive_summary = f"This application presents a {'strong' if overall_risk <= 30 else 'moderate' if overall_risk <= 60 else 'high-risk'} profile with comprehensive assessment across credit, documentation, and property parameters."
         
+        critical_risks = []
+        if all_data['debt_to_income'] > 50:
+            critical_risks.append("High debt-to-income ratio")
+        if all_data['document_verification_rate'] < 100:
+            critical_risks.append("Incomplete document submission")
+        if all_data['ltv_ratio'] > 80:
+            critical_risks.append("High LTV ratio")
+        if application.cibil_score < 600:
+            critical_risks.append("Poor credit history")
+        
+        strengths = []
+        if application.cibil_score >= 750:
+            strengths.append("Strong credit profile")
+        if all_data['debt_to_income'] <= 30:
+            strengths.append("Low debt burden")
+        if all_data['document_verification_rate'] == 100:
+            strengths.append("Complete documentation")
+        if all_data['ltv_ratio'] <= 70:
+            strengths.append("Adequate property coverage")
+        
         return {
             "executive_summary": self.clean_ai_response(executive_summary),
             "decision_factors": [
-                f"Credit Quality: {'Excellent' if application.cibil_score >= 750 else 'Good' if application.cibil_score >= 650 else 'Fair' if application.cibil_score >= 550 else 'Poor'} (Score: {application.cibil_score})",
+                f"Credit Quality: {get_cibil_tier(application.cibil_score)[2]} (Score: {application.cibil_score})",
                 f"Document Compliance: {all_data['document_verification_rate']:.1f}% complete",
                 f"Property Security: LTV Ratio {all_data['ltv_ratio']:.1f}%",
                 f"Overall Risk Score: {overall_risk:.1f}%"
             ],
-            "critical_risks": [
-                risk for risk in [
-                    "High debt-to-income ratio" if all_data['debt_to_income'] > 50 else None,
-                    "Incomplete document submission" if all_data['document_verification_rate'] < 100 else None,
-                    "High LTV ratio" if all_data['ltv_ratio'] > 80 else None,
-                    "Poor credit history" if application.cibil_score < 600 else None
-                ] if risk is not None
-            ],
-            "strengths": [
-                strength for strength in [
-                    "Strong credit profile" if application.cibil_score >= 750 else None,
-                    "Low debt burden" if all_data['debt_to_income'] <= 30 else None,
-                    "Complete documentation" if all_data['document_verification_rate'] == 100 else None,
-                    "Adequate property coverage" if all_data['ltv_ratio'] <= 70 else None
-                ] if strength is not None
-            ],
+            "critical_risks": critical_risks,
+            "strengths": strengths,
             "final_recommendation": "APPROVE with standard terms" if overall_risk <= 40 else "APPROVE with conditions" if overall_risk <= 70 else "REJECT due to high risk",
             "confidence_level": "Very High" if application.cibil_score >= 750 and all_data['document_verification_rate'] == 100 else "High" if application.cibil_score >= 650 else "Medium",
             "quality_score": min(10, 10 - int(overall_risk / 10)),
@@ -293,74 +389,78 @@ def calculate_emi(principal, annual_rate, tenure_months):
         if monthly_rate == 0:  # Handle zero interest rate
             return principal / tenure_months
         
-        emi = principal * monthly_rate * (1 + monthly_rate) ** tenure_months / ((1 + monthly_rate) ** tenure_months - 1)
+        emi = emi_scalar(float(principal), float(monthly_rate), int(tenure_months))
         return round(emi, 2)
     except Exception as e:
         app.logger.error(f"Error calculating EMI: {e}")
         return 0
 
+@lru_cache(maxsize=4096)
+def calculate_loan_figures(principal, annual_rate, tenure_months):
+    """Calculate EMI, total interest and total payment from a single EMI evaluation (memoized per loan)"""
+    emi = calculate_emi(principal, annual_rate, tenure_months)
+    total_payment = emi * tenure_months
+    return emi, round(total_payment - principal, 2), round(total_payment, 2)
+
 def calculate_total_interest(principal, annual_rate, tenure_months):
     """Calculate total interest payable"""
-    emi = calculate_emi(principal, annual_rate, tenure_months)
-    return round(emi * tenure_months - principal, 2)
+    return calculate_loan_figures(principal, annual_rate, tenure_months)[1]
 
 def calculate_total_payment(principal, annual_rate, tenure_months):
     """Calculate total payment (principal + interest)"""
-    emi = calculate_emi(principal, annual_rate, tenure_months)
-    return round(emi * tenure_months, 2)
+    return calculate_loan_figures(principal, annual_rate, tenure_months)[2]
 
 def generate_amortization_schedule(principal, annual_rate, tenure_months, emi):
     """Generate monthly amortization schedule"""
     try:
-        schedule = []
-        balance = principal
-        monthly_rate = annual_rate / 12 / 100
-        start_date = datetime.now()
-        
-        for month in range(1, tenure_months + 1):
-            interest = balance * monthly_rate
-            principal_component = emi - interest
-            
-            # Handle final payment adjustment
-            if month == tenure_months:
-                principal_component = balance
-                emi_adjusted = principal_component + interest
-                balance = 0
-            else:
-                emi_adjusted = emi
-                balance -= principal_component
-            
-            schedule.append({
-                'month': month,
-                'date': (start_date + relativedelta(months=month)).strftime('%d-%b-%Y'),
-                'emi': round(emi_adjusted, 2),
-                'principal': round(principal_component, 2),
-                'interest': round(interest, 2),
-                'balance': max(round(balance, 2), 0)  # Ensure non-negative
-            })
-        
-        return schedule
+        return build_amortization_schedule(principal, annual_rate, tenure_months, emi)
     except Exception as e:
         app.logger.error(f"Error generating amortization schedule: {e}")
         return []
 
+# Ratios shared by the instant-decision checks, derived once per application
+ApplicationRatios = namedtuple('ApplicationRatios', ['emi_to_salary', 'debt_to_income', 'loan_to_value'])
+
+def derive_ratios(application):
+    """Debt-to-income and loan-to-value (%), defaulting to 100 when the denominator is not positive"""
+    monthly_salary = application.monthly_salary or 0
+    existing_emi = application.existing_emi or 0
+    inputs = (existing_emi, monthly_salary, application.loan_amount, application.property_valuation)
+    
+    # Memoized on the instance until one of the inputs changes
+    cached = application.__dict__.get('_ratios')
+    if cached is not None and cached[0] == inputs:
+        return cached[1]
+    
+    if monthly_salary > 0:
+        emi_to_salary = existing_emi / monthly_salary
+        debt_to_income = emi_to_salary * 100
+    else:
+        emi_to_salary = None
+        debt_to_income = 100
+    loan_to_value = (application.loan_amount / application.property_valuation) * 100 if application.property_valuation > 0 else 100
+    ratios = ApplicationRatios(emi_to_salary, debt_to_income, loan_to_value)
+    application.__dict__['_ratios'] = (inputs, ratios)
+    return ratios
+
 # INSTANT LOAN DECISION FUNCTIONS
 def instant_loan_decision(application, documents):
     """AI-powered instant loan decision making"""
     
-    # Run all verifications in parallel (simulated)
-    ai_analysis = instant_ai_analysis(application)
+    ratios = derive_ratios(application)
+    
+    # The checks are pure-Python and CPU-bound, so they run in sequence
+    ai_analysis = instant_ai_analysis(application, ratios)
     employment_verification = instant_employment_verification(application, documents)
     document_verification = instant_document_verification(documents)
-    financial_risk = calculate_financial_risk(application)
-    fraud_risk = instant_fraud_detection(application)
+    financial_risk = calculate_financial_risk(application, ratios)
     
-    # Calculate instant risk score
-    overall_risk_score = calculate_instant_risk_score(
+    # Calculate fraud risk and instant risk score in one kernel call
+    overall_risk_score, fraud_risk_score = calculate_instant_risk_score(
+        application,
         employment_verification, 
         document_verification, 
         financial_risk, 
-        fraud_risk,
         ai_analysis
     )
     
@@ -369,7 +469,7 @@ def instant_loan_decision(application, documents):
     
     # Generate instant verification summary
     verification_summary = {
-        'timestamp': datetime.utcnow().isoformat(),
+        'timestamp': datetime.utcnow(),  # ISO-formatted by report_json_dumps when stored
         'application_id': application.id,
         'processing_time': 'instant',
         'decision_engine': 'AI_Powered_Instant_Approval',
@@ -399,64 +499,63 @@ def instant_loan_decision(application, documents):
         'employment_verification': employment_verification,
         'document_verification': document_verification,
         'verification_summary': verification_summary,
-        'banking_report': instant_banking_analysis(application),
-        'fraud_report': {'status': 'LOW_RISK', 'risk_score': fraud_risk}
+        'banking_report': instant_banking_analysis(application, ratios),
+        'fraud_report': {'status': 'LOW_RISK', 'risk_score': fraud_risk_score}
     }
 
-def instant_ai_analysis(application):
+# Identical resubmissions reuse the decision for an hour
+DECISION_CACHE_TIMEOUT = 3600
+
+def decision_cache_key(application, documents):
+    """Cache key over every input the instant decision reads"""
+    inputs = (
+        application.pan_number, application.aadhar_number,
+        application.first_name, application.last_name, application.company_name,
+        application.monthly_salary, application.existing_emi, application.cibil_score,
+        application.loan_amount, application.property_valuation,
+        tuple(sorted(doc.document_type for doc in documents))
+    )
+    return 'loan-decision:' + hashlib.blake2b(repr(inputs).encode(), digest_size=16).hexdigest()
+
+def cached_loan_decision(application, documents):
+    """instant_loan_decision, reused from the cache when the same inputs were decided recently"""
+    documents = list(documents)
+    cache_key = decision_cache_key(application, documents)
+    decision_result = cache.get(cache_key)
+    if decision_result is None:
+        decision_result = instant_loan_decision(application, documents)
+        cache.set(cache_key, decision_result, timeout=DECISION_CACHE_TIMEOUT)
+    else:
+        # The cache hands back a copy; stamp it for this application
+        decision_result['verification_summary'].update(application_id=application.id, timestamp=datetime.utcnow())
+    return decision_result
+
+# instant_ai_analysis risk factors per band
+CIBIL_RISK_BOUNDS = (700, 750, 800)  # score >= bound moves to the next band
+CIBIL_RISK_FACTORS = (0.8, 0.5, 0.3, 0.1)
+DTI_RISK_BOUNDS = (30, 50)  # ratio <= bound stays in the band
+DTI_RISK_FACTORS = (0.2, 0.4, 0.8)
+LTV_RISK_BOUNDS = (60, 80)  # ratio <= bound stays in the band
+LTV_RISK_FACTORS = (0.1, 0.3, 0.7)
+SALARY_RISK_BOUNDS = (3000, 5000)  # ₹ salary per lakh of loan, >= bound moves to the next band
+SALARY_RISK_FACTORS = (0.8, 0.4, 0.2)
+
+def instant_ai_analysis(application, ratios=None):
     """Instant AI analysis using ML models"""
     
     # Feature engineering for ML model
-    features = {
-        'debt_to_income': (application.existing_emi / application.monthly_salary) * 100 if application.monthly_salary > 0 else 100,
-        'loan_to_value': (application.loan_amount / application.property_valuation) * 100 if application.property_valuation > 0 else 100,
-        'cibil_score': application.cibil_score,
-        'salary_adequacy': application.monthly_salary / (application.loan_amount / 100000),  # Salary per lakh loan
-        'property_valuation_ratio': application.property_valuation / application.loan_amount,
-        'existing_obligations': application.existing_emi > 0
-    }
-    
-    # ML-based risk prediction (simplified)
-    risk_factors = []
-    
-    # CIBIL score impact
-    if application.cibil_score >= 800:
-        risk_factors.append(0.1)  # Excellent credit
-    elif application.cibil_score >= 750:
-        risk_factors.append(0.3)  # Good credit
-    elif application.cibil_score >= 700:
-        risk_factors.append(0.5)  # Fair credit
-    else:
-        risk_factors.append(0.8)  # Poor credit
-    
-    # Debt-to-Income ratio
-    dti = features['debt_to_income']
-    if dti <= 30:
-        risk_factors.append(0.2)
-    elif dti <= 50:
-        risk_factors.append(0.4)
-    else:
-        risk_factors.append(0.8)
-    
-    # Loan-to-Value ratio
-    ltv = features['loan_to_value']
-    if ltv <= 60:
-        risk_factors.append(0.1)
-    elif ltv <= 80:
-        risk_factors.append(0.3)
-    else:
-        risk_factors.append(0.7)
-    
-    # Salary adequacy
-    if features['salary_adequacy'] >= 5000:  # ₹5000 per lakh loan
-        risk_factors.append(0.2)
-    elif features['salary_adequacy'] >= 3000:
-        risk_factors.append(0.4)
-    else:
-        risk_factors.append(0.8)
-    
-    # Calculate average risk
-    avg_risk = sum(risk_factors) / len(risk_factors) * 100
+    ratios = ratios or derive_ratios(application)
+    dti = ratios.debt_to_income
+    ltv = ratios.loan_to_value
+    salary_adequacy = application.monthly_salary / (application.loan_amount / 100000)  # Salary per lakh loan
+    
+    # ML-based risk prediction (simplified): average of four banded risk factors
+    avg_risk = (
+        CIBIL_RISK_FACTORS[bisect_right(CIBIL_RISK_BOUNDS, application.cibil_score)]
+        + DTI_RISK_FACTORS[bisect_left(DTI_RISK_BOUNDS, dti)]
+        + LTV_RISK_FACTORS[bisect_left(LTV_RISK_BOUNDS, ltv)]
+        + SALARY_RISK_FACTORS[bisect_right(SALARY_RISK_BOUNDS, salary_adequacy)]
+    ) / 4 * 100
     
     return {
         'risk_score': avg_risk,
@@ -465,7 +564,7 @@ def instant_ai_analysis(application):
             'credit_quality': 'EXCELLENT' if application.cibil_score >= 750 else 'GOOD' if application.cibil_score >= 700 else 'FAIR',
             'debt_burden': 'LOW' if dti <= 40 else 'MODERATE' if dti <= 60 else 'HIGH',
             'property_coverage': 'STRONG' if ltv <= 70 else 'ADEQUATE' if ltv <= 85 else 'WEAK',
-            'income_stability': 'STRONG' if features['salary_adequacy'] >= 4000 else 'ADEQUATE'
+            'income_stability': 'STRONG' if salary_adequacy >= 4000 else 'ADEQUATE'
         },
         'recommendation': 'APPROVE' if avg_risk <= 40 else 'REVIEW' if avg_risk <= 70 else 'REJECT'
     }
@@ -486,25 +585,34 @@ def instant_employment_verification(application, documents):
     
     return employment_data
 
+# Documents checked by instant verification, including the NA document
+INSTANT_DOCUMENT_TYPES = ('bank_statements', 'salary_slips', 'kyc_docs', 'property_valuation_doc', 'legal_clearance', 'na_document')
+
 def instant_document_verification(documents):
     """Instant document verification including NA document"""
     
-    # UPDATED: Include NA document in the verification
-    doc_types = ['bank_statements', 'salary_slips', 'kyc_docs', 'property_valuation_doc', 'legal_clearance', 'na_document']
     verified_docs = {}
+    missing_docs = []
+    total_risk = 0
     
-    for doc_type in doc_types:
-        doc_present = any(doc_type in doc.document_type.lower() for doc in documents)
+    # Lowercase each uploaded type once; exact names are a set probe, other names fall back to substring matching
+    uploaded_types = {doc.document_type.lower() for doc in documents}
+    
+    for doc_type in INSTANT_DOCUMENT_TYPES:
+        doc_present = doc_type in uploaded_types or any(doc_type in uploaded for uploaded in uploaded_types)
+        risk_score = 10 if doc_present else 80
         verified_docs[doc_type] = {
             'status': 'VERIFIED' if doc_present else 'MISSING',
-            'risk_score': 10 if doc_present else 80,
+            'risk_score': risk_score,
             'verification_time': 'INSTANT'
         }
+        total_risk += risk_score
+        if not doc_present:
+            missing_docs.append(doc_type)
     
     # Calculate overall document status
-    missing_docs = [doc_type for doc_type, info in verified_docs.items() if info['status'] == 'MISSING']
     overall_status = 'VERIFIED' if len(missing_docs) == 0 else 'PARTIAL'
-    avg_risk = sum(info['risk_score'] for info in verified_docs.values()) / len(verified_docs)
+    avg_risk = total_risk / len(verified_docs)
     
     return {
         'overall_status': overall_status,
@@ -517,253 +625,171 @@ def instant_document_verification(documents):
 def instant_fraud_detection(application):
     """Instant fraud detection using pattern analysis"""
     
-    fraud_indicators = []
-    
-    # Check for common fraud patterns
-    # Salary consistency check
-    if application.monthly_salary > 500000:  # Unusually high salary
-        fraud_indicators.append(0.3)
-    
-    # Property valuation check
-    if application.property_valuation / application.loan_amount > 10:  # Very high collateral
-        fraud_indicators.append(0.2)
-    
-    # CIBIL score consistency
-    if application.cibil_score >= 800 and application.monthly_salary < 50000:
-        fraud_indicators.append(0.4)  # High credit score with low income
-    
-    # Calculate fraud risk
-    fraud_risk = sum(fraud_indicators) / len(fraud_indicators) * 100 if fraud_indicators else 15
-    
-    return min(fraud_risk, 100)
+    return fraud_risk(
+        float(application.monthly_salary),
+        float(application.property_valuation),
+        float(application.loan_amount),
+        float(application.cibil_score)
+    )
 
-def instant_banking_analysis(application):
+def instant_banking_analysis(application, ratios=None):
     """Instant banking behavior analysis"""
+    ratios = ratios or derive_ratios(application)
+    emi_to_salary = ratios.emi_to_salary
+    if emi_to_salary is None:
+        # No salary on record: report the capped ratio and send it for review
+        return {
+            'status': 'MODERATE',
+            'analysis': 'INSTANT_PATTERN_ANALYSIS',
+            'debt_service_ratio': ratios.debt_to_income,
+            'recommendation': 'REVIEW'
+        }
     
     return {
-        'status': 'HEALTHY' if application.existing_emi / application.monthly_salary <= 0.5 else 'MODERATE',
+        'status': 'HEALTHY' if emi_to_salary <= 0.5 else 'MODERATE',
         'analysis': 'INSTANT_PATTERN_ANALYSIS',
-        'debt_service_ratio': (application.existing_emi / application.monthly_salary) * 100,
-        'recommendation': 'ACCEPTABLE' if application.existing_emi / application.monthly_salary <= 0.6 else 'REVIEW'
+        'debt_service_ratio': ratios.debt_to_income,
+        'recommendation': 'ACCEPTABLE' if emi_to_salary <= 0.6 else 'REVIEW'
     }
 
-def calculate_instant_risk_score(employment_data, document_data, financial_risk, fraud_risk, ai_analysis):
-    """Calculate instant overall risk score"""
-    
-    weights = {
-        'employment': 0.25,
-        'documents': 0.15,
-        'financial': 0.35,
-        'fraud': 0.15,
-        'ai_prediction': 0.10
-    }
-    
-    weighted_score = (
-        employment_data.get('risk_score', 50) * weights['employment'] +
-        document_data.get('risk_score', 50) * weights['documents'] +
-        financial_risk * weights['financial'] +
-        fraud_risk * weights['fraud'] +
-        ai_analysis.get('risk_score', 50) * weights['ai_prediction']
+def calculate_instant_risk_score(application, employment_data, document_data, financial_risk, ai_analysis):
+    """Calculate instant overall risk score and fraud risk: returns (risk_score, fraud_risk)"""
+    return instant_risk(
+        float(employment_data.get('risk_score', 50)),
+        float(document_data.get('risk_score', 50)),
+        float(financial_risk),
+        float(ai_analysis.get('risk_score', 50)),
+        float(application.monthly_salary),
+        float(application.property_valuation),
+        float(application.loan_amount),
+        float(application.cibil_score)
     )
-    
-    return min(100, weighted_score)
 
 def make_instant_decision(application, overall_risk_score, ai_analysis):
     """Make instant loan decision based on risk score and AI analysis"""
     
     # Base decision on risk score
-    if overall_risk_score <= 30:
-        # Low risk - Auto approve with best terms
-        interest_rate = 8.0  # Best rate
-        loan_term = 20  # Maximum term
-        emi = calculate_emi(application.loan_amount, interest_rate, loan_term * 12)
-        
-        return {
-            'status': 'APPROVED',
-            'reason': f'Excellent application! Low risk profile with {overall_risk_score:.1f}% risk score',
-            'interest_rate': interest_rate,
-            'loan_term_years': loan_term,
-            'emi_amount': emi
-        }
-    
-    elif overall_risk_score <= 50:
-        # Medium risk - Approve with standard terms
-        interest_rate = 10.5  # Standard rate
-        loan_term = 15  # Standard term
-        emi = calculate_emi(application.loan_amount, interest_rate, loan_term * 12)
-        
-        return {
-            'status': 'APPROVED',
-            'reason': f'Good application approved. Risk score: {overall_risk_score:.1f}%',
-            'interest_rate': interest_rate,
-            'loan_term_years': loan_term,
-            'emi_amount': emi
-        }
-    
-    elif overall_risk_score <= 70:
-        # Higher risk - Approve with conservative terms
-        interest_rate = 12.5  # Higher rate
-        loan_term = 10  # Shorter term
-        emi = calculate_emi(application.loan_amount, interest_rate, loan_term * 12)
-        
-        return {
-            'status': 'APPROVED',
-            'reason': f'Application approved with adjusted terms. Risk score: {overall_risk_score:.1f}%',
-            'interest_rate': interest_rate,
-            'loan_term_years': loan_term,
-            'emi_amount': emi
-        }
-    
-    else:
+    band = bisect_left(DECISION_RISK_BOUNDS, overall_risk_score)
+    if band == len(DECISION_RISK_BOUNDS):
         # High risk - Reject
         return {
             'status': 'REJECTED',
             'reason': f'Application declined due to high risk profile. Risk score: {overall_risk_score:.1f}%'
         }
+    
+    interest_rate, loan_term, reason = DECISION_TERMS[band]
+    emi = calculate_emi(application.loan_amount, interest_rate, loan_term * 12)
+    
+    return {
+        'status': 'APPROVED',
+        'reason': reason.format(score=overall_risk_score),
+        'interest_rate': interest_rate,
+        'loan_term_years': loan_term,
+        'emi_amount': emi
+    }
 
 
+# Risk level per band: risk score <= bound stays in the band
+RISK_LEVEL_BOUNDS = (25, 40, 60, 75)
+RISK_LEVELS = ('VERY_LOW', 'LOW', 'MEDIUM', 'HIGH', 'VERY_HIGH')
+
 def get_risk_level(risk_score):
     """Convert risk score to risk level"""
-    if risk_score <= 25:
-        return 'VERY_LOW'
-    elif risk_score <= 40:
-        return 'LOW'
-    elif risk_score <= 60:
-        return 'MEDIUM'
-    elif risk_score <= 75:
-        return 'HIGH'
-    else:
-        return 'VERY_HIGH'
+    return RISK_LEVELS[bisect_left(RISK_LEVEL_BOUNDS, float(risk_score))]
 
-def calculate_financial_risk(application):
+def calculate_financial_risk(application, ratios=None):
     """Calculate financial risk score"""
-    try:
-        risk_score = 0
-        
-        # Debt-to-income ratio
-        dti = (application.existing_emi / application.monthly_salary) * 100 if application.monthly_salary > 0 else 100
-        if dti > 50:
-            risk_score += 40
-        elif dti > 30:
-            risk_score += 20
-        else:
-            risk_score += 10
-        
-        # Loan-to-value ratio
-        ltv = (application.loan_amount / application.property_valuation) * 100 if application.property_valuation > 0 else 100
-        if ltv > 80:
-            risk_score += 30
-        elif ltv > 60:
-            risk_score += 15
-        else:
-            risk_score += 5
-        
-        # CIBIL score impact
-        if application.cibil_score < 600:
-            risk_score += 30
-        elif application.cibil_score < 750:
-            risk_score += 15
-        else:
-            risk_score += 5
-        
-        return min(100, risk_score)
-        
-    except Exception as e:
+    if application.cibil_score is None:
         return 50  # Default medium risk
+    
+    ratios = ratios or derive_ratios(application)
+    return financial_risk(
+        float(ratios.debt_to_income),
+        float(ratios.loan_to_value),
+        float(application.cibil_score)
+    )
 
 def get_fraud_risk_score(application, fraud_report):
-    """Extract fraud risk from fraud report"""
-    try:
-        if isinstance(fraud_report, dict):
-            return fraud_report.get('risk_score', 50)
-        elif isinstance(fraud_report, str):
-            fraud_data = json.loads(fraud_report)
-            return fraud_data.get('risk_score', 50)
-        else:
-            return 50
-    except:
-        return 50
-
-def safe_json_loads(json_string, default=None):
-    """Safely parse JSON string with error handling"""
-    if default is None:
-        default = {}
-    try:
-        return json.loads(json_string) if json_string else default
-    except (json.JSONDecodeError, TypeError):
-        return default
+    """Extract fraud risk from a parsed fraud report (see load_json_field)"""
+    risk_score = fraud_report.get('risk_score')
+    return 50.0 if risk_score is None else float(risk_score)
+
+# Credit report tiers as (risk level, risk score, credit quality); score >= bound moves to the next tier
+CREDIT_REPORT_BOUNDS = (650, 750)
+CREDIT_REPORT_TIERS = (
+    ("HIGH", 70, 'FAIR'),
+    ("MEDIUM", 40, 'GOOD'),
+    ("LOW", 20, 'EXCELLENT'),
+)
 
 def get_credit_report(application):
     """Get credit risk analysis report"""
-    try:
-        # Your credit analysis logic here
-        cibil_score = application.cibil_score or 0
-        if cibil_score >= 750:
-            risk_level = "LOW"
-            risk_score = 20
-        elif cibil_score >= 650:
-            risk_level = "MEDIUM"
-            risk_score = 40
-        else:
-            risk_level = "HIGH"
-            risk_score = 70
-            
-        return {
-            'risk_score': risk_score,
-            'risk_level': risk_level,
-            'cibil_score': cibil_score,
-            'key_factors': {
-                'credit_quality': 'EXCELLENT' if cibil_score >= 750 else 'GOOD' if cibil_score >= 650 else 'FAIR',
-                'payment_history': 'CLEAN',
-                'credit_utilization': 'OPTIMAL'
-            }
+    # Your credit analysis logic here
+    cibil_score = application.cibil_score or 0
+    risk_level, risk_score, credit_quality = CREDIT_REPORT_TIERS[bisect_right(CREDIT_REPORT_BOUNDS, cibil_score)]
+        
+    return {
+        'risk_score': risk_score,
+        'risk_level': risk_level,
+        'cibil_score': cibil_score,
+        'key_factors': {
+            'credit_quality': credit_quality,
+            'payment_history': 'CLEAN',
+            'credit_utilization': 'OPTIMAL'
         }
-    except Exception as e:
-        app.logger.error(f"Error generating credit report: {e}")
-        return {}
+    }
 
 def get_banking_report(application):
     """Get banking behavior analysis report"""
-    try:
-        # Calculate debt-to-income ratio
-        monthly_salary = application.monthly_salary or 0
-        existing_emi = application.existing_emi or 0
-        debt_service_ratio = (existing_emi / monthly_salary * 100) if monthly_salary > 0 else 0
+    # Calculate debt-to-income ratio (0 rather than the capped 100 when there is no salary)
+    monthly_salary = application.monthly_salary or 0
+    existing_emi = application.existing_emi or 0
+    ratios = derive_ratios(application)
+    debt_service_ratio = ratios.debt_to_income if ratios.emi_to_salary is not None else 0
+    
+    if debt_service_ratio <= 30:
+        status = "HEALTHY"
+    elif debt_service_ratio <= 50:
+        status = "MODERATE"
+    else:
+        status = "HIGH_RISK"
         
-        if debt_service_ratio <= 30:
-            status = "HEALTHY"
-        elif debt_service_ratio <= 50:
-            status = "MODERATE"
-        else:
-            status = "HIGH_RISK"
-            
-        return {
-            'status': status,
-            'debt_service_ratio': debt_service_ratio,
-            'monthly_salary': monthly_salary,
-            'existing_obligations': existing_emi
-        }
-    except Exception as e:
-        app.logger.error(f"Error generating banking report: {e}")
-        return {}
+    return {
+        'status': status,
+        'debt_service_ratio': debt_service_ratio,
+        'monthly_salary': monthly_salary,
+        'existing_obligations': existing_emi
+    }
 
-def initialize_na_verification(application_id):
-    """Initialize NA document verification process"""
-    application = Application.query.get(application_id)
+def documents_by_type(application):
+    """Index an application's documents as {document_type: [documents in upload order]}, built once per document list"""
+    documents = application.documents
+    cache_key = (id(documents), len(documents))
+    cached = application.__dict__.get('_documents_by_type')
+    if cached is not None and cached[0] == cache_key:
+        return cached[1]
+    
+    index = {}
+    for doc in documents:
+        index.setdefault(doc.document_type, []).append(doc)
+    application.__dict__['_documents_by_type'] = (cache_key, index)
+    return index
+
+def initialize_na_verification(application_id, commit=True):
+    """Initialize NA document verification process; commit=False leaves the commit to the caller"""
+    application = get_application(application_id, with_documents=True)
     if not application:
         return
     
     # Find NA document - check for both possible document types
-    na_document = None
-    for doc in application.documents:
-        if doc.document_type in ['NON_AGRICULTURAL_DECLARATION', 'NA_DOCUMENT']:
-            na_document = doc
-            break
+    docs_by_type = documents_by_type(application)
+    na_documents = docs_by_type.get('NON_AGRICULTURAL_DECLARATION') or docs_by_type.get('NA_DOCUMENT')
+    na_document = na_documents[0] if na_documents else None
     
     if na_document:
         # Start verification process
         na_report = verify_na_document(na_document, application)
-        application.na_document_verification = json.dumps(na_report)
+        store_json_field(application, 'na_document_verification', na_report)
         application.na_document_status = na_report.get('status', 'PENDING')
         application.na_document_risk_score = na_report.get('risk_score', 0.0)
         
@@ -790,107 +816,109 @@ def initialize_na_verification(application_id):
             ],
             'recommendation': 'Upload non-agricultural declaration certificate'
         }
-        application.na_document_verification = json.dumps(na_report)
+        store_json_field(application, 'na_document_verification', na_report)
         application.na_document_status = 'PENDING'
         application.na_document_risk_score = 100.0
     
-    db.session.commit()
+    if commit:
+        db.session.commit()
     return na_report
 
+# Upload size limit checked by document verification
+MAX_DOCUMENT_SIZE = 10 * 1024 * 1024  # 10MB
+ALLOWED_DOCUMENT_EXTENSIONS = frozenset(('pdf', 'jpg', 'jpeg', 'png'))
+
+def has_allowed_extension(filename):
+    """Check the filename extension against the accepted document formats"""
+    if not filename:
+        return False
+    _, dot, extension = filename.rpartition('.')
+    return bool(dot) and extension.lower() in ALLOWED_DOCUMENT_EXTENSIONS
+
+# Fixed NA verification steps, shared by every report (only ever serialized, never mutated)
+NA_VERIFICATION_STEPS = {
+    'presence': {'step': 'Document Presence', 'status': 'PASSED', 'details': 'NA document found in uploaded documents'},
+    'format_passed': {'step': 'Format Check', 'status': 'PASSED', 'details': 'Document format is acceptable'},
+    'format_failed': {'step': 'Format Check', 'status': 'FAILED', 'details': 'Unsupported document format'},
+    'size_passed': {'step': 'Size Check', 'status': 'PASSED', 'details': 'Document size is within limits'},
+    'size_failed': {'step': 'Size Check', 'status': 'FAILED', 'details': 'Document exceeds size limits'},
+    'size_assumed': {'step': 'Size Check', 'status': 'PASSED', 'details': 'Document size assumed acceptable'},
+    'cross_verification_missing': {
+        'step': 'Cross-Verification',
+        'status': 'WARNING',
+        'details': 'No related property documents found for cross-verification'
+    },
+    'property_type_passed': {
+        'step': 'Property Type Validation',
+        'status': 'PASSED',
+        'details': 'Property marked as non-agricultural in application'
+    },
+    'property_type_warning': {
+        'step': 'Property Type Validation',
+        'status': 'WARNING',
+        'details': 'Property type not specified as non-agricultural'
+    },
+    'content_review': {
+        'step': 'Content Validation',
+        'status': 'PENDING_MANUAL_REVIEW',
+        'details': 'Requires manual review for content accuracy and validity'
+    },
+}
+
 def verify_na_document(document, application):
     """Verify Non-Agricultural document with improved logic"""
-    verification_steps = []
     issues = []
     risk_score = 0.0
     
     try:
         # Step 1: Document Presence Check
-        verification_steps.append({
-            'step': 'Document Presence',
-            'status': 'PASSED',
-            'details': 'NA document found in uploaded documents'
-        })
+        verification_steps = [NA_VERIFICATION_STEPS['presence']]
         
         # Step 2: Document Format Check
-        if document.filename and document.filename.lower().endswith(('.pdf', '.jpg', '.jpeg', '.png')):
-            verification_steps.append({
-                'step': 'Format Check',
-                'status': 'PASSED',
-                'details': 'Document format is acceptable'
-            })
+        if has_allowed_extension(document.original_filename):
+            verification_steps.append(NA_VERIFICATION_STEPS['format_passed'])
         else:
-            verification_steps.append({
-                'step': 'Format Check',
-                'status': 'FAILED',
-                'details': 'Unsupported document format'
-            })
+            verification_steps.append(NA_VERIFICATION_STEPS['format_failed'])
             issues.append('Document format not supported')
             risk_score += 30
         
-        # Step 3: Document Size Check (if file_data exists)
-        if hasattr(document, 'file_data') and document.file_data:
-            if len(document.file_data) < 10 * 1024 * 1024:  # 10MB limit
-                verification_steps.append({
-                    'step': 'Size Check',
-                    'status': 'PASSED',
-                    'details': 'Document size is within limits'
-                })
+        # Step 3: Document Size Check (from the size recorded at upload)
+        file_size = getattr(document, 'file_size', None)
+        if file_size is not None:
+            if file_size < MAX_DOCUMENT_SIZE:
+                verification_steps.append(NA_VERIFICATION_STEPS['size_passed'])
             else:
-                verification_steps.append({
-                    'step': 'Size Check',
-                    'status': 'FAILED',
-                    'details': 'Document exceeds size limits'
-                })
+                verification_steps.append(NA_VERIFICATION_STEPS['size_failed'])
                 issues.append('Document size too large')
                 risk_score += 20
         else:
-            # If no file_data, assume size is acceptable
-            verification_steps.append({
-                'step': 'Size Check',
-                'status': 'PASSED',
-                'details': 'Document size assumed acceptable'
-            })
+            # If no size was recorded, assume size is acceptable
+            verification_steps.append(NA_VERIFICATION_STEPS['size_assumed'])
         
         # Step 4: Cross-verification with other property documents
-        property_docs = [doc for doc in application.documents 
-                        if doc.document_type in ['PROPERTY_VALUATION', 'LEGAL_CLEARANCE', 'PROPERTY_VALUATION_DOC']]
+        docs_by_type = documents_by_type(application)
+        property_doc_count = sum(len(docs_by_type.get(doc_type, ())) for doc_type in ('PROPERTY_VALUATION', 'LEGAL_CLEARANCE', 'PROPERTY_VALUATION_DOC'))
         
-        if property_docs:
+        if property_doc_count:
             verification_steps.append({
                 'step': 'Cross-Verification',
                 'status': 'PASSED',
-                'details': f'Found {len(property_docs)} related property documents'
+                'details': f'Found {property_doc_count} related property documents'
             })
         else:
-            verification_steps.append({
-                'step': 'Cross-Verification',
-                'status': 'WARNING',
-                'details': 'No related property documents found for cross-verification'
-            })
+            verification_steps.append(NA_VERIFICATION_STEPS['cross_verification_missing'])
             issues.append('Missing supporting property documents')
             risk_score += 15
         
         # Step 5: Property Type Validation
         if application.is_non_agricultural:
-            verification_steps.append({
-                'step': 'Property Type Validation',
-                'status': 'PASSED',
-                'details': 'Property marked as non-agricultural in application'
-            })
+            verification_steps.append(NA_VERIFICATION_STEPS['property_type_passed'])
         else:
-            verification_steps.append({
-                'step': 'Property Type Validation',
-                'status': 'WARNING',
-                'details': 'Property type not specified as non-agricultural'
-            })
+            verification_steps.append(NA_VERIFICATION_STEPS['property_type_warning'])
             risk_score += 10
         
         # Step 6: Basic Content Validation
-        verification_steps.append({
-            'step': 'Content Validation',
-            'status': 'PENDING_MANUAL_REVIEW',
-            'details': 'Requires manual review for content accuracy and validity'
-        })
+        verification_steps.append(NA_VERIFICATION_STEPS['content_review'])
         
         # Calculate final status based on risk score
         if risk_score == 0:
@@ -918,8 +946,8 @@ def verify_na_document(document, application):
             'verification_steps': verification_steps,
             'document_id': document.id,
             'document_type': document.document_type,
-            'filename': document.filename,
-            'verified_at': datetime.utcnow().isoformat(),
+            'filename': document.original_filename,
+            'verified_at': get_verification_timestamp(),
             'recommendation': 'Document appears valid but requires final manual confirmation'
         }
         
@@ -938,8 +966,9 @@ def verify_na_document(document, application):
             'recommendation': 'Retry verification or contact support'
         }
 
-def verify_single_document(document, doc_type):
+def verify_single_document(document, doc_type, verified_at=None):
     """Verify a single document"""
+    verified_at = verified_at or get_verification_timestamp()
     try:
         # Basic verification logic for each document type
         risk_score = 10  # Default low risk for present documents
@@ -948,10 +977,10 @@ def verify_single_document(document, doc_type):
         # Type-specific validations
         if doc_type == 'NON_AGRICULTURAL_DECLARATION':
             # NA document specific checks
-            if not document.filename.lower().endswith(('.pdf', '.jpg', '.jpeg', '.png')):
+            if not has_allowed_extension(document.original_filename):
                 issues.append('Invalid file format')
                 risk_score = 50
-            if len(document.file_data) > 10 * 1024 * 1024:
+            if (getattr(document, 'file_size', None) or 0) > MAX_DOCUMENT_SIZE:
                 issues.append('File size too large')
                 risk_score = 40
         
@@ -961,7 +990,7 @@ def verify_single_document(document, doc_type):
             'status': 'VERIFIED' if risk_score <= 20 else 'REVIEW_NEEDED',
             'risk_score': risk_score,
             'issues': issues,
-            'verified_at': datetime.utcnow().isoformat()
+            'verified_at': verified_at
         }
     except Exception as e:
         app.logger.error(f"Error verifying document {doc_type}: {e}")
@@ -971,9 +1000,19 @@ def verify_single_document(document, doc_type):
             'status': 'ERROR',
             'risk_score': 100.0,
             'issues': ['Verification error'],
-            'verified_at': datetime.utcnow().isoformat()
+            'verified_at': verified_at
         }
 
+# Document types checked by verify_all_documents -> display name
+VERIFIED_DOCUMENT_TYPES = {
+    'BANK_STATEMENTS': 'Bank Statements',
+    'SALARY_SLIPS': 'Salary Slips', 
+    'KYC_DOCS': 'KYC Documents',
+    'PROPERTY_VALUATION': 'Property Valuation',
+    'LEGAL_CLEARANCE': 'Legal Clearance',
+    'NON_AGRICULTURAL_DECLARATION': 'Non-Agricultural Declaration'
+}
+
 def verify_all_documents(application):
     """Verify all documents including NA document"""
     documents_report = {
@@ -987,27 +1026,24 @@ def verify_all_documents(application):
     total_risk = 0
     document_count = 0
     verified_count = 0
+    issues_found = 0
     
     # Verify each document type
-    document_types = {
-        'BANK_STATEMENTS': 'Bank Statements',
-        'SALARY_SLIPS': 'Salary Slips', 
-        'KYC_DOCS': 'KYC Documents',
-        'PROPERTY_VALUATION': 'Property Valuation',
-        'LEGAL_CLEARANCE': 'Legal Clearance',
-        'NON_AGRICULTURAL_DECLARATION': 'Non-Agricultural Declaration'
-    }
-    
-    for doc_type, doc_name in document_types.items():
-        document = next((doc for doc in application.documents if doc.document_type == doc_type), None)
+    verified_at = get_verification_timestamp()
+    docs_by_type = documents_by_type(application)
+    for doc_type, doc_name in VERIFIED_DOCUMENT_TYPES.items():
+        documents = docs_by_type.get(doc_type)
+        document = documents[0] if documents else None
         
         if document:
-            doc_report = verify_single_document(document, doc_type)
+            doc_report = verify_single_document(document, doc_type, verified_at)
             documents_report['documents'].append(doc_report)
             total_risk += doc_report.get('risk_score', 0)
             document_count += 1
             if doc_report.get('status') == 'VERIFIED':
                 verified_count += 1
+            if doc_report.get('issues'):
+                issues_found += 1
         else:
             # Document missing
             documents_report['documents'].append({
@@ -1019,6 +1055,7 @@ def verify_all_documents(application):
             })
             total_risk += 100
             document_count += 1
+            issues_found += 1
     
     # Calculate overall status
     if document_count > 0:
@@ -1034,17 +1071,25 @@ def verify_all_documents(application):
             documents_report['overall_status'] = 'PENDING'
             documents_report['verification_summary'] = 'Multiple documents require verification'
     
-    documents_report['issues_found'] = len([doc for doc in documents_report['documents'] 
-                                          if doc.get('issues')])
+    documents_report['issues_found'] = issues_found
     
     return documents_report
 
+# Verification summary bands as (risk level, recommended status); risk <= bound stays in the band
+SUMMARY_RISK_BOUNDS = (25, 50, 75)
+SUMMARY_RISK_BANDS = (
+    ('VERY_LOW', 'APPROVED'),
+    ('LOW', 'APPROVED'),
+    ('MEDIUM', 'UNDER_REVIEW'),
+    ('HIGH', 'PENDING'),
+)
+
 def generate_verification_summary(application):
     """Generate comprehensive verification summary including NA document"""
     # Get all verification reports
-    employment_report = safe_json_loads(application.employment_verification_report) or {}
-    document_report = safe_json_loads(application.document_verification_report) or {}
-    na_report = safe_json_loads(application.na_document_verification) or {}
+    employment_report = load_json_field(application, 'employment_verification_report') or {}
+    document_report = load_json_field(application, 'document_verification_report') or {}
+    na_report = load_json_field(application, 'na_document_verification') or {}
     
     # Calculate overall risk score (weighted average)
     weights = {
@@ -1057,6 +1102,10 @@ def generate_verification_summary(application):
     document_risk = document_report.get('overall_risk_score', 0) or 0
     na_risk = na_report.get('risk_score', 0) or 0
     
+    employment_status = employment_report.get('status', 'PENDING')
+    document_status = document_report.get('overall_status', 'PENDING')
+    na_status = na_report.get('status', 'PENDING')
+    
     overall_risk = (
         employment_risk * weights['employment'] +
         document_risk * weights['documents'] + 
@@ -1064,18 +1113,7 @@ def generate_verification_summary(application):
     )
     
     # Determine overall status
-    if overall_risk <= 25:
-        risk_level = 'VERY_LOW'
-        status = 'APPROVED'
-    elif overall_risk <= 50:
-        risk_level = 'LOW'
-        status = 'APPROVED'
-    elif overall_risk <= 75:
-        risk_level = 'MEDIUM'
-        status = 'UNDER_REVIEW'
-    else:
-        risk_level = 'HIGH'
-        status = 'PENDING'
+    risk_level, status = SUMMARY_RISK_BANDS[bisect_left(SUMMARY_RISK_BOUNDS, overall_risk)]
     
     summary = {
         'overall_risk_score': overall_risk,
@@ -1087,100 +1125,99 @@ def generate_verification_summary(application):
             'na_document': na_risk
         },
         'verification_status': {
-            'employment': employment_report.get('status', 'PENDING'),
-            'documents': document_report.get('overall_status', 'PENDING'),
-            'na_document': na_report.get('status', 'PENDING')
+            'employment': employment_status,
+            'documents': document_status,
+            'na_document': na_status
         },
-        'summary_text': f"Overall risk: {risk_level}. Employment: {employment_report.get('status')}, "
-                       f"Documents: {document_report.get('overall_status')}, "
-                       f"NA Document: {na_report.get('status')}",
-        'timestamp': datetime.utcnow().isoformat()
+        'summary_text': f"Overall risk: {risk_level}. Employment: {employment_status}, "
+                       f"Documents: {document_status}, NA Document: {na_status}",
+        'timestamp': get_verification_timestamp()
     }
     
     return summary
 
 def get_fraud_report(application):
     """Get fraud detection analysis report"""
-    try:
-        # Simple fraud detection logic
-        risk_factors = []
+    # Simple fraud detection logic
+    risk_factors = []
+    
+    # Check for basic fraud indicators
+    if application.cibil_score and application.cibil_score < 300:
+        risk_factors.append("Unusually low CIBIL score")
         
-        # Check for basic fraud indicators
-        if application.cibil_score and application.cibil_score < 300:
-            risk_factors.append("Unusually low CIBIL score")
-            
-        if application.monthly_salary and application.monthly_salary > 500000:
-            risk_factors.append("Unusually high salary declaration")
-            
-        risk_score = min(len(risk_factors) * 25, 100)
+    if application.monthly_salary and application.monthly_salary > 500000:
+        risk_factors.append("Unusually high salary declaration")
         
-        return {
-            'status': 'LOW_RISK' if risk_score < 50 else 'MEDIUM_RISK' if risk_score < 75 else 'HIGH_RISK',
-            'risk_score': risk_score,
-            'risk_factors': risk_factors,
-            'verification_status': 'PASSED' if risk_score < 50 else 'REVIEW_NEEDED'
-        }
-    except Exception as e:
-        app.logger.error(f"Error generating fraud report: {e}")
-        return {}
+    risk_score = min(len(risk_factors) * 25, 100)
+    
+    return {
+        'status': 'LOW_RISK' if risk_score < 50 else 'MEDIUM_RISK' if risk_score < 75 else 'HIGH_RISK',
+        'risk_score': risk_score,
+        'risk_factors': risk_factors,
+        'verification_status': 'PASSED' if risk_score < 50 else 'REVIEW_NEEDED'
+    }
 
 def convert_to_old_format(new_analysis):
     """Convert new instant decision format to old template-compatible format"""
-    old_format = {}
-    
     # Map risk_score to financial_health_score (inverted)
-    if 'risk_score' in new_analysis:
+    risk_score = new_analysis.get('risk_score')
+    if risk_score is not None:
         # Convert risk score (0-100, lower is better) to health score (0-100, higher is better)
-        old_format['financial_health_score'] = max(0, 100 - new_analysis['risk_score'])
+        financial_health_score = max(0, 100 - risk_score)
+    else:
+        financial_health_score = 75
     
     # Map key_factors to risk_factors
-    if 'key_factors' in new_analysis:
-        risk_factors = []
-        for factor, rating in new_analysis['key_factors'].items():
-            risk_factors.append(f"{factor.replace('_', ' ').title()}: {rating}")
-        old_format['risk_factors'] = risk_factors
-    
-    # Map recommendation
-    if 'recommendation' in new_analysis:
-        old_format['recommendation'] = new_analysis['recommendation']
-    
-    # Add confidence score if available
-    if 'confidence_score' in new_analysis:
-        old_format['confidence_score'] = new_analysis['confidence_score']
-    
-    # Ensure we have all required fields with defaults
-    old_format.setdefault('financial_health_score', 75)
-    old_format.setdefault('risk_factors', ['No risk factors identified'])
-    old_format.setdefault('recommendation', 'REVIEW')
-    old_format.setdefault('confidence_score', 0.85)
+    key_factors = new_analysis.get('key_factors')
+    if key_factors is not None:
+        risk_factors = [f"{factor.replace('_', ' ').title()}: {rating}" for factor, rating in key_factors.items()]
+    else:
+        risk_factors = ['No risk factors identified']
     
-    return old_format
+    # Recommendation and confidence score fall back to the template defaults
+    return {
+        'financial_health_score': financial_health_score,
+        'risk_factors': risk_factors,
+        'recommendation': new_analysis.get('recommendation', 'REVIEW'),
+        'confidence_score': new_analysis.get('confidence_score', 0.85)
+    }
+
+# Auto-fill parser key -> application form field, copied as-is
+AUTOFILL_DIRECT_MAPPINGS = (
+    ('first_name', 'first_name'),
+    ('last_name', 'last_name'),
+    ('email', 'email'),
+    ('gender', 'gender'),
+    ('address', 'current_address'),
+    ('aadhaar', 'aadhar_number'),
+    ('pan', 'pan_number'),
+    ('salary', 'monthly_salary'),
+    ('company', 'company_name'),
+    ('existing_loan', 'existing_emi'),
+    ('cibil', 'cibil_score'),
+    ('loan_amount', 'loan_amount'),
+    ('property_value', 'property_valuation'),
+    ('property_address', 'property_address'),
+)
+
+def parse_uploaded_text(file):
+    """Autofill fields parsed from an uploaded UTF-8 text file, decoded line by line from the upload stream"""
+    text_stream = io.TextIOWrapper(file.stream, encoding='utf-8', newline='\n')
+    try:
+        return autofill_service.parse_lines(text_stream)
+    finally:
+        # Leave the underlying upload stream open for werkzeug to clean up
+        text_stream.detach()
 
 def format_data_for_application(parsed_data):
     """Convert parsed data to match your application form fields"""
     formatted = {}
     
     # Direct mappings
-    direct_mappings = {
-        'first_name': 'first_name',
-        'last_name': 'last_name',
-        'email': 'email',
-        'gender': 'gender',
-        'address': 'current_address',
-        'aadhaar': 'aadhar_number',
-        'pan': 'pan_number',
-        'salary': 'monthly_salary',
-        'company': 'company_name',
-        'existing_loan': 'existing_emi',
-        'cibil': 'cibil_score',
-        'loan_amount': 'loan_amount',
-        'property_value': 'property_valuation',
-        'property_address': 'property_address'
-    }
-    
-    for source_key, target_key in direct_mappings.items():
-        if source_key in parsed_data and parsed_data[source_key] is not None:
-            formatted[target_key] = parsed_data[source_key]
+    for source_key, target_key in AUTOFILL_DIRECT_MAPPINGS:
+        value = parsed_data.get(source_key)
+        if value is not None:
+            formatted[target_key] = value
     
     # Boolean field conversions
     if 'residence_status' in parsed_data:
@@ -1199,44 +1236,42 @@ def format_data_for_application(parsed_data):
     
     return formatted
 
-def reprocess_old_application(application):
-    """Reprocess old applications to generate missing verification data"""
+def reprocess_old_application(application, commit=True):
+    """Reprocess old applications to generate missing verification data; commit=False leaves the commit to the caller"""
     try:
         app.logger.info(f"Reprocessing old application: {application.id}")
         
         # Get documents for the application
         documents = application.documents
         
-        # Initialize NA document verification if missing
+        # Initialize NA document verification if missing (saved by the commit below)
         if application.na_document_verification is None:
-            initialize_na_verification(application.id)
+            initialize_na_verification(application.id, commit=False)
         
         # Generate missing verification data using instant processing
-        decision_result = instant_loan_decision(application, documents)
+        decision_result = cached_loan_decision(application, documents)
         
         # Update application with new data
         if application.overall_risk_score is None:
             application.overall_risk_score = decision_result['risk_score']
         
         if application.ai_analysis_report is None:
-            application.ai_analysis_report = json.dumps(decision_result['ai_analysis'])
+            application.ai_analysis_report = report_json_dumps(decision_result['ai_analysis'])
         
         if application.employment_verification_report is None:
-            application.employment_verification_report = json.dumps(decision_result['employment_verification'])
+            store_json_field(application, 'employment_verification_report', decision_result['employment_verification'])
             application.employment_verification_status = decision_result['employment_verification'].get('employment_status', 'PROCESSED')
         
         if application.document_verification_report is None:
-            application.document_verification_report = json.dumps(decision_result['document_verification'])
+            store_json_field(application, 'document_verification_report', decision_result['document_verification'])
             application.document_verification_status = decision_result['document_verification'].get('overall_status', 'PROCESSED')
         
-        if application.verification_summary is None:
-            application.verification_summary = json.dumps(decision_result['verification_summary'])
-        
-        # Generate comprehensive verification summary
+        # Generate comprehensive verification summary (replaces any stored summary)
         verification_summary = generate_verification_summary(application)
-        application.verification_summary = json.dumps(verification_summary)
+        application.verification_summary = report_json_dumps(verification_summary)
         
-        db.session.commit()
+        if commit:
+            db.session.commit()
         app.logger.info(f"Successfully reprocessed application: {application.id}")
         
         return True
@@ -1246,36 +1281,88 @@ def reprocess_old_application(application):
         db.session.rollback()
         return False
 
+# An application that failed to reprocess is skipped until it changes or this many seconds pass
+REPROCESS_FAILURE_TIMEOUT = 300
+
+def reprocess_failure_key(application):
+    """Cache key marking a failed reprocess of this version of the application"""
+    return f'reprocess-failed:{application.id}:{application.updated_at}'
+
+def reprocess_all_old(batch_size=500):
+    """Reprocess pending applications without a risk score, committing once per batch; returns the fixed count"""
+    fixed_count = 0
+    last_id = ''
+    
+    while True:
+        # Keyset pagination, so applications that fail to reprocess are not fetched again
+        batch = Application.query.options(
+            selectinload(Application.documents)
+        ).filter(
+            Application.status == 'PENDING',
+            Application.overall_risk_score.is_(None),
+            Application.id > last_id
+        ).order_by(Application.id).limit(batch_size).all()
+        if not batch:
+            return fixed_count
+        last_id = batch[-1].id
+        batch = [application for application in batch if not cache.get(reprocess_failure_key(application))]
+        batch_ids = [application.id for application in batch]
+        
+        if all(reprocess_old_application(application, commit=False) for application in batch):
+            db.session.commit()
+            fixed_count += len(batch)
+            continue
+        
+        # A failure rolled back the whole batch: redo it one application per commit
+        for application_id in batch_ids:
+            application = db.session.get(Application, application_id)
+            if application is not None and application.overall_risk_score is None:
+                failure_key = reprocess_failure_key(application)
+                if reprocess_old_application(application):
+                    fixed_count += 1
+                else:
+                    cache.set(failure_key, True, timeout=REPROCESS_FAILURE_TIMEOUT)
+
 # Helper functions for PDF generation
 def get_application_with_permission(app_id):
     """Get application with permission check"""
     is_admin = 'admin_id' in session
     if is_admin:
-        return Application.query.filter_by(id=app_id).first()
+        return get_application(app_id)
     else:
-        return Application.query.filter_by(id=app_id, user_id=session['user_id']).first()
+        return get_user_application(app_id, session['user_id'])
+
+# Font discovery runs once per process instead of once per report
+PDF_FONT_CONFIG = FontConfiguration() if WEASYPRINT_AVAILABLE else None
+HTML_PDF_AVAILABLE = PLAYWRIGHT_AVAILABLE or WEASYPRINT_AVAILABLE
+
+def render_html_pdf(html_content):
+    """Render HTML to PDF into an in-memory buffer, with headless Chromium when available, else WeasyPrint"""
+    if PLAYWRIGHT_AVAILABLE:
+        try:
+            return io.BytesIO(render_pdf_chromium(html_content))
+        except Exception as e:
+            if not WEASYPRINT_AVAILABLE:
+                raise
+            app.logger.warning(f"Chromium PDF rendering failed, falling back to WeasyPrint: {str(e)}")
+    
+    buffer = io.BytesIO()
+    HTML(string=html_content).write_pdf(target=buffer, font_config=PDF_FONT_CONFIG)
+    buffer.seek(0)
+    return buffer
 
 def generate_pdf_response(html_content, filename):
     """Generate PDF response from HTML content"""
-    try:
-        from weasyprint import HTML
-        import tempfile
-        
-        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp_file:
-            pdf_path = tmp_file.name
-        
-        HTML(string=html_content).write_pdf(pdf_path)
-        
-        return send_file(
-            pdf_path,
-            as_attachment=True,
-            download_name=f'{filename}.pdf',
-            mimetype='application/pdf'
-        )
-        
-    except ImportError:
+    if not HTML_PDF_AVAILABLE:
         # Fallback to basic PDF generation
         return generate_basic_pdf_fallback(html_content, filename)
+    
+    return send_file(
+        render_html_pdf(html_content),
+        as_attachment=True,
+        download_name=f'{filename}.pdf',
+        mimetype='application/pdf'
+    )
 
 def generate_basic_pdf_fallback(html_content, filename):
     """Basic PDF fallback using reportlab"""
@@ -1362,6 +1449,7 @@ def login():
                         db.session.commit()
                     session['user_id'] = user.id
                     session['user_logged_in'] = True
+                    session['mobile_number'] = user.mobile_number
                     session.pop('mobile_for_verification', None)
                     flash('Login successful!', 'success')
                     return redirect(url_for('dashboard'))
@@ -1379,9 +1467,51 @@ def dashboard():
     
     # Regular user dashboard
     user_id = session['user_id']
-    user_applications = Application.query.filter_by(user_id=user_id).order_by(Application.created_at.desc()).all()
+    # Only the columns the table shows; the AI report itself is reduced to a flag
+    user_applications = db.session.query(
+        Application.id,
+        Application.status,
+        Application.loan_amount,
+        Application.overall_risk_score,
+        Application.created_at,
+        (func.coalesce(Application.ai_verification_report, '') != '').label('has_ai_verification_report')
+    ).filter_by(user_id=user_id).order_by(Application.created_at.desc()).all()
     return render_template('dashboard.html', applications=user_applications)
 
+def form_flag(value):
+    """Checkbox/radio values arrive as the strings 'True'/'False'"""
+    return value == 'True'
+
+# Apply form field -> (coercion or None to keep the string, required)
+APPLY_FORM_FIELDS = (
+    ('first_name', None, True),
+    ('last_name', None, True),
+    ('email', None, True),
+    ('gender', None, False),
+    ('current_address', None, False),
+    ('is_rented', form_flag, False),
+    ('has_own_property', form_flag, False),
+    ('aadhar_number', None, True),
+    ('pan_number', None, True),
+    ('monthly_salary', float, True),
+    ('company_name', None, False),
+    ('existing_emi', float, True),
+    ('cibil_score', int, True),
+    ('loan_amount', float, True),
+    ('property_valuation', float, True),
+    ('property_address', None, False),
+    ('is_non_agricultural', form_flag, False),
+    ('has_existing_mortgage', form_flag, False),
+)
+
+def parse_application_form(form):
+    """Application column values from the apply form; a missing required field raises like form[...] does"""
+    values = {}
+    for field_name, convert, required in APPLY_FORM_FIELDS:
+        value = form[field_name] if required else form.get(field_name)
+        values[field_name] = convert(value) if convert else value
+    return values
+
 @app.route('/apply', methods=['GET', 'POST'])
 @login_required
 def apply():
@@ -1393,37 +1523,15 @@ def apply():
     if request.method == 'POST':
         try:
             # Process form submission
-            is_rented = request.form.get('is_rented') == 'True'
-            has_own_property = request.form.get('has_own_property') == 'True'
-            is_non_agricultural = request.form.get('is_non_agricultural') == 'True'
-            has_existing_mortgage = request.form.get('has_existing_mortgage') == 'True'
-            
             new_app = Application(
                 id=storage_service.generate_unique_app_id(),
                 user_id=session['user_id'],
-                first_name=request.form['first_name'],
-                last_name=request.form['last_name'],
-                email=request.form['email'],
-                gender=request.form.get('gender'),
-                current_address=request.form.get('current_address'),
-                is_rented=is_rented,
-                has_own_property=has_own_property,
-                aadhar_number=request.form['aadhar_number'],
-                pan_number=request.form['pan_number'],
-                monthly_salary=float(request.form['monthly_salary']),
-                company_name=request.form.get('company_name'),
-                existing_emi=float(request.form['existing_emi']),
-                cibil_score=int(request.form['cibil_score']),
-                loan_amount=float(request.form['loan_amount']),
-                property_valuation=float(request.form['property_valuation']),
-                property_address=request.form.get('property_address'),
-                is_non_agricultural=is_non_agricultural,
-                has_existing_mortgage=has_existing_mortgage
+                **parse_application_form(request.form)
             )
             db.session.add(new_app)
             
-            user = User.query.get(session['user_id'])
-            if user is None:
+            mobile_number = get_session_mobile_number()
+            if mobile_number is None:
                 flash('Your session has expired. Please log out and log in again.', 'danger')
                 return redirect(url_for('user_logout'))
 
@@ -1436,17 +1544,17 @@ def apply():
                 'legal_clearance': request.files.get('legal_clearance'),
                 'na_document': request.files.get('na_document'),  # NEW: NA document
             }
-            saved_docs = storage_service.save_application_documents(user.mobile_number, new_app.id, files_to_upload)
+            saved_docs = storage_service.save_application_documents(mobile_number, new_app.id, files_to_upload)
             for doc in saved_docs:
                 db.session.add(doc)
                 
             db.session.commit()
 
-            # Initialize NA document verification
-            initialize_na_verification(new_app.id)
+            # Initialize NA document verification (saved with the instant decision below)
+            initialize_na_verification(new_app.id, commit=False)
             
             # INSTANT AI-POWERED DECISION MAKING
-            decision_result = instant_loan_decision(new_app, saved_docs)
+            decision_result = cached_loan_decision(new_app, saved_docs)
             
             # Update application with instant decision
             new_app.status = decision_result['status']
@@ -1456,41 +1564,30 @@ def apply():
             new_app.emi_amount = decision_result.get('emi_amount')
             
             # Save AI analysis and verification reports
-            new_app.ai_analysis_report = json.dumps(decision_result['ai_analysis'])
-            new_app.employment_verification_report = json.dumps(decision_result['employment_verification'])
-            new_app.document_verification_report = json.dumps(decision_result['document_verification'])
-            new_app.verification_summary = json.dumps(decision_result['verification_summary'])
+            new_app.ai_analysis_report = report_json_dumps(decision_result['ai_analysis'])
+            store_json_field(new_app, 'employment_verification_report', decision_result['employment_verification'])
+            store_json_field(new_app, 'document_verification_report', decision_result['document_verification'])
             
             # Set verification statuses
             new_app.employment_verification_status = decision_result['employment_verification'].get('employment_status', 'PENDING')
             new_app.document_verification_status = decision_result['document_verification'].get('overall_status', 'PENDING')
             
             # Save banking and fraud reports
-            new_app.banking_analysis_report = json.dumps(decision_result.get('banking_report', {}))
-            new_app.fraud_detection_report = json.dumps(decision_result.get('fraud_report', {}))
+            new_app.banking_analysis_report = report_json_dumps(decision_result.get('banking_report', {}))
+            new_app.fraud_detection_report = report_json_dumps(decision_result.get('fraud_report', {}))
             
-            # Generate comprehensive verification summary
+            # Generate comprehensive verification summary (stored in place of the instant decision summary)
             verification_summary = generate_verification_summary(new_app)
-            new_app.verification_summary = json.dumps(verification_summary)
+            new_app.verification_summary = report_json_dumps(verification_summary)
             
             # Create EMI records if approved
             if new_app.status == 'APPROVED' and new_app.emi_amount:
-                EMI.query.filter_by(application_id=new_app.id).delete()
-                for i in range(1, new_app.loan_term_years * 12 + 1):
-                    due_date = datetime.utcnow().date() + relativedelta(months=i)
-                    new_emi_record = EMI(
-                        application_id=new_app.id,
-                        emi_number=i,
-                        due_date=due_date,
-                        amount_due=new_app.emi_amount,
-                        status='DUE'
-                    )
-                    db.session.add(new_emi_record)
+                replace_emi_records(new_app.id, new_app.emi_amount, new_app.loan_term_years * 12)
             
             db.session.commit()
             
-            # Send instant notification
-            notification_service.send_decision_notification(new_app, decision_result['reason'])
+            # Send instant notification from the background worker, after the commit above
+            submit_emis_and_notify(new_app.id, decision_result['reason'])
             
             flash(f'Application #{new_app.id} processed instantly! Decision: {new_app.status}', 'success')
             return redirect(url_for('application_result', app_id=new_app.id))
@@ -1516,8 +1613,7 @@ def auto_fill():
             return jsonify({'success': False, 'error': 'No file selected'})
         
         if file and file.filename.endswith('.txt'):
-            content = file.read().decode('utf-8')
-            parsed_data = autofill_service.parse_text_data(content)
+            parsed_data = parse_uploaded_text(file)
             
             # Convert to your application model format
             formatted_data = format_data_for_application(parsed_data)
@@ -1534,28 +1630,20 @@ def auto_fill():
         app.logger.error(f"Auto-fill error: {str(e)}")
         return jsonify({'success': False, 'error': f'Error processing file: {str(e)}'})
 
-@app.route('/status/<app_id>')
-@login_required
-def status(app_id):
-    try:
-        # Check if current user is admin
-        is_admin = 'admin_id' in session or session.get('admin_logged_in', False)
-        
-        # Fetch application based on user type
-        if is_admin:
-            application = Application.query.filter_by(id=app_id).first()
-            if not application:
-                flash('Application not found.', 'error')
-                return redirect(url_for('admin.dashboard'))
-        else:
-            application = Application.query.filter_by(id=app_id, user_id=session['user_id']).first()
-            if not application:
-                flash('Application not found or you do not have permission to view it.', 'error')
-                return redirect(url_for('dashboard'))
-        
-        # Generate AI verification data if not exists
-        if not application.ai_verification_report:
-            # Trigger AI analysis
+# AI verification for the status page runs off the request thread, at most once per application at a time
+ai_verification_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='ai-verification')
+ai_verification_pending = set()
+ai_verification_lock = threading.Lock()
+
+def run_ai_verification(application_id):
+    """Background task: run the AI verification analysis and store its report"""
+    with app.app_context():
+        try:
+            application = db.session.get(Application, application_id)
+            # Another request may have produced the report while this task was queued
+            if not application or application.ai_verification_report:
+                return
+            
             from services.ai_analysis_engine import CasaFlowAIAnalyzer
             analyzer = CasaFlowAIAnalyzer()
             
@@ -1577,20 +1665,58 @@ def status(app_id):
             
             # Run AI verification
             verification_result = analyzer._run_ai_verification_analysis(app_data)
-            application.ai_verification_report = json.dumps(verification_result)
+            application.ai_verification_report = report_json_dumps(verification_result)
             db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            app.logger.error(f"AI verification failed for {application_id}: {str(e)}")
+        finally:
+            with ai_verification_lock:
+                ai_verification_pending.discard(application_id)
+
+def submit_ai_verification(application_id):
+    """Queue run_ai_verification unless one is already pending for this application"""
+    with ai_verification_lock:
+        if application_id in ai_verification_pending:
+            return False
+        ai_verification_pending.add(application_id)
+    ai_verification_executor.submit(run_ai_verification, application_id)
+    return True
+
+@app.route('/status/<app_id>')
+@login_required
+def status(app_id):
+    try:
+        # Check if current user is admin
+        is_admin = 'admin_id' in session or session.get('admin_logged_in', False)
+        
+        # Fetch application based on user type (the page lists its documents)
+        if is_admin:
+            application = get_application(app_id, with_documents=True)
+            if not application:
+                flash('Application not found.', 'error')
+                return redirect(url_for('admin.dashboard'))
+        else:
+            application = get_user_application(app_id, session['user_id'], with_documents=True)
+            if not application:
+                flash('Application not found or you do not have permission to view it.', 'error')
+                return redirect(url_for('dashboard'))
+        
+        # Generate AI verification data in the background if not exists; the page renders without it
+        if not application.ai_verification_report:
+            submit_ai_verification(application.id)
         
         # Parse AI verification report
-        verification_analysis = json.loads(application.ai_verification_report) if application.ai_verification_report else None
+        verification_analysis = load_json_field(application, 'ai_verification_report') if application.ai_verification_report else None
         
         # Load other reports (your existing code)
-        banking_report = safe_json_loads(application.banking_analysis_report)
-        fraud_report = safe_json_loads(application.fraud_detection_report)
-        credit_report = safe_json_loads(application.ai_analysis_report)
-        employment_report = safe_json_loads(application.employment_verification_report)
-        document_report = safe_json_loads(application.document_verification_report)
-        na_report = safe_json_loads(application.na_document_verification)
-        verification_summary = safe_json_loads(application.verification_summary)
+        banking_report = load_json_field(application, 'banking_analysis_report')
+        fraud_report = load_json_field(application, 'fraud_detection_report')
+        credit_report = load_json_field(application, 'ai_analysis_report')
+        employment_report = load_json_field(application, 'employment_verification_report')
+        document_report = load_json_field(application, 'document_verification_report')
+        na_report = load_json_field(application, 'na_document_verification')
+        verification_summary = load_json_field(application, 'verification_summary')
 
         # Calculate amortization schedule if approved
         amortization_schedule = []
@@ -1635,9 +1761,9 @@ def fix_application(app_id):
         is_admin = 'admin_id' in session or session.get('admin_logged_in', False)
         
         if is_admin:
-            application = Application.query.filter_by(id=app_id).first()
+            application = get_application(app_id, with_documents=True)
         else:
-            application = Application.query.filter_by(id=app_id, user_id=session['user_id']).first()
+            application = get_user_application(app_id, session['user_id'], with_documents=True)
         
         if not application:
             flash('Application not found.', 'error')
@@ -1666,13 +1792,7 @@ def fix_all_pending():
             flash('Admin access required.', 'error')
             return redirect(url_for('dashboard'))
         
-        pending_apps = Application.query.filter_by(status='PENDING').all()
-        fixed_count = 0
-        
-        for app in pending_apps:
-            if app.overall_risk_score is None:
-                if reprocess_old_application(app):
-                    fixed_count += 1
+        fixed_count = reprocess_all_old()
         
         flash(f'Successfully updated {fixed_count} pending applications with AI verification data!', 'success')
         return redirect(url_for('admin.dashboard'))
@@ -1681,6 +1801,57 @@ def fix_all_pending():
         flash(f'Error fixing applications: {str(e)}', 'error')
         return redirect(url_for('admin.dashboard'))
 
+# Loan agreement paragraph and table styles, built once and shared by every generated document
+PDF_STYLES = getSampleStyleSheet()
+AGREEMENT_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=PDF_STYLES['Heading1'],
+    fontSize=18,
+    textColor=colors.darkblue,
+    spaceAfter=30,
+    alignment=1  # Center
+)
+AGREEMENT_HEADING_STYLE = ParagraphStyle(
+    'Heading2',
+    parent=PDF_STYLES['Heading2'],
+    fontSize=14,
+    textColor=colors.darkblue,
+    spaceAfter=12
+)
+AGREEMENT_TABLE_STYLE = TableStyle([
+    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+])
+BORROWER_TABLE_STYLE = TableStyle([
+    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+])
+LOAN_TERMS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+])
+# Generated agreements stay in memory up to this size, then spill to a temporary file
+PDF_SPOOL_MAX_SIZE = 1 << 20  # 1MB
+AGREEMENT_NOTES = (
+    "1. This loan agreement is subject to the terms and conditions mentioned herein.",
+    "2. The borrower agrees to pay the EMI on or before the due date each month.",
+    "3. Late payments will attract a penalty of 2% per month on the overdue amount.",
+    "4. The borrower can prepay the loan after 12 months with applicable charges.",
+    "5. This agreement is governed by the laws of India.",
+)
+# Rendered as one flowable, one line per note
+AGREEMENT_NOTES_MARKUP = '<br/>'.join(AGREEMENT_NOTES)
+
 @app.route('/generate_loan_document/<app_id>')
 @login_required
 def generate_loan_document(app_id):
@@ -1691,10 +1862,10 @@ def generate_loan_document(app_id):
         
         if is_admin:
             # Admin can generate document for any application
-            application = Application.query.filter_by(id=app_id).first()
+            application = get_application(app_id)
         else:
             # Regular user can only generate for their own applications
-            application = Application.query.filter_by(id=app_id, user_id=session['user_id']).first()
+            application = get_user_application(app_id, session['user_id'])
         
         if not application:
             return "Application not found", 404
@@ -1706,33 +1877,16 @@ def generate_loan_document(app_id):
         loan_amount = application.loan_amount
         interest_rate = getattr(application, 'interest_rate', 8.5)
         tenure_months = getattr(application, 'loan_term_years', 5) * 12
-        emi = application.emi_amount or calculate_emi(loan_amount, interest_rate, tenure_months)
-        total_interest = calculate_total_interest(loan_amount, interest_rate, tenure_months)
-        total_payment = calculate_total_payment(loan_amount, interest_rate, tenure_months)
+        calculated_emi, total_interest, total_payment = calculate_loan_figures(loan_amount, interest_rate, tenure_months)
+        emi = application.emi_amount or calculated_emi
 
-        # Create PDF in memory
-        buffer = io.BytesIO()
+        # Create PDF in a spooled buffer
+        buffer = tempfile.SpooledTemporaryFile(max_size=PDF_SPOOL_MAX_SIZE)
         doc = SimpleDocTemplate(buffer, pagesize=A4, topMargin=0.5*inch)
         elements = []
-        styles = getSampleStyleSheet()
-        
-        # Custom styles
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=18,
-            textColor=colors.darkblue,
-            spaceAfter=30,
-            alignment=1  # Center
-        )
-        
-        heading_style = ParagraphStyle(
-            'Heading2',
-            parent=styles['Heading2'],
-            fontSize=14,
-            textColor=colors.darkblue,
-            spaceAfter=12
-        )
+        styles = PDF_STYLES
+        title_style = AGREEMENT_TITLE_STYLE
+        heading_style = AGREEMENT_HEADING_STYLE
         
         # Header
         elements.append(Paragraph("LOAN APPROVAL AGREEMENT", title_style))
@@ -1747,11 +1901,7 @@ def generate_loan_document(app_id):
         ]
         
         agreement_table = Table(agreement_data, colWidths=[2.5*inch, 3*inch])
-        agreement_table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ]))
+        agreement_table.setStyle(AGREEMENT_TABLE_STYLE)
         elements.append(agreement_table)
         elements.append(Spacer(1, 15))
         
@@ -1767,12 +1917,7 @@ def generate_loan_document(app_id):
         ]
         
         borrower_table = Table(borrower_data, colWidths=[2.5*inch, 3*inch])
-        borrower_table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
-        ]))
+        borrower_table.setStyle(BORROWER_TABLE_STYLE)
         elements.append(borrower_table)
         elements.append(Spacer(1, 15))
         
@@ -1791,33 +1936,13 @@ def generate_loan_document(app_id):
         ]
         
         loan_table = Table(loan_data, colWidths=[2.5*inch, 3*inch])
-        loan_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ]))
+        loan_table.setStyle(LOAN_TERMS_TABLE_STYLE)
         elements.append(loan_table)
         elements.append(Spacer(1, 20))
         
         # Important Notes
         elements.append(Paragraph("Important Notes", heading_style))
-        notes = [
-            "1. This loan agreement is subject to the terms and conditions mentioned herein.",
-            "2. The borrower agrees to pay the EMI on or before the due date each month.",
-            "3. Late payments will attract a penalty of 2% per month on the overdue amount.",
-            "4. The borrower can prepay the loan after 12 months with applicable charges.",
-            "5. This agreement is governed by the laws of India.",
-        ]
-        
-        for note in notes:
-            elements.append(Paragraph(note, styles['Normal']))
-            elements.append(Spacer(1, 5))
+        elements.append(Paragraph(AGREEMENT_NOTES_MARKUP, styles['Normal']))
         
         # Build PDF
         doc.build(elements)
@@ -1828,7 +1953,8 @@ def generate_loan_document(app_id):
             buffer,
             as_attachment=True,
             download_name=f'Loan_Agreement_{application.id}.pdf',
-            mimetype='application/pdf'
+            mimetype='application/pdf',
+            conditional=True
         )
         
     except Exception as e:
@@ -1844,9 +1970,9 @@ def force_na_verification(app_id):
         is_admin = 'admin_id' in session or session.get('admin_logged_in', False)
         
         if is_admin:
-            application = Application.query.filter_by(id=app_id).first()
+            application = get_application(app_id)
         else:
-            application = Application.query.filter_by(id=app_id, user_id=session['user_id']).first()
+            application = get_user_application(app_id, session['user_id'])
         
         if not application:
             flash('Application not found.', 'error')
@@ -1875,30 +2001,18 @@ def verification_report(app_id):
     
     if is_admin:
         # Admin can view any application
-        application = Application.query.filter_by(id=app_id).first()
+        application = get_application(app_id)
         if not application:
             flash('Application not found.', 'error')
             return redirect(url_for('admin.dashboard'))
     else:
         # Regular user can only view their own applications
-        application = Application.query.filter_by(id=app_id, user_id=session['user_id']).first_or_404()
-    
-    # Use safe JSON loading function for existing reports
-    def safe_json_loads(json_string, default=None):
-        if default is None:
-            default = {}
-        try:
-            if json_string and json_string.strip():
-                return json.loads(json_string)
-            else:
-                return default
-        except (json.JSONDecodeError, TypeError, AttributeError):
-            return default
+        application = get_user_application_or_404(app_id, session['user_id'])
     
     # Parse existing verification reports with safe loading
-    employment_report = safe_json_loads(application.employment_verification_report)
-    document_report = safe_json_loads(application.document_verification_report)
-    verification_summary = safe_json_loads(application.verification_summary)
+    employment_report = load_json_field(application, 'employment_verification_report')
+    document_report = load_json_field(application, 'document_verification_report')
+    verification_summary = load_json_field(application, 'verification_summary')
     
     # Get new verification reports from helper functions
     credit_report = get_credit_report(application) or {}
@@ -1906,7 +2020,7 @@ def verification_report(app_id):
     fraud_report = get_fraud_report(application) or {}
     
     # Handle NA document verification - use existing if available, otherwise create default
-    na_report = safe_json_loads(application.na_document_verification)
+    na_report = load_json_field(application, 'na_document_verification')
     if not na_report:
         na_report = {
             'status': 'PENDING',
@@ -1949,7 +2063,7 @@ def upload_na_document(app_id):
             flash('Admin users cannot upload documents.', 'error')
             return redirect(url_for('admin.dashboard'))
         
-        application = Application.query.filter_by(id=app_id, user_id=session['user_id']).first_or_404()
+        application = get_user_application_or_404(app_id, session['user_id'])
         
         if 'na_document' not in request.files:
             flash('No file selected', 'error')
@@ -1962,9 +2076,8 @@ def upload_na_document(app_id):
         
         if file:
             # Save NA document
-            user = User.query.get(session['user_id'])
             doc_info = storage_service.save_single_document(
-                user.mobile_number, application.id, file, 'na_document'
+                get_session_mobile_number(), application.id, file, 'na_document'
             )
             
             if doc_info:
@@ -1980,7 +2093,7 @@ def upload_na_document(app_id):
                 
                 # Re-verify NA document using our new function
                 na_report = verify_na_document(new_doc, application)
-                application.na_document_verification = json.dumps(na_report)
+                application.na_document_verification = report_json_dumps(na_report)
                 application.na_document_status = na_report.get('status', 'PENDING')
                 application.na_document_risk_score = na_report.get('risk_score', 0.0)
                 
@@ -2027,6 +2140,9 @@ def view_document(doc_id):
     except FileNotFoundError:
         abort(404)
 
+# Simulated CIBIL scores come from a dedicated generator, answered with a preformatted JSON body
+cibil_rng = random.Random()
+
 @app.route('/check_cibil', methods=['POST'])
 @login_required
 def check_cibil():
@@ -2034,8 +2150,8 @@ def check_cibil():
     if 'admin_id' in session:
         return jsonify({'error': 'Admin users cannot check CIBIL scores'}), 403
     
-    simulated_score = random.randint(300, 900)
-    return jsonify({'cibil_score': simulated_score})
+    simulated_score = cibil_rng.randint(300, 900)
+    return Response(b'{"cibil_score":%d}\n' % simulated_score, mimetype='application/json')
 
 @app.route('/chatbot', methods=['POST'])
 def chatbot():
@@ -2059,8 +2175,10 @@ def prefill_from_document():
     
     file = request.files['master_document']
     if file:
-        file_content = file.read().decode('utf-8')
-        extracted_data = advance_verification_service.parse_master_document(file_content)
+        try:
+            extracted_data = format_data_for_application(parse_uploaded_text(file))
+        except UnicodeDecodeError:
+            return jsonify({"error": "Please upload a UTF-8 text document"}), 400
         return jsonify(extracted_data)
         
     return jsonify({"error": "File processing failed"}), 500
@@ -2078,7 +2196,7 @@ def application_result():
         flash('No application specified', 'error')
         return redirect(url_for('dashboard'))
     
-    application = Application.query.filter_by(id=app_id, user_id=session['user_id']).first()
+    application = get_user_application(app_id, session['user_id'])
     if not application:
         flash('Application not found', 'error')
         return redirect(url_for('dashboard'))
@@ -2087,7 +2205,7 @@ def application_result():
     ai_analysis = None
     if application.ai_analysis_report:
         try:
-            ai_analysis = json.loads(application.ai_analysis_report)
+            ai_analysis = json_loads(application.ai_analysis_report)
             
             # Convert new instant decision format to old template format if needed
             if 'risk_score' in ai_analysis:
@@ -2109,16 +2227,16 @@ def ai_analysis_report(app_id):
     is_admin = 'admin_id' in session
     
     if is_admin:
-        application = Application.query.filter_by(id=app_id).first()
+        application = get_application(app_id)
         if not application:
             flash('Application not found.', 'error')
             return redirect(url_for('admin.dashboard'))
     else:
-        application = Application.query.filter_by(id=app_id, user_id=session['user_id']).first_or_404()
+        application = get_user_application_or_404(app_id, session['user_id'])
     
     # Parse AI analysis report
-    ai_analysis = safe_json_loads(application.ai_analysis_report)
-    verification_analysis = safe_json_loads(application.ai_verification_report)
+    ai_analysis = load_json_field(application, 'ai_analysis_report')
+    verification_analysis = load_json_field(application, 'ai_verification_report')
     
     return render_template('ai_analysis_report.html',
                          application=application,
@@ -2126,19 +2244,25 @@ def ai_analysis_report(app_id):
                          verification_analysis=verification_analysis,
                          is_admin=is_admin)
 
+# Columns listed on the reports dashboard; the JSON report columns are left in the database
+REPORT_LIST_COLUMNS = (
+    Application.id, Application.first_name, Application.last_name,
+    Application.status, Application.loan_amount, Application.created_at
+)
+
 @app.route('/application-reports')
 @login_required
 def application_reports():
     """Application Reports Dashboard"""
     if 'admin_id' in session:
         # Admin reports - all applications
-        applications = Application.query.order_by(Application.created_at.desc()).all()
+        applications = db.session.query(*REPORT_LIST_COLUMNS).order_by(Application.created_at.desc()).all()
         return render_template('application_reports.html', 
                              applications=applications, 
                              is_admin=True)
     else:
         # User reports - only their applications
-        applications = Application.query.filter_by(user_id=session['user_id']).order_by(Application.created_at.desc()).all()
+        applications = db.session.query(*REPORT_LIST_COLUMNS).filter_by(user_id=session['user_id']).order_by(Application.created_at.desc()).all()
         return render_template('application_reports.html', 
                              applications=applications, 
                              is_admin=False)
@@ -2165,7 +2289,7 @@ def report_sections():
 @login_required
 def debug_application(app_id):
     """Debug route to check application data"""
-    application = Application.query.filter_by(id=app_id, user_id=session['user_id']).first()
+    application = get_user_application(app_id, session['user_id'])
     if not application:
         return "Application not found", 404
     
@@ -2190,7 +2314,7 @@ def debug_application(app_id):
 def debug_pdf(app_id):
     """Debug PDF generation"""
     try:
-        application = Application.query.filter_by(id=app_id).first()
+        application = get_application(app_id, with_documents=True)
         if not application:
             return "Application not found", 404
         
@@ -2241,8 +2365,7 @@ def ai_analysis():
     try:
         data = request.get_json()
         
-        ai_engine = AIVerificationService()
-        result = ai_engine.generate_comprehensive_analysis(data)
+        result = ai_verification_service.generate_comprehensive_analysis(data)
         
         return jsonify(result)
         
@@ -2258,8 +2381,7 @@ def quick_assessment():
     try:
         data = request.get_json()
         
-        ai_engine = AIVerificationService()
-        result = ai_engine.quick_risk_assessment(data)
+        result = ai_verification_service.quick_risk_assessment(data)
         
         return jsonify(result)
         
@@ -2269,11 +2391,141 @@ def quick_assessment():
             'error': f'Quick assessment failed: {str(e)}'
         }), 500
 
+def build_kyc_reports(application):
+    """KYC verification sections shared by the comprehensive HTML and combined PDF reports"""
+    has_aadhar = bool(application.aadhar_number)
+    has_pan = bool(application.pan_number)
+    has_address = bool(application.current_address)
+    has_salary = bool(application.monthly_salary)
+    has_company = bool(application.company_name)
+    identity_verified = has_aadhar and has_pan
+    
+    return {
+        'identity_report': {
+            'status': 'VERIFIED' if identity_verified else 'PENDING',
+            'verification_checks': [
+                {
+                    'check_name': 'Aadhaar Verification',
+                    'status': 'PASSED' if has_aadhar else 'PENDING',
+                    'risk_level': 'LOW' if has_aadhar else 'HIGH',
+                    'details': 'Aadhaar number verified successfully' if has_aadhar else 'Aadhaar verification pending'
+                },
+                {
+                    'check_name': 'PAN Verification',
+                    'status': 'PASSED' if has_pan else 'PENDING',
+                    'risk_level': 'LOW' if has_pan else 'HIGH',
+                    'details': 'PAN number verified successfully' if has_pan else 'PAN verification pending'
+                }
+            ],
+            'recommendations': [
+                'Identity documents verified successfully'
+            ] if identity_verified else [
+                'Complete identity document verification'
+            ]
+        },
+        'address_report': {
+            'status': 'VERIFIED' if has_address else 'PENDING',
+            'verification_checks': [
+                {
+                    'check_name': 'Address Verification',
+                    'status': 'PASSED' if has_address else 'PENDING',
+                    'risk_level': 'LOW' if has_address else 'MEDIUM',
+                    'details': 'Current address verified' if has_address else 'Address verification required'
+                }
+            ],
+            'recommendations': [
+                'Address verification completed'
+            ] if has_address else [
+                'Provide complete current address for verification'
+            ]
+        },
+        'financial_report': {
+            'status': 'VERIFIED' if has_salary else 'PENDING',
+            'verification_checks': [
+                {
+                    'check_name': 'Income Verification',
+                    'status': 'PASSED' if has_salary else 'PENDING',
+                    'risk_level': 'LOW' if has_salary else 'HIGH',
+                    'details': f'Monthly salary: ₹{application.monthly_salary:,.2f}' if has_salary else 'Income verification pending'
+                },
+                {
+                    'check_name': 'Employment Verification',
+                    'status': 'PASSED' if has_company else 'PENDING',
+                    'risk_level': 'LOW' if has_company else 'MEDIUM',
+                    'details': f'Company: {application.company_name}' if has_company else 'Employment details pending'
+                }
+            ],
+            'recommendations': [
+                'Financial documents verified',
+                'Income meets eligibility criteria'
+            ] if has_salary else [
+                'Provide income proof documents',
+                'Complete employment verification'
+            ]
+        },
+        'summary': {
+            'overall_kyc_status': 'COMPLETED' if identity_verified and has_address and has_salary else 'PENDING'
+        }
+    }
+
+def build_risk_analysis(application, detailed=False):
+    """Risk analysis sections for the comprehensive reports; detailed adds the HTML report's extra guidance"""
+    monthly_salary = application.monthly_salary
+    existing_emi = application.existing_emi
+    debt_to_income = (existing_emi / monthly_salary * 100) if monthly_salary > 0 else 0
+    affordability_ratio = ((monthly_salary - existing_emi) / monthly_salary * 100) if monthly_salary > 0 else 0
+    loan_to_value = (application.loan_amount / application.property_valuation * 100) if application.property_valuation > 0 else 0
+    risk_score = application.overall_risk_score or 50
+    
+    mitigation_recommendations = [
+        'Maintain good credit history',
+        'Ensure timely payment of existing obligations'
+    ]
+    key_findings = [
+        f'CIBIL Score: {application.cibil_score}',
+        f'Debt-to-Income Ratio: {debt_to_income:.1f}%',
+        f'Loan-to-Value Ratio: {loan_to_value:.1f}%'
+    ]
+    if detailed:
+        mitigation_recommendations.append('Provide all required documentation promptly')
+        key_findings.append(f'Monthly Income: ₹{monthly_salary:,.2f}')
+    
+    return {
+        'risk_analysis_report': {
+            'risk_assessment': {
+                'risk_score': risk_score,
+                'risk_grade': 'LOW' if risk_score <= 30 else 'MEDIUM' if risk_score <= 60 else 'HIGH'
+            },
+            'approval_probability': max(0, 100 - risk_score),
+            'mitigation_recommendations': mitigation_recommendations,
+            'key_findings': key_findings
+        },
+        'existing_loan_analysis': {
+            'financial_ratios': {
+                'debt_to_income_ratio': debt_to_income,
+                'affordability_ratio': affordability_ratio,
+                'safe_threshold': 40.0
+            },
+            'recommendations': [
+                'Existing EMI obligations are within manageable limits'
+            ] if debt_to_income <= 40 else [
+                'Consider reducing existing debt before applying for new loan'
+            ]
+        },
+        'ai_summary': {
+            'key_findings': [
+                'Application meets basic eligibility criteria',
+                'Property valuation provides adequate security',
+                'Income supports loan repayment capacity'
+            ]
+        }
+    }
+
 @app.route('/application/<int:application_id>/comprehensive_report')
 @login_required
 def comprehensive_report(application_id):
     """Display comprehensive HTML report"""
-    application = Application.query.get_or_404(application_id)
+    application = get_application_or_404(application_id)
     
     # Check permissions
     if 'admin_id' not in session and application.user_id != session['user_id']:
@@ -2300,9 +2552,8 @@ def comprehensive_report(application_id):
         interest_rate = application.interest_rate or 8.5
         loan_term_years = application.loan_term_years or 20
         
-        monthly_rate = interest_rate / 12 / 100
         months = loan_term_years * 12
-        emi = (loan_amount * monthly_rate * (1 + monthly_rate) ** months) / ((1 + monthly_rate) ** months - 1)
+        emi = emi_scalar_py(loan_amount, interest_rate / 12 / 100, months)
         total_payment = emi * months
         total_interest = total_payment - loan_amount
         
@@ -2316,118 +2567,9 @@ def comprehensive_report(application_id):
             'total_interest': total_interest
         }
         
-        # Prepare KYC reports (same as PDF version)
-        kyc_reports = {
-            'identity_report': {
-                'status': 'VERIFIED' if application.aadhar_number and application.pan_number else 'PENDING',
-                'verification_checks': [
-                    {
-                        'check_name': 'Aadhaar Verification',
-                        'status': 'PASSED' if application.aadhar_number else 'PENDING',
-                        'risk_level': 'LOW' if application.aadhar_number else 'HIGH',
-                        'details': 'Aadhaar number verified successfully' if application.aadhar_number else 'Aadhaar verification pending'
-                    },
-                    {
-                        'check_name': 'PAN Verification',
-                        'status': 'PASSED' if application.pan_number else 'PENDING',
-                        'risk_level': 'LOW' if application.pan_number else 'HIGH',
-                        'details': 'PAN number verified successfully' if application.pan_number else 'PAN verification pending'
-                    }
-                ],
-                'recommendations': [
-                    'Identity documents verified successfully'
-                ] if application.aadhar_number and application.pan_number else [
-                    'Complete identity document verification'
-                ]
-            },
-            'address_report': {
-                'status': 'VERIFIED' if application.current_address else 'PENDING',
-                'verification_checks': [
-                    {
-                        'check_name': 'Address Verification',
-                        'status': 'PASSED' if application.current_address else 'PENDING',
-                        'risk_level': 'LOW' if application.current_address else 'MEDIUM',
-                        'details': 'Current address verified' if application.current_address else 'Address verification required'
-                    }
-                ],
-                'recommendations': [
-                    'Address verification completed'
-                ] if application.current_address else [
-                    'Provide complete current address for verification'
-                ]
-            },
-            'financial_report': {
-                'status': 'VERIFIED' if application.monthly_salary else 'PENDING',
-                'verification_checks': [
-                    {
-                        'check_name': 'Income Verification',
-                        'status': 'PASSED' if application.monthly_salary else 'PENDING',
-                        'risk_level': 'LOW' if application.monthly_salary else 'HIGH',
-                        'details': f'Monthly salary: ₹{application.monthly_salary:,.2f}' if application.monthly_salary else 'Income verification pending'
-                    },
-                    {
-                        'check_name': 'Employment Verification',
-                        'status': 'PASSED' if application.company_name else 'PENDING',
-                        'risk_level': 'LOW' if application.company_name else 'MEDIUM',
-                        'details': f'Company: {application.company_name}' if application.company_name else 'Employment details pending'
-                    }
-                ],
-                'recommendations': [
-                    'Financial documents verified',
-                    'Income meets eligibility criteria'
-                ] if application.monthly_salary else [
-                    'Provide income proof documents',
-                    'Complete employment verification'
-                ]
-            },
-            'summary': {
-                'overall_kyc_status': 'COMPLETED' if application.aadhar_number and application.pan_number and application.current_address and application.monthly_salary else 'PENDING'
-            }
-        }
-        
-        # Prepare risk analysis
-        debt_to_income = (application.existing_emi / application.monthly_salary * 100) if application.monthly_salary > 0 else 0
-        affordability_ratio = ((application.monthly_salary - application.existing_emi) / application.monthly_salary * 100) if application.monthly_salary > 0 else 0
-        
-        risk_analysis = {
-            'risk_analysis_report': {
-                'risk_assessment': {
-                    'risk_score': application.overall_risk_score if application.overall_risk_score else 50,
-                    'risk_grade': 'LOW' if (application.overall_risk_score or 50) <= 30 else 'MEDIUM' if (application.overall_risk_score or 50) <= 60 else 'HIGH'
-                },
-                'approval_probability': max(0, 100 - (application.overall_risk_score or 50)),
-                'mitigation_recommendations': [
-                    'Maintain good credit history',
-                    'Ensure timely payment of existing obligations',
-                    'Provide all required documentation promptly'
-                ],
-                'key_findings': [
-                    f'CIBIL Score: {application.cibil_score}',
-                    f'Debt-to-Income Ratio: {debt_to_income:.1f}%',
-                    f'Loan-to-Value Ratio: {(application.loan_amount / application.property_valuation * 100) if application.property_valuation > 0 else 0:.1f}%',
-                    f'Monthly Income: ₹{application.monthly_salary:,.2f}'
-                ]
-            },
-            'existing_loan_analysis': {
-                'financial_ratios': {
-                    'debt_to_income_ratio': debt_to_income,
-                    'affordability_ratio': affordability_ratio,
-                    'safe_threshold': 40.0
-                },
-                'recommendations': [
-                    'Existing EMI obligations are within manageable limits'
-                ] if debt_to_income <= 40 else [
-                    'Consider reducing existing debt before applying for new loan'
-                ]
-            },
-            'ai_summary': {
-                'key_findings': [
-                    'Application meets basic eligibility criteria',
-                    'Property valuation provides adequate security',
-                    'Income supports loan repayment capacity'
-                ]
-            }
-        }
+        # KYC and risk sections (shared with the combined PDF)
+        kyc_reports = build_kyc_reports(application)
+        risk_analysis = build_risk_analysis(application, detailed=True)
         
         # Prepare recommendations
         recommendations = {
@@ -2460,19 +2602,25 @@ def download_report(pdf_path):
     except Exception as e:
         return jsonify({'error': str(e)}), 404
 
-@app.route('/application/<int:application_id>/generate_combined_pdf')
-@login_required
-def generate_combined_pdf(application_id):
-    """Generate and download combined PDF report"""
-    application = Application.query.get_or_404(application_id)
-    
-    # Check if user owns this application or is admin
-    if 'admin_id' not in session and application.user_id != session['user_id']:
-        abort(403)
-    
-    try:
-        # Initialize PDF generator
-        pdf_generator = ComprehensivePDFReportGenerator()
+# Combined PDF reports are built off the request thread, one file per version of the application
+PDF_REPORT_DIR = 'reports'
+PDF_REPORT_WAIT_SECONDS = 2  # a quick build is still served by the request that started it
+pdf_report_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='pdf-report')
+pdf_report_jobs = {}  # application id -> (output path, future)
+pdf_report_lock = threading.Lock()
+
+def combined_report_path(application):
+    """File holding the combined PDF for the application as last updated"""
+    version = application.updated_at.strftime('%Y%m%d%H%M%S%f') if application.updated_at else 'initial'
+    return os.path.join(PDF_REPORT_DIR, f"application_{application.id}_{version}_combined.pdf")
+
+def build_combined_report(application_id):
+    """Background task: write the combined PDF for the application's current version and return its path"""
+    with app.app_context():
+        application = db.session.get(Application, application_id)
+        if application is None:
+            raise LookupError(f"Application {application_id} not found")
+        output_path = combined_report_path(application)
         
         # Prepare application data for PDF
         app_data = {
@@ -2489,143 +2637,97 @@ def generate_combined_pdf(application_id):
             'existing_emi': float(application.existing_emi)
         }
         
-        # Prepare KYC reports data
-        kyc_reports = {
-            'identity_report': {
-                'status': 'VERIFIED' if application.aadhar_number and application.pan_number else 'PENDING',
-                'verification_checks': [
-                    {
-                        'check_name': 'Aadhaar Verification',
-                        'status': 'PASSED' if application.aadhar_number else 'PENDING',
-                        'risk_level': 'LOW' if application.aadhar_number else 'HIGH',
-                        'details': 'Aadhaar number verified successfully' if application.aadhar_number else 'Aadhaar verification pending'
-                    },
-                    {
-                        'check_name': 'PAN Verification',
-                        'status': 'PASSED' if application.pan_number else 'PENDING',
-                        'risk_level': 'LOW' if application.pan_number else 'HIGH',
-                        'details': 'PAN number verified successfully' if application.pan_number else 'PAN verification pending'
-                    }
-                ],
-                'recommendations': [
-                    'Identity documents verified successfully'
-                ] if application.aadhar_number and application.pan_number else [
-                    'Complete identity document verification'
-                ]
-            },
-            'address_report': {
-                'status': 'VERIFIED' if application.current_address else 'PENDING',
-                'verification_checks': [
-                    {
-                        'check_name': 'Address Verification',
-                        'status': 'PASSED' if application.current_address else 'PENDING',
-                        'risk_level': 'LOW' if application.current_address else 'MEDIUM',
-                        'details': 'Current address verified' if application.current_address else 'Address verification required'
-                    }
-                ],
-                'recommendations': [
-                    'Address verification completed'
-                ] if application.current_address else [
-                    'Provide complete current address for verification'
-                ]
-            },
-            'financial_report': {
-                'status': 'VERIFIED' if application.monthly_salary else 'PENDING',
-                'verification_checks': [
-                    {
-                        'check_name': 'Income Verification',
-                        'status': 'PASSED' if application.monthly_salary else 'PENDING',
-                        'risk_level': 'LOW' if application.monthly_salary else 'HIGH',
-                        'details': f'Monthly salary: ₹{application.monthly_salary:,.2f}' if application.monthly_salary else 'Income verification pending'
-                    },
-                    {
-                        'check_name': 'Employment Verification',
-                        'status': 'PASSED' if application.company_name else 'PENDING',
-                        'risk_level': 'LOW' if application.company_name else 'MEDIUM',
-                        'details': f'Company: {application.company_name}' if application.company_name else 'Employment details pending'
-                    }
-                ],
-                'recommendations': [
-                    'Financial documents verified',
-                    'Income meets eligibility criteria'
-                ] if application.monthly_salary else [
-                    'Provide income proof documents',
-                    'Complete employment verification'
-                ]
-            },
-            'summary': {
-                'overall_kyc_status': 'COMPLETED' if application.aadhar_number and application.pan_number and application.current_address and application.monthly_salary else 'PENDING'
-            }
-        }
-        
-        # Prepare risk analysis data
-        # Calculate debt-to-income ratio
-        debt_to_income = (application.existing_emi / application.monthly_salary * 100) if application.monthly_salary > 0 else 0
-        
-        risk_analysis = {
-            'risk_analysis_report': {
-                'risk_assessment': {
-                    'risk_score': application.overall_risk_score if application.overall_risk_score else 50,
-                    'risk_grade': 'LOW' if (application.overall_risk_score or 50) <= 30 else 'MEDIUM' if (application.overall_risk_score or 50) <= 60 else 'HIGH'
-                },
-                'approval_probability': max(0, 100 - (application.overall_risk_score or 50)),
-                'mitigation_recommendations': [
-                    'Maintain good credit history',
-                    'Ensure timely payment of existing obligations'
-                ],
-                'key_findings': [
-                    f'CIBIL Score: {application.cibil_score}',
-                    f'Debt-to-Income Ratio: {debt_to_income:.1f}%',
-                    f'Loan-to-Value Ratio: {(application.loan_amount / application.property_valuation * 100) if application.property_valuation > 0 else 0:.1f}%'
-                ]
-            },
-            'existing_loan_analysis': {
-                'financial_ratios': {
-                    'debt_to_income_ratio': debt_to_income,
-                    'affordability_ratio': ((application.monthly_salary - application.existing_emi) / application.monthly_salary * 100) if application.monthly_salary > 0 else 0,
-                    'safe_threshold': 40.0
-                },
-                'recommendations': [
-                    'Existing EMI obligations are within manageable limits'
-                ] if debt_to_income <= 40 else [
-                    'Consider reducing existing debt before applying for new loan'
-                ]
-            },
-            'ai_summary': {
-                'key_findings': [
-                    'Application meets basic eligibility criteria',
-                    'Property valuation provides adequate security',
-                    'Income supports loan repayment capacity'
-                ]
-            }
-        }
-        
-        # Create reports directory if it doesn't exist
-        os.makedirs('reports', exist_ok=True)
-        output_path = f"reports/application_{application_id}_combined.pdf"
-        
-        # Generate PDF
-        pdf_path = pdf_generator.generate_combined_report(
-            app_data, 
-            kyc_reports, 
-            risk_analysis, 
-            output_path
-        )
-        
-        # Log the PDF generation
-        app.logger.info(f"PDF report generated for application {application_id}: {pdf_path}")
-        
-        return send_file(
-            pdf_path, 
-            as_attachment=True, 
-            download_name=f"Loan_Application_Report_{application_id}.pdf",
-            mimetype='application/pdf'
-        )
-        
+        # KYC and risk sections (shared with the HTML report)
+        kyc_reports = build_kyc_reports(application)
+        risk_analysis = build_risk_analysis(application)
+        
+        # Write under a temporary name so a half-built file is never served
+        os.makedirs(PDF_REPORT_DIR, exist_ok=True)
+        partial_path = f"{output_path}.part"
+        ComprehensivePDFReportGenerator().generate_combined_report(app_data, kyc_reports, risk_analysis, partial_path)
+        os.replace(partial_path, output_path)
+        
+        # Older versions of this report are never served again
+        prefix = f"application_{application.id}_"
+        for file_name in os.listdir(PDF_REPORT_DIR):
+            old_path = os.path.join(PDF_REPORT_DIR, file_name)
+            if file_name.startswith(prefix) and file_name.endswith('_combined.pdf') and old_path != output_path:
+                try:
+                    os.remove(old_path)
+                except OSError:
+                    pass
+        
+        app.logger.info(f"PDF report generated for application {application_id}: {output_path}")
+        return output_path
+
+def submit_combined_report(application):
+    """Queue build_combined_report unless this version is already being built; returns the future"""
+    output_path = combined_report_path(application)
+    with pdf_report_lock:
+        job = pdf_report_jobs.get(application.id)
+        if job is None or job[0] != output_path or job[1].done():
+            job = pdf_report_jobs[application.id] = (
+                output_path, pdf_report_executor.submit(build_combined_report, application.id)
+            )
+    return job[1]
+
+def send_combined_report(output_path, application_id):
+    """Download response for a finished combined PDF"""
+    return send_file(
+        output_path, 
+        as_attachment=True, 
+        download_name=f"Loan_Application_Report_{application_id}.pdf",
+        mimetype='application/pdf'
+    )
+
+@app.route('/application/<application_id>/generate_combined_pdf')
+@login_required
+def generate_combined_pdf(application_id):
+    """Download the combined PDF report, building it in the background when it is not current"""
+    application = get_application_or_404(application_id)
+    
+    # Check if user owns this application or is admin
+    if 'admin_id' not in session and application.user_id != session['user_id']:
+        abort(403)
+    
+    # Repeat downloads of an unchanged application reuse the file
+    output_path = combined_report_path(application)
+    if os.path.exists(output_path):
+        return send_combined_report(output_path, application_id)
+    
+    try:
+        future = submit_combined_report(application)
+        return send_combined_report(future.result(timeout=PDF_REPORT_WAIT_SECONDS), application_id)
+    except FutureTimeoutError:
+        flash('Your PDF report is being prepared. Please download it again in a moment.', 'info')
+        return redirect(url_for('application_reports'))
     except Exception as e:
         app.logger.error(f"Error generating PDF for application {application_id}: {str(e)}")
         flash(f'Error generating PDF report: {str(e)}', 'error')
-        return redirect(url_for('view_application_reports', application_id=application_id))
+        return redirect(url_for('application_reports'))
+
+@app.route('/api/combined-report-status/<application_id>')
+@login_required
+def combined_report_status(application_id):
+    """Poll whether the combined PDF report is ready to download"""
+    application = get_application_or_404(application_id)
+    if 'admin_id' not in session and application.user_id != session['user_id']:
+        abort(403)
+    
+    output_path = combined_report_path(application)
+    job = pdf_report_jobs.get(application.id)
+    if os.path.exists(output_path):
+        status = 'ready'
+    elif job is None or job[0] != output_path:
+        status = 'not_started'
+    elif not job[1].done():
+        status = 'processing'
+    else:
+        status = 'failed'
+    return jsonify({
+        'status': status,
+        'download_url': url_for('generate_combined_pdf', application_id=application.id) if status == 'ready' else None
+    })
 
 @app.route('/application/<app_id>/generate-full-pdf')
 @login_required
@@ -2635,21 +2737,24 @@ def generate_full_pdf(app_id):
         # Check permissions
         is_admin = 'admin_id' in session
         if is_admin:
-            application = Application.query.filter_by(id=app_id).first()
+            application = get_application(app_id, with_documents=True)
         else:
-            application = Application.query.filter_by(id=app_id, user_id=session['user_id']).first()
+            application = get_user_application(app_id, session['user_id'], with_documents=True)
         
         if not application:
             flash('Application not found.', 'error')
             return redirect(url_for('dashboard'))
         
         # Prepare all data for the PDF
-        ai_analysis = safe_json_loads(application.ai_analysis_report)
-        banking_report = safe_json_loads(application.banking_analysis_report)
-        fraud_report = safe_json_loads(application.fraud_detection_report)
-        employment_report = safe_json_loads(application.employment_verification_report)
-        document_report = safe_json_loads(application.document_verification_report)
-        na_report = safe_json_loads(application.na_document_verification)
+        ai_analysis, banking_report, fraud_report, employment_report, document_report, na_report = load_json_fields(
+            application,
+            'ai_analysis_report',
+            'banking_analysis_report',
+            'fraud_detection_report',
+            'employment_verification_report',
+            'document_verification_report',
+            'na_document_verification'
+        )
         
         # Calculate financial risk
         monthly_salary = application.monthly_salary or 0
@@ -2677,96 +2782,86 @@ def generate_full_pdf(app_id):
         
         # Prepare document data
         documents_data = []
-        document_types = {
-            'BANK_STATEMENTS': 'Bank Statements',
-            'SALARY_SLIPS': 'Salary Slips',
-            'KYC_DOCS': 'KYC Documents',
-            'PROPERTY_VALUATION': 'Property Valuation',
-            'LEGAL_CLEARANCE': 'Legal Clearance',
-            'NON_AGRICULTURAL_DECLARATION': 'Non-Agricultural Declaration'
-        }
-        
-        for doc_type, doc_name in document_types.items():
-            doc = next((d for d in application.documents if d.document_type == doc_type), None)
+        docs_by_type = documents_by_type(application)
+        for doc_type, doc_name in VERIFIED_DOCUMENT_TYPES.items():
+            doc_present = doc_type in docs_by_type
             documents_data.append({
                 'document_type': doc_name,
-                'verification_status': 'VERIFIED' if doc else 'MISSING',
-                'risk_score': 10 if doc else 90
+                'verification_status': 'VERIFIED' if doc_present else 'MISSING',
+                'risk_score': 10 if doc_present else 90
             })
         
-        # Create PDF using weasyprint (install: pip install weasyprint)
-        try:
-            from weasyprint import HTML
-            import tempfile
-            import os
-            
-            # Render HTML template
-            html_content = render_template('pdf_report_template.html',
-                application=application,
-                ai_analysis=ai_analysis,
-                banking_report=banking_report,
-                fraud_report=fraud_report,
-                employment_report=employment_report,
-                document_report=document_report,
-                na_report=na_report,
-                documents=documents_data,
-                financial_risk_score=financial_risk_score,
-                financial_risk_level=financial_risk_level,
-                document_risk_score=document_risk_score,
-                document_risk_level=document_risk_level,
-                generated_date=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                report_id=f"RPT-{application.id}-{datetime.now().strftime('%Y%m%d')}"
-            )
-            
-            # Create temporary file
-            with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp_file:
-                pdf_path = tmp_file.name
-            
-            # Generate PDF
-            HTML(string=html_content).write_pdf(pdf_path)
-            
-            # Send file
-            return send_file(
-                pdf_path,
-                as_attachment=True,
-                download_name=f'Comprehensive_Report_{application.id}.pdf',
-                mimetype='application/pdf'
-            )
-            
-        except ImportError:
-            # Fallback to basic PDF if weasyprint not available
+        # Create PDF using Chromium or weasyprint (install: pip install playwright / weasyprint)
+        if not HTML_PDF_AVAILABLE:
+            # Fallback to basic PDF if neither HTML renderer is available
             return generate_basic_pdf_report(application, app_id)
+        
+        # Render HTML template
+        html_content = render_template('pdf_report_template.html',
+            application=application,
+            ai_analysis=ai_analysis,
+            banking_report=banking_report,
+            fraud_report=fraud_report,
+            employment_report=employment_report,
+            document_report=document_report,
+            na_report=na_report,
+            documents=documents_data,
+            financial_risk_score=financial_risk_score,
+            financial_risk_level=financial_risk_level,
+            document_risk_score=document_risk_score,
+            document_risk_level=document_risk_level,
+            generated_date=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            report_id=f"RPT-{application.id}-{datetime.now().strftime('%Y%m%d')}"
+        )
+        
+        # Generate PDF in memory and send it
+        return send_file(
+            render_html_pdf(html_content),
+            as_attachment=True,
+            download_name=f'Comprehensive_Report_{application.id}.pdf',
+            mimetype='application/pdf'
+        )
     
     except Exception as e:
         current_app.logger.error(f"Error generating PDF for {app_id}: {str(e)}")
         flash(f'Error generating PDF report: {str(e)}', 'error')
         return redirect(url_for('status', app_id=app_id))
 
+# Basic report styles, built once like the loan agreement styles
+BASIC_REPORT_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=PDF_STYLES['Heading1'],
+    fontSize=16,
+    textColor=colors.darkblue,
+    spaceAfter=20,
+    alignment=1
+)
+BASIC_REPORT_DETAILS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+])
+BASIC_REPORT_RISK_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+])
+
 def generate_basic_pdf_report(application, app_id):
     """Fallback basic PDF generation using reportlab"""
     try:
-        from reportlab.lib.pagesizes import letter, A4
-        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-        from reportlab.lib import colors
-        from reportlab.lib.units import inch
-        import io
-        
         # Create PDF in memory
         buffer = io.BytesIO()
         doc = SimpleDocTemplate(buffer, pagesize=A4, topMargin=0.5*inch)
         elements = []
-        styles = getSampleStyleSheet()
-        
-        # Custom styles
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=16,
-            textColor=colors.darkblue,
-            spaceAfter=20,
-            alignment=1
-        )
+        styles = PDF_STYLES
+        title_style = BASIC_REPORT_TITLE_STYLE
         
         # Header
         elements.append(Paragraph("COMPREHENSIVE LOAN APPLICATION REPORT", title_style))
@@ -2784,12 +2879,7 @@ def generate_basic_pdf_report(application, app_id):
         ]
         
         app_table = Table(app_data, colWidths=[2.5*inch, 3*inch])
-        app_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ]))
+        app_table.setStyle(BASIC_REPORT_DETAILS_TABLE_STYLE)
         elements.append(app_table)
         elements.append(Spacer(1, 15))
         
@@ -2805,16 +2895,7 @@ def generate_basic_pdf_report(application, app_id):
         ]
         
         risk_table = Table(risk_data, colWidths=[2*inch, 1.5*inch, 1.5*inch])
-        risk_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ]))
+        risk_table.setStyle(BASIC_REPORT_RISK_TABLE_STYLE)
         elements.append(risk_table)
         
         # Build PDF
@@ -2825,7 +2906,8 @@ def generate_basic_pdf_report(application, app_id):
             buffer,
             as_attachment=True,
             download_name=f'Basic_Report_{application.id}.pdf',
-            mimetype='application/pdf'
+            mimetype='application/pdf',
+            conditional=True
         )
         
     except Exception as e:
@@ -2837,15 +2919,19 @@ def generate_basic_pdf_report(application, app_id):
 def credit_risk_report(app_id):
     """Generate Credit Risk Report PDF"""
     try:
-        application = Application.query.filter_by(id=app_id).first_or_404()
+        application = get_application_or_404(app_id)
         print(f"Generating credit risk report for app {app_id}")
         
         pdf_buffer = generate_credit_risk_report(application)
         
-        response = make_response(pdf_buffer.getvalue())
-        response.headers['Content-Type'] = 'application/pdf'
-        response.headers['Content-Disposition'] = f'attachment; filename=credit_risk_report_{app_id}.pdf'
-        return response
+        pdf_buffer.seek(0)
+        return send_file(
+            pdf_buffer,
+            as_attachment=True,
+            download_name=f'credit_risk_report_{app_id}.pdf',
+            mimetype='application/pdf',
+            conditional=True
+        )
         
     except Exception as e:
         print(f"Error in credit_risk_report route: {str(e)}")
@@ -2856,15 +2942,19 @@ def credit_risk_report(app_id):
 def document_verification_report(app_id):
     """Generate Document Verification Report PDF"""
     try:
-        application = Application.query.filter_by(id=app_id).first_or_404()
+        application = get_application_or_404(app_id)
         print(f"Generating document verification report for app {app_id}")
         
         pdf_buffer = generate_document_verification_report(application)
         
-        response = make_response(pdf_buffer.getvalue())
-        response.headers['Content-Type'] = 'application/pdf'
-        response.headers['Content-Disposition'] = f'attachment; filename=document_verification_report_{app_id}.pdf'
-        return response
+        pdf_buffer.seek(0)
+        return send_file(
+            pdf_buffer,
+            as_attachment=True,
+            download_name=f'document_verification_report_{app_id}.pdf',
+            mimetype='application/pdf',
+            conditional=True
+        )
         
     except Exception as e:
         print(f"Error in document_verification_report route: {str(e)}")
@@ -2875,15 +2965,19 @@ def document_verification_report(app_id):
 def property_verification_report(app_id):
     """Generate Property Verification Report PDF"""
     try:
-        application = Application.query.filter_by(id=app_id).first_or_404()
+        application = get_application_or_404(app_id)
         print(f"Generating property verification report for app {app_id}")
         
         pdf_buffer = generate_property_verification_report(application)
         
-        response = make_response(pdf_buffer.getvalue())
-        response.headers['Content-Type'] = 'application/pdf'
-        response.headers['Content-Disposition'] = f'attachment; filename=property_verification_report_{app_id}.pdf'
-        return response
+        pdf_buffer.seek(0)
+        return send_file(
+            pdf_buffer,
+            as_attachment=True,
+            download_name=f'property_verification_report_{app_id}.pdf',
+            mimetype='application/pdf',
+            conditional=True
+        )
         
     except Exception as e:
         print(f"Error in property_verification_report route: {str(e)}")
@@ -2894,15 +2988,19 @@ def property_verification_report(app_id):
 def final_comprehensive_report(app_id):
     """Generate Final Comprehensive Report PDF"""
     try:
-        application = Application.query.filter_by(id=app_id).first_or_404()
+        application = get_application_or_404(app_id)
         print(f"Generating final comprehensive report for app {app_id}")
         
         pdf_buffer = generate_final_comprehensive_report(application)
         
-        response = make_response(pdf_buffer.getvalue())
-        response.headers['Content-Type'] = 'application/pdf'
-        response.headers['Content-Disposition'] = f'attachment; filename=final_comprehensive_report_{app_id}.pdf'
-        return response
+        pdf_buffer.seek(0)
+        return send_file(
+            pdf_buffer,
+            as_attachment=True,
+            download_name=f'final_comprehensive_report_{app_id}.pdf',
+            mimetype='application/pdf',
+            conditional=True
+        )
         
     except Exception as e:
         print(f"Error in final_comprehensive_report route: {str(e)}")
@@ -2913,7 +3011,7 @@ def final_comprehensive_report(app_id):
 def generate_ai_summaries(app_id):
     """Generate and store AI summaries for an application"""
     try:
-        application = Application.query.filter_by(id=app_id).first_or_404()
+        application = get_application_or_404(app_id)
         ai_generator = AISummaryGenerator()
         
         # Generate and store AI summaries
@@ -2940,9 +3038,9 @@ def run_advanced_verification(app_id):
         # Check permissions
         is_admin = 'admin_id' in session
         if is_admin:
-            application = Application.query.filter_by(id=app_id).first()
+            application = get_application(app_id, with_documents=True)
         else:
-            application = Application.query.filter_by(id=app_id, user_id=session['user_id']).first()
+            application = get_user_application(app_id, session['user_id'], with_documents=True)
         
         if not application:
             return jsonify({'success': False, 'error': 'Application not found'}), 404
@@ -2977,20 +3075,20 @@ def get_verification_report(app_id):
         # Check permissions
         is_admin = 'admin_id' in session
         if is_admin:
-            application = Application.query.filter_by(id=app_id).first()
+            application = get_application(app_id)
         else:
-            application = Application.query.filter_by(id=app_id, user_id=session['user_id']).first()
+            application = get_user_application(app_id, session['user_id'])
         
         if not application:
             return jsonify({'success': False, 'error': 'Application not found'}), 404
         
         # Parse existing verification data
         verification_data = {
-            'employment': safe_json_loads(application.employment_verification_report),
-            'documents': safe_json_loads(application.document_verification_report),
-            'na_document': safe_json_loads(application.na_document_verification),
+            'employment': load_json_field(application, 'employment_verification_report'),
+            'documents': load_json_field(application, 'document_verification_report'),
+            'na_document': load_json_field(application, 'na_document_verification'),
             'overall_risk_score': application.overall_risk_score,
-            'verification_summary': safe_json_loads(application.verification_summary)
+            'verification_summary': load_json_field(application, 'verification_summary')
         }
         
         return jsonify({
@@ -3011,9 +3109,9 @@ def verify_employment(app_id):
         # Check permissions
         is_admin = 'admin_id' in session
         if is_admin:
-            application = Application.query.filter_by(id=app_id).first()
+            application = get_application(app_id, with_documents=True)
         else:
-            application = Application.query.filter_by(id=app_id, user_id=session['user_id']).first()
+            application = get_user_application(app_id, session['user_id'], with_documents=True)
         
         if not application:
             return jsonify({'success': False, 'error': 'Application not found'}), 404
@@ -3025,7 +3123,7 @@ def verify_employment(app_id):
         employment_verification = advance_verification_service.verify_employment_documents(application, documents)
         
         # Update application
-        application.employment_verification_report = json.dumps(employment_verification)
+        application.employment_verification_report = report_json_dumps(employment_verification)
         application.employment_verification_status = employment_verification.get('employment_status', 'PENDING')
         application.updated_at = datetime.utcnow()
         
@@ -3049,9 +3147,9 @@ def verify_documents(app_id):
         # Check permissions
         is_admin = 'admin_id' in session
         if is_admin:
-            application = Application.query.filter_by(id=app_id).first()
+            application = get_application(app_id, with_documents=True)
         else:
-            application = Application.query.filter_by(id=app_id, user_id=session['user_id']).first()
+            application = get_user_application(app_id, session['user_id'], with_documents=True)
         
         if not application:
             return jsonify({'success': False, 'error': 'Application not found'}), 404
@@ -3063,7 +3161,7 @@ def verify_documents(app_id):
         document_verification = advance_verification_service.verify_all_documents(application, documents)
         
         # Update application
-        application.document_verification_report = json.dumps(document_verification)
+        application.document_verification_report = report_json_dumps(document_verification)
         application.document_verification_status = document_verification.get('overall_status', 'PENDING')
         application.updated_at = datetime.utcnow()
         
@@ -3087,9 +3185,9 @@ def verify_na_document_route(app_id):
         # Check permissions
         is_admin = 'admin_id' in session
         if is_admin:
-            application = Application.query.filter_by(id=app_id).first()
+            application = get_application(app_id, with_documents=True)
         else:
-            application = Application.query.filter_by(id=app_id, user_id=session['user_id']).first()
+            application = get_user_application(app_id, session['user_id'], with_documents=True)
         
         if not application:
             return jsonify({'success': False, 'error': 'Application not found'}), 404
@@ -3101,7 +3199,7 @@ def verify_na_document_route(app_id):
         na_verification = advance_verification_service.verify_na_document(application, documents)
         
         # Update application
-        application.na_document_verification = json.dumps(na_verification)
+        application.na_document_verification = report_json_dumps(na_verification)
         application.na_document_status = na_verification.get('status', 'PENDING')
         application.na_document_risk_score = na_verification.get('risk_score', 0)
         application.updated_at = datetime.utcnow()
@@ -3126,17 +3224,17 @@ def calculate_risk_score(app_id):
         # Check permissions
         is_admin = 'admin_id' in session
         if is_admin:
-            application = Application.query.filter_by(id=app_id).first()
+            application = get_application(app_id)
         else:
-            application = Application.query.filter_by(id=app_id, user_id=session['user_id']).first()
+            application = get_user_application(app_id, session['user_id'])
         
         if not application:
             return jsonify({'success': False, 'error': 'Application not found'}), 404
         
         # Get existing verification data
-        employment_data = safe_json_loads(application.employment_verification_report)
-        document_data = safe_json_loads(application.document_verification_report)
-        na_data = safe_json_loads(application.na_document_verification)
+        employment_data = load_json_field(application, 'employment_verification_report')
+        document_data = load_json_field(application, 'document_verification_report')
+        na_data = load_json_field(application, 'na_document_verification')
         
         # Calculate financial risk
         financial_risk = calculate_financial_risk(application)
@@ -3155,7 +3253,7 @@ def calculate_risk_score(app_id):
         
         # Generate verification summary
         verification_summary = generate_verification_summary(application)
-        application.verification_summary = json.dumps(verification_summary)
+        application.verification_summary = report_json_dumps(verification_summary)
         
         db.session.commit()
         
@@ -3217,15 +3315,15 @@ def run_comprehensive_verification(application, documents):
 def update_application_with_verification(application, verification_results):
     """Update application with verification results"""
     # Update employment verification
-    application.employment_verification_report = json.dumps(verification_results['employment'])
+    application.employment_verification_report = report_json_dumps(verification_results['employment'])
     application.employment_verification_status = verification_results['employment'].get('employment_status', 'PENDING')
     
     # Update document verification
-    application.document_verification_report = json.dumps(verification_results['documents'])
+    application.document_verification_report = report_json_dumps(verification_results['documents'])
     application.document_verification_status = verification_results['documents'].get('overall_status', 'PENDING')
     
     # Update NA document verification
-    application.na_document_verification = json.dumps(verification_results['na_document'])
+    application.na_document_verification = report_json_dumps(verification_results['na_document'])
     application.na_document_status = verification_results['na_document'].get('status', 'PENDING')
     application.na_document_risk_score = verification_results['na_document'].get('risk_score', 0)
     
@@ -3233,7 +3331,7 @@ def update_application_with_verification(application, verification_results):
     application.overall_risk_score = verification_results['overall_risk_score']
     
     # Update verification summary
-    application.verification_summary = json.dumps(verification_results['final_report'])
+    application.verification_summary = report_json_dumps(verification_results['final_report'])
     
     application.updated_at = datetime.utcnow()
 
@@ -3297,6 +3395,28 @@ def advanced_verification_page():
         return redirect(url_for('dashboard'))
     
     return render_template('advanced_verification.html')
+
+# Report templates compiled at startup, after every filter is registered, so a fresh worker skips parsing them
+REPORT_TEMPLATES = (
+    'pdf_report_template.html',
+    'comprehensive_report.html',
+    'ai_analysis_report.html',
+    'application_result.html',
+    'verification_report.html',
+    'report_sections.html',
+    'status.html',
+)
+
+def warm_report_templates():
+    """Load the report templates into the Jinja template and bytecode caches"""
+    for template_name in REPORT_TEMPLATES:
+        try:
+            app.jinja_env.get_template(template_name)
+        except TemplateError as e:
+            app.logger.warning(f"Could not precompile template {template_name}: {str(e)}")
+
+warm_report_templates()
+
 if __name__ == '__main__':
     with app.app_context():
         db.create_all()
@@ -3,8 +3,18 @@ import os
 BASE_DIR = os.path.abspath(os.path.dirname(__file__))
 SQLALCHEMY_DATABASE_URI = f'sqlite:///{os.path.join(BASE_DIR, "casaflow.db")}'
 SQLALCHEMY_TRACK_MODIFICATIONS = False
+SQLALCHEMY_ENGINE_OPTIONS = {
+    'query_cache_size': 1200,  # compiled SQL cache entries (default 500)
+    'pool_pre_ping': True,
+    'pool_recycle': 1800,
+}
 SECRET_KEY = 'a-very-secret-key-that-should-be-changed'
 UPLOAD_FOLDER = os.path.join(BASE_DIR, 'uploads')
+CACHE_TYPE = 'SimpleCache'
+CACHE_DEFAULT_TIMEOUT = 300
+# Compiled templates: in-memory LRU size and on-disk bytecode cache
+JINJA_CACHE_SIZE = 400
+JINJA_BYTECODE_CACHE_DIR = os.path.join(BASE_DIR, 'instance', 'jinja_cache')
 # --- Email Configuration (Placeholder) ---
 SMTP_SERVER = 'smtp.example.com'
 SMTP_PORT = 587
@@ -0,0 +1,4 @@
+# extensions.py
+from flask_caching import Cache
+
+cache = Cache()
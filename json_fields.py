@@ -0,0 +1,77 @@
+# json_fields.py
+import json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+from datetime import datetime
+from flask.json.provider import DefaultJSONProvider
+
+class OrjsonJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider encoding with orjson, keeping Flask's handling of dates, Decimal and UUID"""
+    
+    def dumps(self, obj, **kwargs):
+        # Pretty-printing (debug responses) and other json.dumps options stay with the stdlib encoder
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, default=self.default, option=option).decode()
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits; json raises TypeError itself for unsupported types
+            return super().dumps(obj)
+
+def json_loads(json_string):
+    """Parse JSON with orjson when available, falling back to json for what orjson rejects (e.g. NaN)"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(json_string)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(json_string)
+
+def json_datetime_default(value):
+    """json.dumps default that writes datetimes the way orjson does"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+def report_json_dumps(data):
+    """Serialize report data for a TEXT column, with orjson when available (datetimes become ISO strings)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(data, default=json_datetime_default)
+
+def safe_json_loads(json_string, default=None):
+    """Safely parse JSON string with error handling"""
+    if default is None:
+        default = {}
+    try:
+        return json_loads(json_string) if json_string else default
+    except (json.JSONDecodeError, TypeError):
+        return default
+
+def load_json_field(application, field_name, default=None):
+    """Parse a JSON column once per Application instance, re-parsing only if the column changes"""
+    raw_value = getattr(application, field_name)
+    parsed_fields = application.__dict__.setdefault('_parsed_json_fields', {})
+    cached = parsed_fields.get(field_name)
+    if cached is not None and cached[0] is raw_value:
+        return cached[1]
+    
+    parsed = safe_json_loads(raw_value, default)
+    parsed_fields[field_name] = (raw_value, parsed)
+    return parsed
+
+def load_json_fields(application, *field_names):
+    """load_json_field for several columns at once, as a tuple in the given order"""
+    return tuple(load_json_field(application, field_name) for field_name in field_names)
+
+def store_json_field(application, field_name, data):
+    """Serialize data into a JSON column and keep data as its parsed form, so load_json_field does not re-parse it"""
+    raw_value = report_json_dumps(data)
+    setattr(application, field_name, raw_value)
+    application.__dict__.setdefault('_parsed_json_fields', {})[field_name] = (raw_value, data)
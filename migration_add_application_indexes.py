@@ -0,0 +1,41 @@
+# migration_add_application_indexes.py
+from app import app, db
+from sqlalchemy import text
+
+# (index name, column list) - keep in sync with Application.__table_args__
+APPLICATION_INDEXES = [
+    ('idx_app_status_created', 'status, created_at'),
+    ('idx_app_risk_score', 'overall_risk_score'),
+    ('idx_app_doc_verification_status', 'document_verification_status'),
+    ('idx_app_user_created', 'user_id, created_at'),
+]
+
+def migrate_application_indexes():
+    with app.app_context():
+        try:
+            print("Adding indexes to applications table...")
+            
+            if db.engine.dialect.name == 'postgresql':
+                # CONCURRENTLY avoids locking the table but cannot run inside a transaction
+                with db.engine.connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+                    for index_name, columns in APPLICATION_INDEXES:
+                        print(f"Creating index: {index_name}")
+                        conn.execute(text(
+                            f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} ON applications ({columns})'
+                        ))
+            else:
+                for index_name, columns in APPLICATION_INDEXES:
+                    print(f"Creating index: {index_name}")
+                    db.session.execute(text(
+                        f'CREATE INDEX IF NOT EXISTS {index_name} ON applications ({columns})'
+                    ))
+                db.session.commit()
+            
+            print("Migration completed successfully!")
+            
+        except Exception as e:
+            print(f"Migration failed: {e}")
+            db.session.rollback()
+
+if __name__ == "__main__":
+    migrate_application_indexes()
@@ -22,7 +22,7 @@ class User(db.Model):
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Relationships
-    applications = db.relationship('Application', backref='user', lazy=True, 
+    applications = db.relationship('Application', back_populates='user', lazy=True, 
                                  cascade='all, delete-orphan', order_by='Application.created_at.desc()')
 
     def __repr__(self):
@@ -133,7 +133,8 @@ class Application(db.Model):
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Relationships
-    documents = db.relationship('Document', backref='application', lazy=True, 
+    user = db.relationship('User', back_populates='applications')
+    documents = db.relationship('Document', back_populates='application', lazy=True, 
                               cascade='all, delete-orphan', order_by='Document.uploaded_at.desc()')
     emis = db.relationship('EMI', backref='application', lazy=True, 
                           cascade='all, delete-orphan', order_by='EMI.emi_number')
@@ -141,6 +142,14 @@ class Application(db.Model):
                                    cascade='all, delete-orphan')
     status_logs = db.relationship('ApplicationStatusLog', backref='application', lazy=True,
                                 cascade='all, delete-orphan', order_by='ApplicationStatusLog.created_at.desc()')
+    
+    # Index for admin filters, listings and risk reports
+    __table_args__ = (
+        db.Index('idx_app_status_created', 'status', 'created_at'),
+        db.Index('idx_app_risk_score', 'overall_risk_score'),
+        db.Index('idx_app_doc_verification_status', 'document_verification_status'),
+        db.Index('idx_app_user_created', 'user_id', 'created_at'),
+    )
 
     def __repr__(self):
         return f'<Application {self.id}>'
@@ -219,6 +228,7 @@ class Document(db.Model):
     file_path = db.Column(db.String(500), nullable=False)
     original_filename = db.Column(db.String(255), nullable=False)
     file_size = db.Column(db.Integer)
+    content_hash = db.Column(db.String(64), index=True)  # BLAKE2b of the file bytes, for upload deduplication
     mime_type = db.Column(db.String(100))
     
     # Document Verification Fields (ADD THESE)
@@ -231,6 +241,9 @@ class Document(db.Model):
     
     uploaded_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     
+    # Relationships
+    application = db.relationship('Application', back_populates='documents')
+    
     def __repr__(self):
         return f'<Document {self.document_type} for {self.application_id}>'
 
@@ -0,0 +1,50 @@
+# request_cache.py
+from datetime import datetime
+from flask import g, abort, has_app_context
+from sqlalchemy.orm import joinedload
+from models import db, Application
+
+def get_cached(model, primary_key, options=None):
+    """Fetch a row by primary key at most once per request (cache lives on flask.g)"""
+    model_cache = g.setdefault('model_cache', {})
+    key = (model.__name__, primary_key)
+    if key not in model_cache:
+        # session.get also checks the identity map before querying
+        model_cache[key] = db.session.get(model, primary_key, options=options)
+    return model_cache[key]
+
+def get_application(app_id, with_documents=False):
+    """Application by id; with_documents loads its documents in the same query"""
+    options = [joinedload(Application.documents)] if with_documents else None
+    application = get_cached(Application, app_id, options)
+    # A cached or identity-mapped instance skips the joinedload; lazy-load its documents now
+    if with_documents and application is not None and 'documents' in db.inspect(application).unloaded:
+        application.documents
+    return application
+
+def get_application_or_404(app_id):
+    application = get_application(app_id)
+    if application is None:
+        abort(404)
+    return application
+
+def get_user_application(app_id, user_id, with_documents=False):
+    """Application owned by the given user, or None"""
+    application = get_application(app_id, with_documents)
+    if application is None or application.user_id != user_id:
+        return None
+    return application
+
+def get_user_application_or_404(app_id, user_id):
+    application = get_user_application(app_id, user_id)
+    if application is None:
+        abort(404)
+    return application
+
+def get_verification_timestamp():
+    """ISO timestamp stamped on verification results, taken once per request"""
+    if not has_app_context():
+        return datetime.utcnow().isoformat()
+    if 'verification_ts' not in g:
+        g.verification_ts = datetime.utcnow().isoformat()
+    return g.verification_ts
@@ -7,6 +7,7 @@ from .advance_verification_service import AdvanceVerificationService
 from .decision_service import DecisionService
 from .notification_service import NotificationService
 from .autofill_service import AutoFillService
+from .ai_analysis_engine import AIVerificationService
 
 # Create instances
 auth_service = AuthService()
@@ -15,6 +16,7 @@ advance_verification_service = AdvanceVerificationService()
 decision_service = DecisionService()
 notification_service = NotificationService()
 autofill_service = AutoFillService()
+ai_verification_service = AIVerificationService()
 
 # Export instances
 __all__ = [
@@ -23,5 +25,6 @@ __all__ = [
     'advance_verification_service', 
     'decision_service',
     'notification_service',
-    'autofill_service'
+    'autofill_service',
+    'ai_verification_service'
 ]
\ No newline at end of file
@@ -2,10 +2,17 @@
 
 import re
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Iterable
 
 logger = logging.getLogger(__name__)
 
+# Patterns and lookup tables shared by every parse
+SECTION_HEADERS = ('applicant details', 'financial', 'property', 'loan details')
+KEY_SEPARATORS = (':', '-', '|', '=')  # first one present in the line wins
+KEY_CLEAN_PATTERN = re.compile(r'[^a-zA-Z0-9\s]')
+NON_NUMERIC_PATTERN = re.compile(r'[^\d.]')
+FIELD_NAME_CACHE_SIZE = 1024  # keys come from uploaded files, so the memo stays bounded
+
 class AutoFillService:
     def __init__(self):
         self.field_mappings = {
@@ -28,26 +35,32 @@ class AutoFillService:
             'non_agricultural': ['non agricultural', 'property type', 'agricultural', 'is the property non-agricultural'],
             'mortgage': ['mortgage', 'existing mortgage', 'current mortgage', 'is there an existing mortgage on this property']
         }
+        # Raw key -> mapped field name; documents repeat the same few labels
+        self._field_name_cache = {}
     
     def parse_text_data(self, content: str) -> Dict[str, Any]:
         """Parse text content and extract structured data"""
+        return self.parse_lines(content.split('\n'))
+    
+    def parse_lines(self, lines: Iterable[str]) -> Dict[str, Any]:
+        """Extract structured data from lines of text, e.g. a text stream read one line at a time"""
         data = {}
-        lines = content.split('\n')
         
         for line in lines:
+            line = line.rstrip('\n')
             if not line.strip():
                 continue
                 
             # Skip section headers
-            if any(header in line.lower() for header in ['applicant details', 'financial', 'property', 'loan details']):
+            line_lower = line.lower()
+            if any(header in line_lower for header in SECTION_HEADERS):
                 continue
                 
             # Try different separators: colon, dash, pipe, equals
-            separators = [':', '-', '|', '=']
             found_separator = None
             separator_index = -1
             
-            for sep in separators:
+            for sep in KEY_SEPARATORS:
                 idx = line.find(sep)
                 if idx != -1:
                     found_separator = sep
@@ -61,7 +74,11 @@ class AutoFillService:
             value = line[separator_index + 1:].strip()
             
             # Map to standard field names
-            field_name = self._map_field_name(key)
+            field_name = self._field_name_cache.get(key)
+            if field_name is None:
+                field_name = self._map_field_name(key)
+                if len(self._field_name_cache) < FIELD_NAME_CACHE_SIZE:
+                    self._field_name_cache[key] = field_name
             if field_name:
                 data[field_name] = self._clean_value(field_name, value)
         
@@ -71,7 +88,7 @@ class AutoFillService:
     def _map_field_name(self, key: str) -> str:
         """Map various key formats to standard field names"""
         # Remove common prefixes/suffixes and clean the key
-        key = re.sub(r'[^a-zA-Z0-9\s]', '', key).strip()
+        key = KEY_CLEAN_PATTERN.sub('', key).strip()
         
         for field_name, variations in self.field_mappings.items():
             for variation in variations:
@@ -86,7 +103,8 @@ class AutoFillService:
         if field_name in ['salary', 'existing_loan', 'loan_amount', 'property_value']:
             return self._extract_number(value)
         elif field_name == 'cibil':
-            return int(self._extract_number(value)) if self._extract_number(value) else None
+            number = self._extract_number(value)
+            return int(number) if number else None
         elif field_name in ['other_properties', 'non_agricultural', 'mortgage']:
             # Handle various yes/no formats
             value_lower = value.lower()
@@ -115,5 +133,5 @@ class AutoFillService:
     def _extract_number(self, text: str) -> float:
         """Extract numeric value from text"""
         # Remove currency symbols, commas, and other non-numeric characters except decimal point
-        cleaned = re.sub(r'[^\d.]', '', text)
+        cleaned = NON_NUMERIC_PATTERN.sub('', text)
         return float(cleaned) if cleaned else 0.0
\ No newline at end of file
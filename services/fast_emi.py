@@ -0,0 +1,142 @@
+# services/fast_emi.py
+
+from calendar import monthrange
+from datetime import datetime
+from functools import lru_cache
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+def emi_scalar_py(principal, monthly_rate, tenure_months):
+    """Unrounded EMI for a monthly interest rate and tenure"""
+    if monthly_rate == 0:
+        return principal / tenure_months
+    growth = (1 + monthly_rate) ** tenure_months
+    return principal * monthly_rate * growth / (growth - 1)
+
+def amortize_py(principal, monthly_rate, emi, tenure_months):
+    """NumPy closed-form amortization: returns (emi, principal, interest, balance) arrays"""
+    months = np.arange(1, tenure_months + 1, dtype=np.float64)
+
+    # Outstanding balance after each payment: P*(1+r)^n - EMI*((1+r)^n - 1)/r
+    if monthly_rate == 0:
+        balance = principal - emi * months
+    else:
+        growth = (1 + monthly_rate) ** months
+        balance = principal * growth - emi * (growth - 1) / monthly_rate
+
+    opening_balance = np.concatenate((np.array([principal], dtype=np.float64), balance[:-1]))
+    interest = opening_balance * monthly_rate
+    principal_component = emi - interest
+    emi_adjusted = np.full(tenure_months, emi, dtype=np.float64)
+
+    # Handle final payment adjustment
+    principal_component[-1] = opening_balance[-1]
+    emi_adjusted[-1] = principal_component[-1] + interest[-1]
+    balance[-1] = 0.0
+
+    return emi_adjusted, principal_component, interest, balance
+
+def amortize_loop(principal, monthly_rate, emi, tenure_months):
+    """Month-by-month amortization loop: returns (emi, principal, interest, balance) arrays"""
+    emi_out = np.empty(tenure_months)
+    principal_out = np.empty(tenure_months)
+    interest_out = np.empty(tenure_months)
+    balance_out = np.empty(tenure_months)
+
+    balance = principal
+    for i in range(tenure_months):
+        interest = balance * monthly_rate
+        if i == tenure_months - 1:
+            # Handle final payment adjustment
+            principal_component = balance
+            emi_out[i] = principal_component + interest
+            balance = 0.0
+        else:
+            principal_component = emi - interest
+            emi_out[i] = emi
+            balance -= principal_component
+        principal_out[i] = principal_component
+        interest_out[i] = interest
+        balance_out[i] = balance
+
+    return emi_out, principal_out, interest_out, balance_out
+
+def monthly_due_dates(start_date, count):
+    """Dates 1..count months after start_date, clamped to month end like relativedelta"""
+    start_year, start_month, start_day = start_date.year, start_date.month - 1, start_date.day
+    due_dates = []
+    for offset in range(1, count + 1):
+        year, month = divmod(start_month + offset, 12)
+        year += start_year
+        month += 1
+        due_dates.append(start_date.replace(year=year, month=month, day=min(start_day, monthrange(year, month)[1])))
+    return due_dates
+
+if NUMBA_AVAILABLE:
+    emi_scalar = njit(cache=True, fastmath=True)(emi_scalar_py)
+    amortize = njit(cache=True, fastmath=True)(amortize_loop)
+
+    # Compile the kernels at import time rather than on the first request
+    emi_scalar(100000.0, 0.01, 12)
+    amortize(100000.0, 0.01, 8884.88, 12)
+else:
+    emi_scalar = emi_scalar_py
+    amortize = amortize_py
+
+@lru_cache(maxsize=256)
+def schedule_columns(principal, monthly_rate, emi, tenure_months):
+    """Rounded (emi, principal, interest, balance) tuples for one loan, computed once per distinct loan"""
+    emi_values, principal_values, interest_values, balance_values = amortize(
+        principal, monthly_rate, emi, tenure_months
+    )
+    return (
+        tuple(np.round(emi_values, 2).tolist()),
+        tuple(np.round(principal_values, 2).tolist()),
+        tuple(np.round(interest_values, 2).tolist()),
+        tuple(np.maximum(np.round(balance_values, 2), 0).tolist())
+    )
+
+@lru_cache(maxsize=64)
+def due_date_labels(start_date, tenure_months):
+    """Formatted monthly due dates for a schedule starting on start_date"""
+    return tuple(due_date.strftime('%d-%b-%Y') for due_date in monthly_due_dates(start_date, tenure_months))
+
+def build_amortization_schedule(principal, annual_rate, tenure_months, emi, start_date=None):
+    """Build the template-ready monthly amortization schedule"""
+    tenure_months = int(tenure_months)
+    if tenure_months <= 0:
+        return []
+
+    monthly_rate = annual_rate / 12 / 100
+    emi_values, principal_values, interest_values, balance_values = schedule_columns(
+        float(principal), float(monthly_rate), float(emi), tenure_months
+    )
+
+    # Only the day matters for the formatted dates, so it is the cache key
+    start_date = start_date or datetime.now()
+    if isinstance(start_date, datetime):
+        start_date = start_date.date()
+    due_dates = due_date_labels(start_date, tenure_months)
+    return [
+        {
+            'month': month,
+            'date': due_date,
+            'emi': emi_value,
+            'principal': principal_value,
+            'interest': interest_value,
+            'balance': balance_value
+        }
+        for month, due_date, emi_value, principal_value, interest_value, balance_value in zip(
+            range(1, tenure_months + 1),
+            due_dates,
+            emi_values,
+            principal_values,
+            interest_values,
+            balance_values
+        )
+    ]
@@ -0,0 +1,85 @@
+# services/fast_risk.py
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Instant decision weights: employment, documents, financial, fraud, AI prediction
+RISK_WEIGHTS = (0.25, 0.15, 0.35, 0.15, 0.10)
+
+# Financial risk points per band
+FINANCIAL_DTI_BOUNDS = (30.0, 50.0)  # ratio <= bound stays in the band
+FINANCIAL_DTI_POINTS = (10, 20, 40)
+FINANCIAL_LTV_BOUNDS = (60.0, 80.0)  # ratio <= bound stays in the band
+FINANCIAL_LTV_POINTS = (5, 15, 30)
+FINANCIAL_CIBIL_BOUNDS = (600.0, 750.0)  # score >= bound moves to the next band
+FINANCIAL_CIBIL_POINTS = (30, 15, 5)
+
+def fraud_risk_py(monthly_salary, property_valuation, loan_amount, cibil_score):
+    """Fraud risk as the mean of the triggered pattern indicators, 15 when none trigger"""
+    indicator_total = 0.0
+    indicator_count = 0
+
+    # Salary consistency check
+    if monthly_salary > 500000:  # Unusually high salary
+        indicator_total += 0.3
+        indicator_count += 1
+
+    # Property valuation check
+    if property_valuation / loan_amount > 10:  # Very high collateral
+        indicator_total += 0.2
+        indicator_count += 1
+
+    # CIBIL score consistency
+    if cibil_score >= 800 and monthly_salary < 50000:
+        indicator_total += 0.4  # High credit score with low income
+        indicator_count += 1
+
+    if indicator_count == 0:
+        return 15.0
+    return min(indicator_total / indicator_count * 100, 100.0)
+
+def financial_risk_py(debt_to_income, loan_to_value, cibil_score):
+    """Financial risk points from debt-to-income (%), loan-to-value (%) and CIBIL score, capped at 100"""
+    dti_band = 0
+    while dti_band < len(FINANCIAL_DTI_BOUNDS) and debt_to_income > FINANCIAL_DTI_BOUNDS[dti_band]:
+        dti_band += 1
+    ltv_band = 0
+    while ltv_band < len(FINANCIAL_LTV_BOUNDS) and loan_to_value > FINANCIAL_LTV_BOUNDS[ltv_band]:
+        ltv_band += 1
+    cibil_band = 0
+    while cibil_band < len(FINANCIAL_CIBIL_BOUNDS) and cibil_score >= FINANCIAL_CIBIL_BOUNDS[cibil_band]:
+        cibil_band += 1
+    
+    risk_score = FINANCIAL_DTI_POINTS[dti_band] + FINANCIAL_LTV_POINTS[ltv_band] + FINANCIAL_CIBIL_POINTS[cibil_band]
+    return min(100, risk_score)
+
+def instant_risk_py(employment_risk, document_risk, financial_risk, ai_risk,
+                    monthly_salary, property_valuation, loan_amount, cibil_score):
+    """Fused fraud check and weighted instant risk score: returns (risk_score, fraud_risk)"""
+    fraud = fraud_risk(monthly_salary, property_valuation, loan_amount, cibil_score)
+    weighted_score = (
+        employment_risk * RISK_WEIGHTS[0] +
+        document_risk * RISK_WEIGHTS[1] +
+        financial_risk * RISK_WEIGHTS[2] +
+        fraud * RISK_WEIGHTS[3] +
+        ai_risk * RISK_WEIGHTS[4]
+    )
+    return min(100.0, weighted_score), fraud
+
+if NUMBA_AVAILABLE:
+    # No fastmath: the weighted sum must round exactly like the Python version
+    fraud_risk = njit(cache=True)(fraud_risk_py)
+    financial_risk = njit(cache=True)(financial_risk_py)
+    instant_risk = njit(cache=True)(instant_risk_py)
+
+    # Compile the kernels at import time rather than on the first request
+    fraud_risk(100000.0, 5000000.0, 2500000.0, 780.0)
+    financial_risk(10.0, 50.0, 780.0)
+    instant_risk(20.0, 10.0, 30.0, 25.0, 100000.0, 5000000.0, 2500000.0, 780.0)
+else:
+    fraud_risk = fraud_risk_py
+    financial_risk = financial_risk_py
+    instant_risk = instant_risk_py
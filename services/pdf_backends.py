@@ -0,0 +1,46 @@
+# services/pdf_backends.py
+
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from playwright.sync_api import sync_playwright
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+
+# Seconds to wait for one HTML -> PDF render
+CHROMIUM_RENDER_TIMEOUT = 60
+
+# Playwright's sync objects belong to the thread that created them, so a single worker owns the browser
+chromium_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='pdf-chromium')
+chromium_state = {'playwright': None, 'browser': None, 'launch_error': None}
+
+def get_chromium_browser():
+    """Headless Chromium, launched on first use and reused for the life of the process"""
+    if chromium_state['launch_error'] is not None:
+        raise RuntimeError(f"Chromium unavailable: {chromium_state['launch_error']}")
+
+    browser = chromium_state['browser']
+    if browser is None or not browser.is_connected():
+        try:
+            if chromium_state['playwright'] is None:
+                chromium_state['playwright'] = sync_playwright().start()
+            browser = chromium_state['browser'] = chromium_state['playwright'].chromium.launch()
+        except Exception as e:
+            # e.g. the browser binaries were never installed; do not retry on every report
+            chromium_state['launch_error'] = str(e)
+            raise
+    return browser
+
+def render_chromium_page(html_content):
+    """Print one HTML document to PDF bytes in a fresh page of the shared browser"""
+    page = get_chromium_browser().new_page()
+    try:
+        page.set_content(html_content, wait_until='load')
+        return page.pdf(format='A4', print_background=True)
+    finally:
+        page.close()
+
+def render_pdf_chromium(html_content):
+    """Render HTML to PDF bytes with headless Chromium on the browser's own thread"""
+    return chromium_executor.submit(render_chromium_page, html_content).result(timeout=CHROMIUM_RENDER_TIMEOUT)
@@ -8,63 +8,80 @@ from reportlab.lib import colors
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from datetime import datetime
+from functools import lru_cache
 import json
 
-class ComprehensivePDFReportGenerator:
-    def __init__(self):
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
-    
-    def _setup_custom_styles(self):
-        """Setup custom paragraph styles"""
-        self.styles.add(ParagraphStyle(
+@lru_cache(maxsize=None)
+def build_report_styles():
+    """Sample stylesheet plus the report's custom paragraph styles, built once per process"""
+    styles = getSampleStyleSheet()
+    custom_styles = (
+        ParagraphStyle(
             name='Title',
-            parent=self.styles['Heading1'],
+            parent=styles['Heading1'],
             fontSize=18,
             textColor=colors.HexColor('#2c3e50'),
             spaceAfter=12,
             alignment=1  # Center
-        ))
-        
-        self.styles.add(ParagraphStyle(
+        ),
+        ParagraphStyle(
             name='Subtitle',
-            parent=self.styles['Heading2'],
+            parent=styles['Heading2'],
             fontSize=14,
             textColor=colors.HexColor('#34495e'),
             spaceAfter=6
-        ))
-        
-        self.styles.add(ParagraphStyle(
+        ),
+        ParagraphStyle(
             name='Body',
-            parent=self.styles['BodyText'],
+            parent=styles['BodyText'],
             fontSize=10,
             textColor=colors.HexColor('#2c3e50'),
             spaceAfter=6
-        ))
-        
-        self.styles.add(ParagraphStyle(
+        ),
+        ParagraphStyle(
             name='RiskHigh',
-            parent=self.styles['BodyText'],
+            parent=styles['BodyText'],
             fontSize=10,
             textColor=colors.red,
             backColor=colors.HexColor('#ffe6e6')
-        ))
-        
-        self.styles.add(ParagraphStyle(
+        ),
+        ParagraphStyle(
             name='RiskMedium',
-            parent=self.styles['BodyText'],
+            parent=styles['BodyText'],
             fontSize=10,
             textColor=colors.orange,
             backColor=colors.HexColor('#fff2e6')
-        ))
-        
-        self.styles.add(ParagraphStyle(
+        ),
+        ParagraphStyle(
             name='RiskLow',
-            parent=self.styles['BodyText'],
+            parent=styles['BodyText'],
             fontSize=10,
             textColor=colors.green,
             backColor=colors.HexColor('#e6ffe6')
-        ))
+        ),
+    )
+    for style in custom_styles:
+        if style.name in styles.byName:
+            # The sample sheet already defines 'Title'; add() refuses duplicates, so replace it
+            styles.byName[style.name] = style
+        else:
+            styles.add(style)
+    return styles
+
+@lru_cache(maxsize=128)
+def paragraph_style(name, parent_name, font_size, text_color, alignment=0):
+    """Shared ParagraphStyle for one-off report styles"""
+    return ParagraphStyle(
+        name=name,
+        parent=build_report_styles()[parent_name],
+        fontSize=font_size,
+        textColor=text_color,
+        alignment=alignment
+    )
+
+class ComprehensivePDFReportGenerator:
+    def __init__(self):
+        self.styles = build_report_styles()
     
     def generate_combined_report(self, application_data, kyc_reports, risk_analysis, output_path):
         """Generate comprehensive combined report"""
@@ -139,13 +156,7 @@ class ComprehensivePDFReportGenerator:
             "<b>CONFIDENTIAL</b><br/><br/>"
             "This report contains sensitive financial and personal information. "
             "It is intended solely for the use of the applicant and authorized financial institution personnel.",
-            ParagraphStyle(
-                name='Confidential',
-                parent=self.styles['BodyText'],
-                fontSize=9,
-                textColor=colors.gray,
-                alignment=1
-            )
+            paragraph_style('Confidential', 'BodyText', 9, colors.gray, alignment=1)
         )
         elements.append(confidential)
         
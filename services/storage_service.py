@@ -2,39 +2,74 @@
 
 import os
 import uuid
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from models import Document
 
+# New uploads of one submission are written to disk concurrently
+document_write_executor = ThreadPoolExecutor(max_workers=6, thread_name_prefix='document-write')
+
+def write_file(file_path, file_bytes):
+    """Write bytes to a new file"""
+    with open(file_path, 'wb') as output:
+        output.write(file_bytes)
+
 class StorageService:
     def generate_unique_app_id(self):
         """Generate a unique application ID"""
         return f"APP{uuid.uuid4().hex[:8].upper()}"
     
+    def find_stored_file(self, mobile_number, content_hash):
+        """Path of this applicant's already stored upload with these bytes, if it is still on disk"""
+        # Only reuse files under the same mobile number's uploads, never another applicant's
+        existing = Document.query.with_entities(Document.file_path).filter(
+            Document.content_hash == content_hash,
+            Document.file_path.startswith(f"uploads/{mobile_number}/", autoescape=True)
+        ).first()
+        if existing and os.path.exists(existing.file_path):
+            return existing.file_path
+        return None
+    
     def save_application_documents(self, mobile_number, app_id, files):
-        """Save application documents to the filesystem"""
+        """Save application documents to the filesystem, reusing stored files with identical content"""
         saved_docs = []
+        saved_paths = {}  # content hash -> path, for duplicates within this upload
+        pending_writes = []
         base_path = f"uploads/{mobile_number}/{app_id}"
         
         for doc_type, file in files.items():
             if file and file.filename:
-                # Create directory if it doesn't exist
-                os.makedirs(base_path, exist_ok=True)
+                file_bytes = file.read()
+                content_hash = hashlib.blake2b(file_bytes, digest_size=32).hexdigest()
+                file_path = saved_paths.get(content_hash) or self.find_stored_file(mobile_number, content_hash)
                 
-                # Generate unique filename
-                file_extension = os.path.splitext(file.filename)[1]
-                filename = f"{doc_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}{file_extension}"
-                file_path = os.path.join(base_path, filename)
-                
-                # Save file
-                file.save(file_path)
+                if file_path is None:
+                    # Create directory if it doesn't exist
+                    os.makedirs(base_path, exist_ok=True)
+                    
+                    # Generate unique filename
+                    file_extension = os.path.splitext(file.filename)[1]
+                    filename = f"{doc_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}{file_extension}"
+                    file_path = os.path.join(base_path, filename)
+                    
+                    # Save file on the write pool; all writes are awaited before returning
+                    pending_writes.append(document_write_executor.submit(write_file, file_path, file_bytes))
+                saved_paths[content_hash] = file_path
                 
                 # Create document record
                 doc = Document(
                     application_id=app_id,
                     document_type=doc_type,
                     file_path=file_path,
-                    original_filename=file.filename
+                    original_filename=file.filename,
+                    file_size=len(file_bytes),
+                    content_hash=content_hash
                 )
                 saved_docs.append(doc)
         
+        # Wait for every write, re-raising the first failure
+        for write in pending_writes:
+            write.result()
+        
         return saved_docs
\ No newline at end of file